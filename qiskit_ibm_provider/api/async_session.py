@@ -0,0 +1,299 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Asyncio session customized for IBM Quantum access."""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple, Union
+
+from qiskit.utils import LazyImportTester
+from urllib3.exceptions import ConnectTimeoutError, ProtocolError
+
+from .auth import QuantumAuth
+from .exceptions import RequestsApiError
+from .session import (
+    CLIENT_APPLICATION,
+    CUSTOM_HEADER_ENV_VAR,
+    STATUS_FORCELIST,
+    PostForcelistRetry,
+)
+
+HAS_AIOHTTP = LazyImportTester(
+    "aiohttp",
+    name="aiohttp",
+    install="pip install 'qiskit-ibm-provider[async]'",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """Response of a request sent through an :class:`AsyncRetrySession`.
+
+    The body of the response is read before the response is returned, so its
+    content can be accessed without awaiting.
+    """
+
+    def __init__(self, status_code: int, content: bytes, headers: Dict) -> None:
+        """AsyncResponse constructor.
+
+        Args:
+            status_code: HTTP status code.
+            content: Body of the response.
+            headers: Headers of the response.
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self) -> str:
+        """Return the body of the response, decoded as UTF-8."""
+        return self.content.decode("utf-8")
+
+    @property
+    def data(self) -> bytes:
+        """Return the body of the response, as expected by ``urllib3`` retries."""
+        return self.content
+
+    @property
+    def status(self) -> int:
+        """Return the status code, as expected by ``urllib3`` retries."""
+        return self.status_code
+
+    def get_redirect_location(self) -> bool:
+        """Return ``False``, redirects are followed by the transport."""
+        return False
+
+    def json(self, **kwargs: Any) -> Any:
+        """Return the body of the response, decoded as JSON.
+
+        Args:
+            **kwargs: Additional arguments passed to ``json.loads``.
+
+        Returns:
+            The decoded body.
+        """
+        return json.loads(self.content, **kwargs)
+
+
+class AsyncRetrySession:
+    """Asyncio counterpart of :class:`~qiskit_ibm_provider.api.session.RetrySession`.
+
+    Requests are sent with ``aiohttp`` and are retried with the same policy as
+    the synchronous session: ``POST`` requests are only retried when the
+    server answers with a status code in the force list.
+
+    The underlying ``aiohttp`` session is bound to the event loop it is
+    created in. It is created on the first request, and created again if the
+    session is later used from another event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        retries_total: int = 5,
+        retries_connect: int = 3,
+        backoff_factor: float = 0.5,
+        verify: bool = True,
+        proxies: Optional[Dict[str, str]] = None,
+        auth: Optional[QuantumAuth] = None,
+        timeout: Tuple[float, Union[float, None]] = (5.0, None),
+        limit: int = 100,
+    ) -> None:
+        """AsyncRetrySession constructor.
+
+        Args:
+            base_url: Base URL for the session's requests.
+            retries_total: Number of total retries for the requests.
+            retries_connect: Number of connect retries for the requests.
+            backoff_factor: Backoff factor between retry attempts.
+            verify: Whether to enable SSL verification.
+            proxies: Proxy URLs mapped by protocol.
+            auth: Authentication handler.
+            timeout: Timeout for the requests, in the form of (connection_timeout,
+                total_timeout).
+            limit: Maximum number of simultaneously open connections.
+
+        Raises:
+            MissingOptionalLibraryError: If ``aiohttp`` is not installed.
+        """
+        HAS_AIOHTTP.require_now("AsyncRetrySession")
+        self.base_url = base_url
+        self.verify = verify
+        self.proxies = proxies or {}
+        self.auth = auth
+        self.limit = limit
+        self._timeout = timeout
+        self._retry = PostForcelistRetry(
+            total=retries_total,
+            connect=retries_connect,
+            backoff_factor=backoff_factor,
+            status_forcelist=STATUS_FORCELIST,
+        )
+        client_app_header = CLIENT_APPLICATION
+        if custom_header := os.getenv(CUSTOM_HEADER_ENV_VAR):
+            client_app_header += f"/{custom_header}"
+        self.headers = {"X-Qx-Client-Application": client_app_header}
+        self._session = None  # type: Any
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> Any:
+        """Return the ``aiohttp`` session of the running event loop."""
+        import aiohttp  # pylint: disable=import-error
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit)
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying ``aiohttp`` session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(
+        self, method: str, url: str, bare: bool = False, **kwargs: Any
+    ) -> AsyncResponse:
+        """Send a request and read its response.
+
+        If `bare` is not specified, prepend the base URL to the input `url`
+        and authenticate the request.
+
+        Args:
+            method: Method for the new request (e.g. ``POST``).
+            url: URL for the new request.
+            bare: If ``True``, do not send IBM Quantum specific information
+                (such as access token) in the request or modify the input `url`.
+            **kwargs: Additional arguments for ``aiohttp.ClientSession.request``.
+
+        Returns:
+            Response object.
+
+        Raises:
+            RequestsApiError: If the request failed.
+        """
+        import aiohttp  # pylint: disable=import-error
+
+        session = self._get_session()
+        headers = dict(self.headers)
+        headers.update(kwargs.pop("headers", {}))
+        if bare:
+            final_url = url
+        else:
+            final_url = self.base_url + url
+            if self.auth is not None:
+                headers.update(self.auth.get_headers())
+
+        if self.proxies:
+            kwargs.setdefault(
+                "proxy", self.proxies.get("https") or self.proxies.get("http")
+            )
+        elif "timeout" not in kwargs:
+            # Add a timeout to the connection for non-proxy connections.
+            kwargs["timeout"] = aiohttp.ClientTimeout(
+                sock_connect=self._timeout[0], total=self._timeout[1]
+            )
+        if not self.verify:
+            kwargs["ssl"] = False
+
+        retry = self._retry
+        while True:
+            try:
+                async with session.request(
+                    method, final_url, headers=headers, **kwargs
+                ) as raw_response:
+                    response = AsyncResponse(
+                        raw_response.status,
+                        await raw_response.read(),
+                        dict(raw_response.headers),
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                if isinstance(ex, aiohttp.ClientConnectorError):
+                    error: Exception = ConnectTimeoutError(str(ex))
+                else:
+                    error = ProtocolError(str(ex))
+                try:
+                    retry = retry.increment(method=method, url=final_url, error=error)
+                except Exception:  # pylint: disable=broad-except
+                    raise RequestsApiError(str(ex)) from ex
+                await asyncio.sleep(retry.get_backoff_time())
+                continue
+
+            if response.status_code < 400:
+                return response
+            if retry.is_retry(method, response.status_code):
+                try:
+                    retry = retry.increment(
+                        method=method, url=final_url, response=response
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    pass
+                else:
+                    await asyncio.sleep(retry.get_backoff_time())
+                    continue
+            raise RequestsApiError(
+                self._error_message(method, final_url, response),
+                response.status_code,
+            )
+
+    @staticmethod
+    def _error_message(method: str, url: str, response: AsyncResponse) -> str:
+        """Return the message of the error raised for a failed request.
+
+        Args:
+            method: Method of the request.
+            url: URL of the request.
+            response: Response of the request.
+
+        Returns:
+            The error message.
+        """
+        message = f"{response.status_code} Error for {method.upper()} url: {url}"
+        try:
+            error_json = response.json()["error"]
+            message += f'. {error_json["message"]}, Error code: {error_json["code"]}.'
+        except Exception:  # pylint: disable=broad-except
+            # the response did not contain the expected json.
+            message += f". {response.text}"
+        return message
+
+    async def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a ``GET`` request.
+
+        Args:
+            url: URL for the new request.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            Response object.
+        """
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a ``POST`` request.
+
+        Args:
+            url: URL for the new request.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            Response object.
+        """
+        return await self.request("POST", url, **kwargs)
@@ -16,6 +16,8 @@ from .account import AccountClient
 from .auth import AuthClient
 from .base import BaseClient, WebsocketClientCloseCode
 from .runtime import RuntimeClient
+from .runtime_async import AsyncRuntimeClient
 from .version import VersionClient
 from .websocket import WebsocketClient
 from .runtime_ws import RuntimeWebsocketClient
+from .websocket_pool import WebsocketConnectionPool
@@ -19,7 +19,7 @@ from typing import List, Dict, Any, Optional
 from .base import BaseClient
 from ..client_parameters import ClientParameters
 from ..rest import Api
-from ..session import RetrySession
+from ..session import RetrySession, SessionRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -27,15 +27,25 @@ logger = logging.getLogger(__name__)
 class AccountClient(BaseClient):
     """Client for accessing an individual IBM Quantum account."""
 
-    def __init__(self, params: ClientParameters) -> None:
+    def __init__(
+        self,
+        params: ClientParameters,
+        session_registry: Optional[SessionRegistry] = None,
+    ) -> None:
         """AccountClient constructor.
 
         Args:
             params: Parameters used for server connection.
+            session_registry: Registry providing a session shared with other
+                clients. If ``None``, the client uses its own session.
         """
-        self._session = RetrySession(
-            params.url, auth=params.get_auth_handler(), **params.connection_parameters()
-        )
+        if session_registry:
+            self._session = session_registry.get(params)
+        else:
+            connection_parameters = params.connection_parameters()
+            self._session = RetrySession(
+                params.url, auth=params.get_auth_handler(), **connection_parameters
+            )
         self._params = params
         self.base_api = Api(self._session)
 
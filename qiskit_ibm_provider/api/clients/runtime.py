@@ -20,7 +20,7 @@ from requests import Response
 from .base import BaseClient
 from ..rest.runtime import Runtime
 from ..client_parameters import ClientParameters
-from ..session import RetrySession
+from ..session import RetrySession, SessionRegistry
 from ...utils.hgp import from_instance_format
 
 logger = logging.getLogger(__name__)
@@ -32,15 +32,22 @@ class RuntimeClient(BaseClient):
     def __init__(
         self,
         params: ClientParameters,
+        session_registry: Optional[SessionRegistry] = None,
     ) -> None:
         """RuntimeClient constructor.
 
         Args:
             params: Connection parameters.
+            session_registry: Registry providing a session shared with other
+                clients. If ``None``, the client uses its own session.
         """
-        self._session = RetrySession(
-            params.url, auth=params.get_auth_handler(), **params.connection_parameters()
-        )
+        if session_registry:
+            self._session = session_registry.get(params)
+        else:
+            connection_parameters = params.connection_parameters()
+            self._session = RetrySession(
+                params.url, auth=params.get_auth_handler(), **connection_parameters
+            )
         self._api = Runtime(self._session)
 
     def list_backends(self, hgp: str) -> List[str]:
@@ -0,0 +1,166 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Asyncio client for accessing IBM Quantum runtime service."""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..async_session import AsyncRetrySession
+from ..client_parameters import ClientParameters
+from ..rest.runtime import program_run_payload
+from ...utils import RuntimeDecoder, RuntimeEncoder
+from ...utils.hgp import from_instance_format
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRuntimeClient:
+    """Asyncio client for accessing runtime service.
+
+    This client offers awaitable counterparts of the
+    :class:`~qiskit_ibm_provider.api.clients.RuntimeClient` methods used to
+    submit jobs and to retrieve their status and results. A single event loop
+    can drive many concurrent requests without a thread per request.
+
+    Requires ``aiohttp``, installed with ``pip install 'qiskit-ibm-provider[async]'``.
+    """
+
+    def __init__(self, params: ClientParameters, limit: int = 100) -> None:
+        """AsyncRuntimeClient constructor.
+
+        Args:
+            params: Connection parameters.
+            limit: Maximum number of simultaneously open connections.
+        """
+        proxies = params.proxies.urls if params.proxies else None
+        self._session = AsyncRetrySession(
+            params.url,
+            verify=params.verify,
+            proxies=proxies,
+            auth=params.get_auth_handler(),
+            limit=limit,
+        )
+
+    async def close(self) -> None:
+        """Close the connections of this client."""
+        await self._session.close()
+
+    async def program_run(
+        self,
+        program_id: str,
+        backend_name: Optional[str],
+        params: Dict,
+        image: Optional[str] = None,
+        hgp: Optional[str] = None,
+        log_level: Optional[str] = None,
+        session_id: Optional[str] = None,
+        job_tags: Optional[List[str]] = None,
+        max_execution_time: Optional[int] = None,
+        start_session: Optional[bool] = False,
+    ) -> Dict:
+        """Run the specified program.
+
+        Args:
+            program_id: Program ID.
+            backend_name: Name of the backend to run the program.
+            params: Parameters to use.
+            image: The runtime image to use.
+            hgp: Hub/group/project to use.
+            log_level: Log level to use.
+            session_id: Job ID of the first job in a runtime session.
+            job_tags: Tags to be assigned to the job.
+            max_execution_time: Maximum execution time in seconds.
+            start_session: Set to True to explicitly start a runtime session. Defaults to False.
+
+        Returns:
+            JSON response.
+        """
+        hgp_dict = {}
+        if hgp:
+            hub, group, project = from_instance_format(hgp)
+            hgp_dict = {"hub": hub, "group": group, "project": project}
+        payload = program_run_payload(
+            program_id=program_id,
+            backend_name=backend_name,
+            params=params,
+            image=image,
+            log_level=log_level,
+            session_id=session_id,
+            job_tags=job_tags,
+            max_execution_time=max_execution_time,
+            start_session=start_session,
+            **hgp_dict,
+        )
+        response = await self._session.post(
+            "/jobs", data=json.dumps(payload, cls=RuntimeEncoder)
+        )
+        return response.json()
+
+    async def job_get(self, job_id: str) -> Dict:
+        """Get job data.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            JSON response.
+        """
+        response = await self._session.get(f"/jobs/{job_id}")
+        job_data = response.json(cls=RuntimeDecoder)
+        logger.debug("Runtime job get response: %s", job_data)
+        return job_data
+
+    async def job_type(self, job_id: str) -> str:
+        """Get job type.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            Job type, either "IQX" or "RUNTIME".
+        """
+        response = await self._session.get(f"/facade/v1/jobs/{job_id}/type")
+        return response.json()["type"]
+
+    async def job_results(self, job_id: str) -> str:
+        """Get the results of a program job.
+
+        Args:
+            job_id: Program job ID.
+
+        Returns:
+            Job result.
+        """
+        response = await self._session.get(f"/jobs/{job_id}/results")
+        return response.text
+
+    async def job_cancel(self, job_id: str) -> None:
+        """Cancel a job.
+
+        Args:
+            job_id: Runtime job ID.
+        """
+        await self._session.post(f"/jobs/{job_id}/cancel")
+
+    async def download(self, url: str) -> Any:
+        """Download data from an external URL.
+
+        Args:
+            url: URL of the data.
+
+        Returns:
+            Content of the response.
+        """
+        response = await self._session.get(url, bare=True)
+        return response.content
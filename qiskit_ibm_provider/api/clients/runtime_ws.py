@@ -52,7 +52,7 @@ class RuntimeWebsocketClient(BaseWebsocketClient):
         if not self._authenticated:
             self._authenticated = True  # First message is an ACK
         else:
-            self._message_queue.put_nowait(message)
+            self._message_queue.put(message)
             self._current_retry = 0
 
     def job_results(self, max_retries: int = 5, backoff_factor: float = 0.5) -> None:
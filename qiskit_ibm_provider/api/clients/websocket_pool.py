@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Bounded pool of websocket connections used to stream job results."""
+
+import logging
+import threading
+from concurrent import futures
+from queue import Queue
+from typing import Dict, Optional, Tuple
+
+from .base import WebsocketClientCloseCode
+from .runtime_ws import RuntimeWebsocketClient
+from ..client_parameters import ClientParameters
+from ...utils.utils import RefreshQueue
+
+logger = logging.getLogger(__name__)
+
+
+class WebsocketConnectionPool:
+    """Bounded pool of websocket connections used to stream job results.
+
+    The runtime API streams the results of each job through its own websocket
+    endpoint, so every stream needs a dedicated connection. This pool caps the
+    number of connections, and of the threads serving them, shared by all the
+    jobs of a provider. Messages received for a job are routed to the queue
+    supplied by that job. If that queue is a :class:`RefreshQueue` and is full,
+    its oldest message is dropped.
+
+    When all connections are in use, :meth:`stream` does not open a new one and
+    the caller is expected to fall back to status polling.
+    """
+
+    def __init__(self, max_connections: int = 16) -> None:
+        """WebsocketConnectionPool constructor.
+
+        Args:
+            max_connections: Maximum number of concurrently open connections.
+        """
+        self._max_connections = max_connections
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max(max_connections, 1),
+            thread_name_prefix="ibm-websocket-pool",
+        )
+        self._lock = threading.Lock()
+        self._clients: Dict[str, RuntimeWebsocketClient] = {}
+        self._queues: Dict[str, Queue] = {}
+        self._discarded_at_start: Dict[str, int] = {}
+        self._peak_connections = 0
+        self._total_connections = 0
+        self._rejected_streams = 0
+        self._dropped_messages = 0
+
+    @property
+    def max_connections(self) -> int:
+        """Return the maximum number of concurrently open connections."""
+        return self._max_connections
+
+    def stream(
+        self,
+        websocket_url: str,
+        client_params: ClientParameters,
+        job_id: str,
+        message_queue: Queue,
+    ) -> Optional[Tuple[RuntimeWebsocketClient, futures.Future]]:
+        """Start streaming the results of a job, if a connection is available.
+
+        Args:
+            websocket_url: URL for websocket communication with IBM Quantum.
+            client_params: Parameters used for server connection.
+            job_id: Job ID.
+            message_queue: Queue that receives the messages streamed for the job.
+
+        Returns:
+            The websocket client and the future of the stream, or ``None`` if all
+            connections are in use or the job is already being streamed.
+        """
+        with self._lock:
+            if job_id in self._clients or len(self._clients) >= self._max_connections:
+                self._rejected_streams += 1
+                return None
+            client = RuntimeWebsocketClient(
+                websocket_url=websocket_url,
+                client_params=client_params,
+                job_id=job_id,
+                message_queue=message_queue,
+            )
+            self._clients[job_id] = client
+            self._queues[job_id] = message_queue
+            self._discarded_at_start[job_id] = self._discarded(message_queue)
+            self._total_connections += 1
+            self._peak_connections = max(self._peak_connections, len(self._clients))
+        return client, self._executor.submit(self._run, job_id, client)
+
+    def disconnect(
+        self,
+        job_id: str,
+        close_code: WebsocketClientCloseCode = WebsocketClientCloseCode.NORMAL,
+    ) -> None:
+        """Close the connection used by a job, if any.
+
+        Args:
+            job_id: Job ID.
+            close_code: Disconnect status code.
+        """
+        with self._lock:
+            client = self._clients.get(job_id)
+        if client is not None:
+            client.disconnect(close_code)
+
+    def metrics(self) -> Dict[str, int]:
+        """Return connection and back-pressure metrics of this pool.
+
+        Returns:
+            A dictionary with the following keys:
+
+                * active_connections: Number of currently open connections.
+                * peak_connections: Highest number of concurrently open connections.
+                * total_connections: Number of connections opened so far.
+                * rejected_streams: Number of streams refused because all
+                  connections were in use.
+                * queued_messages: Number of received messages not yet consumed
+                  from the job queues.
+                * dropped_messages: Number of received messages dropped because
+                  the queue of their job was full.
+        """
+        with self._lock:
+            return {
+                "active_connections": len(self._clients),
+                "peak_connections": self._peak_connections,
+                "total_connections": self._total_connections,
+                "rejected_streams": self._rejected_streams,
+                "queued_messages": sum(
+                    message_queue.qsize() for message_queue in self._queues.values()
+                ),
+                "dropped_messages": self._dropped_messages
+                + sum(
+                    self._discarded(message_queue) - self._discarded_at_start[job_id]
+                    for job_id, message_queue in self._queues.items()
+                ),
+            }
+
+    def _run(self, job_id: str, client: RuntimeWebsocketClient) -> None:
+        """Stream the results of a job and release its connection afterwards.
+
+        Args:
+            job_id: Job ID.
+            client: Websocket client of the job.
+        """
+        try:
+            client.job_results()
+        finally:
+            with self._lock:
+                self._clients.pop(job_id, None)
+                message_queue = self._queues.pop(job_id)
+                self._dropped_messages += self._discarded(
+                    message_queue
+                ) - self._discarded_at_start.pop(job_id)
+
+    @staticmethod
+    def _discarded(message_queue: Queue) -> int:
+        """Return the number of messages a job queue has dropped so far.
+
+        Args:
+            message_queue: Queue of the job.
+
+        Returns:
+            The number of dropped messages.
+        """
+        if isinstance(message_queue, RefreshQueue):
+            return message_queue.discarded
+        return 0
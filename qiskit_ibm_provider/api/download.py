@@ -0,0 +1,180 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Resumable download of external data."""
+
+import io
+import logging
+import re
+from typing import Any, Optional
+
+import requests
+from requests.exceptions import RequestException
+from urllib3.exceptions import HTTPError
+
+from .exceptions import RequestsApiError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_TIMEOUT = 60.0
+"""Default number of seconds to wait for data from the server."""
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+class RangeDownload(io.RawIOBase):
+    """Readable binary stream of the content of a URL.
+
+    The content is read from the HTTP response as it arrives, instead of being
+    loaded into memory at once. If the connection is interrupted, the download
+    is resumed from the last byte read with a ``Range`` request.
+
+    Wrap it in an ``io.BufferedReader`` to read it in chunks of any size.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_resumes: int = 5,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """RangeDownload constructor.
+
+        Args:
+            url: URL of the content. No authentication is sent with the requests.
+            timeout: Number of seconds to wait for the server to send data.
+            max_resumes: Maximum number of times the download is resumed
+                after an interruption.
+            session: Session used to send the requests. A new one is used if
+                not specified.
+        """
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.max_resumes = max_resumes
+        self._session = session or requests.Session()
+        self._owns_session = session is None
+        self._response: Optional[requests.Response] = None
+        self._position = 0
+        self._length: Optional[int] = None
+        self._resumes = 0
+
+    def readable(self) -> bool:
+        """Return ``True``, the stream is readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into a pre-allocated buffer.
+
+        Args:
+            buffer: Writable buffer.
+
+        Returns:
+            Number of bytes read, or 0 at the end of the content.
+
+        Raises:
+            RequestsApiError: If the content could not be downloaded.
+        """
+        while True:
+            try:
+                if self._response is None:
+                    self._open()
+                data = self._response.raw.read(len(buffer))
+            except (RequestException, HTTPError) as err:
+                self._resume(err)
+                continue
+            if not data:
+                if self._length is not None and self._position < self._length:
+                    self._resume(None)
+                    continue
+                return 0
+            size = len(data)
+            buffer[:size] = data
+            self._position += size
+            return size
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+        if self._owns_session:
+            self._session.close()
+        super().close()
+
+    def _open(self) -> None:
+        """Send the request for the content not read yet.
+
+        Raises:
+            RequestsApiError: If the server responded with an error.
+        """
+        # Ranges refer to the encoded content, so it must not be compressed.
+        headers = {"Accept-Encoding": "identity"}
+        if self._position:
+            headers["Range"] = f"bytes={self._position}-"
+        response = self._session.get(
+            self.url, headers=headers, stream=True, timeout=self.timeout
+        )
+        try:
+            response.raise_for_status()
+        except RequestException as err:
+            response.close()
+            raise RequestsApiError(
+                f"Unable to download {self.url}: {err}", response.status_code
+            ) from err
+
+        start = 0
+        if response.status_code == 206:
+            match = _CONTENT_RANGE_PATTERN.match(
+                response.headers.get("Content-Range", "")
+            )
+            if match:
+                start = int(match.group(1))
+                if match.group(2) != "*":
+                    self._length = int(match.group(2))
+        elif "Content-Length" in response.headers:
+            self._length = int(response.headers["Content-Length"])
+        self._response = response
+        # Skip the content already read if the server ignored the range.
+        to_skip = self._position - start
+        while to_skip > 0:
+            skipped = len(response.raw.read(min(to_skip, io.DEFAULT_BUFFER_SIZE)))
+            if not skipped:
+                raise RequestsApiError(f"Unable to resume the download of {self.url}.")
+            to_skip -= skipped
+
+    def _resume(self, error: Optional[Exception]) -> None:
+        """Prepare to resume the download after an interruption.
+
+        Args:
+            error: Error that interrupted the download, if any.
+
+        Raises:
+            RequestsApiError: If the download cannot be resumed anymore.
+        """
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+        self._resumes += 1
+        reason = error or "connection closed before the end of the content"
+        if self._resumes > self.max_resumes:
+            raise RequestsApiError(
+                f"Unable to download {self.url} after {self.max_resumes} "
+                f"resumed attempts: {reason}"
+            ) from error
+        logger.debug(
+            "Download of %s interrupted after %s bytes, resuming: %s",
+            self.url,
+            self._position,
+            reason,
+        )
@@ -90,31 +90,22 @@ class Runtime(RestAdapterBase):
         Returns:
             JSON response.
         """
-        url = self.get_url("jobs")
-        payload: Dict[str, Any] = {
-            "program_id": program_id,
-            "params": params,
-        }
-        if image:
-            payload["runtime"] = image
-        if log_level:
-            payload["log_level"] = log_level
-        if backend_name:
-            payload["backend"] = backend_name
-        if session_id:
-            payload["session_id"] = session_id
-        if job_tags:
-            payload["tags"] = job_tags
-        if max_execution_time:
-            payload["cost"] = max_execution_time
-        if start_session:
-            payload["start_session"] = start_session
-        if all([hub, group, project]):
-            payload["hub"] = hub
-            payload["group"] = group
-            payload["project"] = project
+        payload = program_run_payload(
+            program_id=program_id,
+            backend_name=backend_name,
+            params=params,
+            image=image,
+            hub=hub,
+            group=group,
+            project=project,
+            log_level=log_level,
+            session_id=session_id,
+            job_tags=job_tags,
+            max_execution_time=max_execution_time,
+            start_session=start_session,
+        )
         data = json.dumps(payload, cls=RuntimeEncoder)
-        return self.session.post(url, data=data).json()
+        return self.session.post(self.get_url("jobs"), data=data).json()
 
     def jobs_get(
         self,
@@ -182,3 +173,61 @@ class Runtime(RestAdapterBase):
         if all([hub, group, project]):
             payload["provider"] = f"{hub}/{group}/{project}"
         return self.session.get(url, params=payload).json()
+
+
+def program_run_payload(
+    program_id: str,
+    backend_name: Optional[str],
+    params: Dict,
+    image: Optional[str] = None,
+    hub: Optional[str] = None,
+    group: Optional[str] = None,
+    project: Optional[str] = None,
+    log_level: Optional[str] = None,
+    session_id: Optional[str] = None,
+    job_tags: Optional[List[str]] = None,
+    max_execution_time: Optional[int] = None,
+    start_session: Optional[bool] = False,
+) -> Dict[str, Any]:
+    """Return the payload of a request running a program.
+
+    Args:
+        program_id: Program ID.
+        backend_name: Name of the backend.
+        params: Program parameters.
+        image: Runtime image.
+        hub: Hub to be used.
+        group: Group to be used.
+        project: Project to be used.
+        log_level: Log level to use.
+        session_id: ID of the first job in a runtime session.
+        job_tags: Tags to be assigned to the job.
+        max_execution_time: Maximum execution time in seconds.
+        start_session: Set to True to explicitly start a runtime session. Defaults to False.
+
+    Returns:
+        The request payload.
+    """
+    payload: Dict[str, Any] = {
+        "program_id": program_id,
+        "params": params,
+    }
+    if image:
+        payload["runtime"] = image
+    if log_level:
+        payload["log_level"] = log_level
+    if backend_name:
+        payload["backend"] = backend_name
+    if session_id:
+        payload["session_id"] = session_id
+    if job_tags:
+        payload["tags"] = job_tags
+    if max_execution_time:
+        payload["cost"] = max_execution_time
+    if start_session:
+        payload["start_session"] = start_session
+    if all([hub, group, project]):
+        payload["hub"] = hub
+        payload["group"] = group
+        payload["project"] = project
+    return payload
@@ -15,15 +15,20 @@
 import os
 import re
 import logging
+import threading
+import time
+from collections import defaultdict
 from typing import Dict, Optional, Any, Tuple, Union
+from urllib.parse import urlparse
 import pkg_resources
 
 from requests import Session, RequestException, Response
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests.auth import AuthBase
 from urllib3.util.retry import Retry
 
 from qiskit_ibm_provider.utils.utils import filter_data
+from .client_parameters import ClientParameters
 from .exceptions import RequestsApiError
 from ..version import __version__ as ibm_provider_version
 
@@ -145,6 +150,9 @@ class RetrySession(Session):
         proxies: Optional[Dict[str, str]] = None,
         auth: Optional[AuthBase] = None,
         timeout: Tuple[float, Union[float, None]] = (5.0, None),
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        registry: Optional["SessionRegistry"] = None,
     ) -> None:
         """RetrySession constructor.
 
@@ -158,12 +166,23 @@ class RetrySession(Session):
             auth: Authentication handler.
             timeout: Timeout for the requests, in the form of (connection_timeout,
                 total_timeout).
+            pool_connections: Number of host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept in each pool.
+            registry: Registry the session belongs to, which records the
+                latency of its requests.
         """
         super().__init__()
 
         self.base_url = base_url
-
-        self._initialize_retry(retries_total, retries_connect, backoff_factor)
+        self._registry = registry
+
+        self._initialize_retry(
+            retries_total,
+            retries_connect,
+            backoff_factor,
+            pool_connections,
+            pool_maxsize,
+        )
         self._initialize_session_parameters(verify, proxies or {}, auth)
         self._timeout = timeout
 
@@ -176,7 +195,12 @@ class RetrySession(Session):
             pass
 
     def _initialize_retry(
-        self, retries_total: int, retries_connect: int, backoff_factor: float
+        self,
+        retries_total: int,
+        retries_connect: int,
+        backoff_factor: float,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
     ) -> None:
         """Set the session retry policy.
 
@@ -184,6 +208,8 @@ class RetrySession(Session):
             retries_total: Number of total retries for the requests.
             retries_connect: Number of connect retries for the requests.
             backoff_factor: Backoff factor between retry attempts.
+            pool_connections: Number of host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept in each pool.
         """
         retry = PostForcelistRetry(
             total=retries_total,
@@ -192,7 +218,11 @@ class RetrySession(Session):
             status_forcelist=STATUS_FORCELIST,
         )
 
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        retry_adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
         self.mount("http://", retry_adapter)
         self.mount("https://", retry_adapter)
 
@@ -255,10 +285,13 @@ class RetrySession(Session):
         headers = self.headers.copy()
         headers.update(kwargs.pop("headers", {}))
 
+        start = time.perf_counter()
+        failed = True
         try:
             self._log_request_info(final_url, method, kwargs)
             response = super().request(method, final_url, headers=headers, **kwargs)
             response.raise_for_status()
+            failed = False
         except RequestException as ex:
             # Wrap the requests exceptions into a IBM Q custom one, for
             # compatibility.
@@ -278,6 +311,11 @@ class RetrySession(Session):
                     message += f". {ex.response.text}"
 
             raise RequestsApiError(message, status_code) from ex
+        finally:
+            if self._registry is not None:
+                self._registry._record_request(
+                    final_url, time.perf_counter() - start, failed
+                )
 
         return response
 
@@ -360,4 +398,116 @@ class RetrySession(Session):
         """Overwrite Session's getstate to include all attributes."""
         state = super().__getstate__()  # type: ignore
         state.update(self.__dict__)
+        # The registry belongs to the provider of the current process.
+        state["_registry"] = None
         return state
+
+
+class SessionRegistry:
+    """Registry of sessions shared by the clients of a provider.
+
+    Clients that connect to the same base URL with the same credentials and
+    connection settings share a single :class:`RetrySession`, and therefore its
+    pools of connections. This avoids a new TLS handshake for each client, for
+    example for each backend or hub/group/project of an account.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+    ) -> None:
+        """SessionRegistry constructor.
+
+        Args:
+            pool_connections: Number of host connection pools cached by each session.
+            pool_maxsize: Maximum number of connections kept in each pool. Raise it
+                to the number of threads that send requests concurrently.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple, RetrySession] = {}
+        self._request_stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "errors": 0, "total_time": 0.0}
+        )
+
+    def get(self, params: ClientParameters) -> RetrySession:
+        """Return the session to use for a set of client parameters.
+
+        Args:
+            params: Parameters used for server connection.
+
+        Returns:
+            A session shared by all the clients using the same parameters.
+        """
+        key = (params.url, params.token, params.verify, repr(params.proxies))
+        with self._lock:
+            if key not in self._sessions:
+                connection_parameters = params.connection_parameters()
+                connection_parameters.setdefault("auth", params.get_auth_handler())
+                self._sessions[key] = RetrySession(
+                    params.url,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    registry=self,
+                    **connection_parameters,
+                )
+            return self._sessions[key]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return connection and latency statistics, per host.
+
+        Returns:
+            A dictionary keyed by host, whose values contain the following keys:
+
+                * requests: Number of requests sent.
+                * errors: Number of failed requests.
+                * total_time: Total time spent on the requests, in seconds.
+                * mean_latency: Mean duration of a request, in seconds.
+                * connections: Number of connections opened.
+        """
+        with self._lock:
+            stats = {host: dict(values) for host, values in self._request_stats.items()}
+            sessions = list(self._sessions.values())
+        for host_stats in stats.values():
+            host_stats["mean_latency"] = host_stats["total_time"] / max(
+                host_stats["requests"], 1
+            )
+            host_stats["connections"] = 0
+        # The same adapter is mounted for several URL prefixes.
+        adapters = {
+            id(adapter): adapter
+            for session in sessions
+            for adapter in session.adapters.values()
+        }
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is not None and pool.host in stats:
+                    stats[pool.host]["connections"] += pool.num_connections
+        return stats
+
+    def close(self) -> None:
+        """Close all the sessions of this registry."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _record_request(self, url: str, elapsed: float, failed: bool) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            url: URL of the request.
+            elapsed: Duration of the request, in seconds.
+            failed: Whether the request failed.
+        """
+        host = urlparse(url).hostname or ""
+        with self._lock:
+            host_stats = self._request_stats[host]
+            host_stats["requests"] += 1
+            host_stats["errors"] += int(failed)
+            host_stats["total_time"] += elapsed
@@ -44,7 +44,9 @@ class HubGroupProject:
             instance: Hub/group/project.
         """
         self._client_params = client_params
-        self._api_client = AccountClient(client_params)
+        self._api_client = AccountClient(
+            client_params, session_registry=provider._session_registry
+        )
         self._provider = provider
         # Initialize the internal list of backends.
         self._backends: Dict[str, "ibm_backend.IBMBackend"] = {}
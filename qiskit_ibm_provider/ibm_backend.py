@@ -12,14 +12,18 @@
 
 """Module for interfacing with an IBM Quantum Backend."""
 
+import asyncio
 import copy
+import functools
 import logging
+import time
 import warnings
+from concurrent import futures
 from dataclasses import asdict
 from datetime import datetime as python_datetime
-from typing import Iterable, Dict, List, Union, Optional, Any
+from typing import Iterable, Dict, List, Union, Optional, Any, Tuple
 
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import ControlFlowOp, QuantumCircuit
 from qiskit.providers.backend import BackendV2 as Backend
 from qiskit.providers.models import (
     BackendStatus,
@@ -56,9 +60,19 @@ from .job import IBMJob, IBMCircuitJob
 from .transpiler.passes.basis.convert_id_to_delay import (
     ConvertIdToDelay,
 )
-from .utils import validate_job_tags, are_circuits_dynamic
+from .utils import (
+    CircuitEncodingTimes,
+    EncodedCircuitCache,
+    are_circuits_dynamic,
+    encode_circuits,
+    validate_job_tags,
+)
 from .utils.options import QASM2Options, QASM3Options
 from .utils.converters import local_to_utc
+from .utils.backend_cache import BackendDataCache
+from .utils.faulty_index import FaultyIndex
+from .utils.properties_delta import patch_properties, patch_target, properties_delta
+from .utils.properties_history import PropertiesArrays, PropertiesHistory
 from .utils.json_decoder import (
     defaults_from_server_data,
     properties_from_server_data,
@@ -213,6 +227,13 @@ class IBMBackend(Backend):
         self._properties = None
         self._defaults = None
         self._target = None
+        self._backend_cache: Optional[BackendDataCache] = None
+        self._circuit_cache: Optional[EncodedCircuitCache] = None
+        self._faulty_index: Optional[FaultyIndex] = None
+        self._raw_properties: Optional[Dict] = None
+        self._properties_history: Optional[PropertiesHistory] = None
+        self._status_ttl = 0.0
+        self._cached_status: Optional[Tuple[float, BackendStatus]] = None
         self._max_circuits = configuration.max_experiments
         if not self._configuration.simulator:
             self.options.set_validator("noise_model", type(None))
@@ -262,17 +283,54 @@ class IBMBackend(Backend):
 
         if datetime or refresh or self._target is None:
             client = getattr(self.provider, "_runtime_client")
-            api_properties = client.backend_properties(self.name, datetime=datetime)
-            api_pulse_defaults = client.backend_pulse_defaults(self.name)
-            target = target_from_server_data(
-                configuration=self._configuration,
-                pulse_defaults=api_pulse_defaults,
-                properties=api_properties,
-            )
+
+            def fetch() -> Dict[str, Any]:
+                # The pulse defaults are downloaded while the properties are.
+                with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                    pulse_defaults = executor.submit(
+                        client.backend_pulse_defaults, self.name
+                    )
+                    properties = client.backend_properties(self.name, datetime=datetime)
+                    return {
+                        "properties": properties,
+                        "pulse_defaults": pulse_defaults.result(),
+                    }
+
+            def decode(raw_data: Dict[str, Any]) -> Target:
+                return target_from_server_data(
+                    configuration=self._configuration,
+                    pulse_defaults=raw_data["pulse_defaults"],
+                    properties=raw_data["properties"],
+                )
+
+            if datetime and self._properties_history:
+                # Only the properties depend on the date.
+                properties = self._properties_history.get(
+                    self.name, datetime, self._fetch_properties
+                )
+                return target_from_server_data(
+                    configuration=self._configuration,
+                    pulse_defaults=client.backend_pulse_defaults(self.name),
+                    properties=properties,
+                )
             if datetime:
                 # Don't cache result.
-                return target
-            self._target = target
+                return decode(fetch())
+            if self._backend_cache:
+                self._target = self._backend_cache.get(
+                    "target",
+                    self.name,
+                    self._instance,
+                    fetch,
+                    decode,
+                    validator=lambda raw_data: "/".join(
+                        BackendDataCache.raw_data_validator(raw_data[key])
+                        for key in ("properties", "pulse_defaults")
+                    ),
+                    refresh=refresh,
+                )
+            else:
+                self._target = decode(fetch())
         return self._target
 
     @classmethod
@@ -429,6 +487,114 @@ class IBMBackend(Backend):
                 - If ESP readout is used and the backend does not support this.
         """
         # pylint: disable=arguments-differ
+        return self._runtime_run(
+            **self._prepare_run(
+                circuits,
+                dynamic=dynamic,
+                job_tags=job_tags,
+                init_circuit=init_circuit,
+                init_num_resets=init_num_resets,
+                header=header,
+                shots=shots,
+                memory=memory,
+                qubit_lo_freq=qubit_lo_freq,
+                meas_lo_freq=meas_lo_freq,
+                schedule_los=schedule_los,
+                meas_level=meas_level,
+                meas_return=meas_return,
+                rep_delay=rep_delay,
+                init_qubits=init_qubits,
+                use_measure_esp=use_measure_esp,
+                noise_model=noise_model,
+                seed_simulator=seed_simulator,
+                **run_config,
+            )
+        )
+
+    async def arun(
+        self,
+        circuits: Union[
+            QuantumCircuit, Schedule, str, List[Union[QuantumCircuit, Schedule, str]]
+        ],
+        **kwargs: Any,
+    ) -> IBMCircuitJob:
+        """Asynchronously run on the backend.
+
+        This is the awaitable counterpart of :meth:`run`. The job is submitted
+        without blocking the event loop, and the returned job can be awaited
+        with :meth:`~qiskit_ibm_provider.job.IBMCircuitJob.await_final_state`
+        and :meth:`~qiskit_ibm_provider.job.IBMCircuitJob.aresult`.
+
+        Requires ``aiohttp``, installed with ``pip install 'qiskit-ibm-provider[async]'``.
+
+        Args:
+            circuits: An individual or a list of
+                :class:`~qiskit.circuits.QuantumCircuit`.
+            **kwargs: The other arguments of :meth:`run`.
+
+        Returns:
+            The job to be executed.
+
+        Raises:
+            IBMBackendApiError: If an unexpected error occurred while submitting
+                the job.
+            IBMBackendApiProtocolError: If an unexpected value received from
+                 the server.
+            IBMBackendValueError: If an input parameter value is not valid.
+        """
+        # The validation queries the backend status and may process large
+        # circuits, so it doesn't run on the event loop.
+        prepared = await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._prepare_run, circuits, **kwargs)
+        )
+        return await self._aruntime_run(**prepared)
+
+    def _prepare_run(
+        self,
+        circuits: Union[
+            QuantumCircuit, Schedule, str, List[Union[QuantumCircuit, Schedule, str]]
+        ],
+        dynamic: bool = None,
+        job_tags: Optional[List[str]] = None,
+        init_circuit: Optional[QuantumCircuit] = None,
+        init_num_resets: Optional[int] = None,
+        header: Optional[Dict] = None,
+        shots: Optional[Union[int, float]] = None,
+        memory: Optional[bool] = None,
+        qubit_lo_freq: Optional[List[int]] = None,
+        meas_lo_freq: Optional[List[int]] = None,
+        schedule_los: Optional[
+            Union[
+                List[Union[Dict[PulseChannel, float], LoConfig]],
+                Union[Dict[PulseChannel, float], LoConfig],
+            ]
+        ] = None,
+        meas_level: Optional[Union[int, MeasLevel]] = None,
+        meas_return: Optional[Union[str, MeasReturnType]] = None,
+        rep_delay: Optional[float] = None,
+        init_qubits: Optional[bool] = None,
+        use_measure_esp: Optional[bool] = None,
+        noise_model: Optional[Any] = None,
+        seed_simulator: Optional[int] = None,
+        **run_config: Dict,
+    ) -> Dict[str, Any]:
+        """Validate the arguments of :meth:`run` and prepare the program to run.
+
+        Returns:
+            The arguments of :meth:`_runtime_run`.
+
+        Raises:
+            IBMBackendValueError: If an input parameter value is not valid.
+        """
+        submission_times: Dict[str, float] = {}
+        phase_start = time.perf_counter()
+
+        def _end_phase(name: str) -> None:
+            nonlocal phase_start
+            phase_end = time.perf_counter()
+            submission_times[name] = phase_end - phase_start
+            phase_start = phase_end
+
         validate_job_tags(job_tags, IBMBackendValueError)
         if not isinstance(circuits, List):
             circuits = [circuits]
@@ -453,10 +619,12 @@ class IBMBackend(Backend):
             self.configuration(), "supported_features", []
         ):
             warnings.warn(f"The backend {self.name} does not support dynamic circuits.")
+        _end_phase("validation")
 
-        status = self.status()
+        status = self._submission_status()
         if status.operational is True and status.status_msg != "active":
             warnings.warn(f"The backend {self.name} is currently paused.")
+        _end_phase("status")
 
         program_id = str(run_config.get("program_id", ""))
         if not program_id:
@@ -474,6 +642,7 @@ class IBMBackend(Backend):
             shots = int(shots)
         if not self.configuration().simulator:
             circuits = self._deprecate_id_instruction(circuits)
+        _end_phase("id_conversion")
         options = {"backend": self.name}
 
         run_config_dict = self._get_run_config(
@@ -496,17 +665,47 @@ class IBMBackend(Backend):
             **run_config,
         )
 
-        run_config_dict["circuits"] = circuits
+        encoding_times = CircuitEncodingTimes()
+        run_config_dict["circuits"] = encode_circuits(
+            circuits, times=encoding_times, cache=self._circuit_cache
+        )
+        logger.debug(
+            "Encoded %d circuits: QPY %.3fs, compression %.3fs, base64 %.3fs.",
+            len(circuits),
+            encoding_times.qpy,
+            encoding_times.compression,
+            encoding_times.base64,
+        )
         if not program_id.startswith(QASM3RUNNERPROGRAMID):
             # Transpiling in circuit-runner is deprecated.
             run_config_dict["skip_transpilation"] = True
+        _end_phase("encoding")
 
-        return self._runtime_run(
-            program_id=program_id,
-            inputs=run_config_dict,
-            options=options,
-            job_tags=job_tags,
-        )
+        return {
+            "program_id": program_id,
+            "inputs": run_config_dict,
+            "options": options,
+            "job_tags": job_tags,
+            "submission_times": submission_times,
+        }
+
+    def _submission_status(self) -> BackendStatus:
+        """Return the backend status checked when a job is submitted.
+
+        The status is reused for ``backend_status_ttl`` seconds, as set with the
+        argument of :class:`~qiskit_ibm_provider.IBMProvider`, instead of being
+        queried for each job.
+
+        Returns:
+            The status of the backend.
+        """
+        cached = self._cached_status
+        if cached is not None and time.monotonic() - cached[0] < self._status_ttl:
+            return cached[1]
+        status = self.status()
+        if self._status_ttl > 0:
+            self._cached_status = (time.monotonic(), status)
+        return status
 
     def _runtime_run(
         self,
@@ -514,8 +713,10 @@ class IBMBackend(Backend):
         inputs: Dict,
         options: Dict,
         job_tags: Optional[List[str]] = None,
+        submission_times: Optional[Dict[str, float]] = None,
     ) -> IBMCircuitJob:
         """Runs the runtime program and returns the corresponding job object"""
+        submit_start = time.perf_counter()
         hgp_name = self._instance or self.provider._get_hgp().name
         try:
             response = self.provider._runtime_client.program_run(
@@ -527,6 +728,58 @@ class IBMBackend(Backend):
             )
         except RequestsApiError as ex:
             raise IBMBackendApiError(f"Error submitting job: {str(ex)}") from ex
+        return self._job_from_response(
+            response, submission_times, time.perf_counter() - submit_start
+        )
+
+    async def _aruntime_run(
+        self,
+        program_id: str,
+        inputs: Dict,
+        options: Dict,
+        job_tags: Optional[List[str]] = None,
+        submission_times: Optional[Dict[str, float]] = None,
+    ) -> IBMCircuitJob:
+        """Asynchronously runs the runtime program and returns the corresponding job object"""
+        submit_start = time.perf_counter()
+        hgp_name = self._instance or self.provider._get_hgp().name
+        async_client = self.provider.async_runtime_client
+        try:
+            response = await async_client.program_run(
+                program_id=program_id,
+                backend_name=options["backend"],
+                params=inputs,
+                hgp=hgp_name,
+                job_tags=job_tags,
+            )
+        except RequestsApiError as ex:
+            raise IBMBackendApiError(f"Error submitting job: {str(ex)}") from ex
+        job = self._job_from_response(
+            response, submission_times, time.perf_counter() - submit_start
+        )
+        job._async_runtime_client = async_client
+        return job
+
+    def _job_from_response(
+        self,
+        response: Dict,
+        submission_times: Optional[Dict[str, float]] = None,
+        submit_time: float = 0.0,
+    ) -> IBMCircuitJob:
+        """Create the job of a program run.
+
+        Args:
+            response: Response of the server to the program run.
+            submission_times: Time spent in each phase of the preparation of the job.
+            submit_time: Time spent submitting the job.
+
+        Returns:
+            The job.
+
+        Raises:
+            IBMBackendApiProtocolError: If an unexpected value received from
+                the server.
+        """
         try:
             job_id = response["id"]
             job = IBMCircuitJob(
@@ -535,6 +788,9 @@ class IBMBackend(Backend):
                 runtime_client=self.provider._runtime_client,
                 job_id=job_id,
             )
+            if submission_times is not None:
+                job._submission_times = {**submission_times, "submit": submit_time}
+            self.provider._register_job(job)
             logger.debug("Job %s was successfully submitted.", job.job_id())
         except TypeError as err:
             logger.debug("Invalid job data received: %s", response)
@@ -561,7 +817,7 @@ class IBMBackend(Backend):
                 if key not in fields and not self.configuration().simulator:
                     warnings.warn(  # type: ignore[unreachable]
                         f"{key} is not a recognized runtime option and may be ignored by the backend.",
-                        stacklevel=4,
+                        stacklevel=5,
                     )
             elif backend_options.get(key) is not None and key in fields:
                 run_config_dict[key] = backend_options[key]
@@ -586,6 +842,9 @@ class IBMBackend(Backend):
             datetime: By specifying `datetime`, this function returns an instance
                 of the :class:`BackendProperties<qiskit.providers.models.BackendProperties>`
                 whose timestamp is closest to, but older than, the specified `datetime`.
+                It is looked up in the
+                :class:`~qiskit_ibm_provider.utils.PropertiesHistory` of the
+                provider, if it has one, before querying the server.
 
         Returns:
             The backend properties or ``None`` if the backend properties are not
@@ -607,19 +866,131 @@ class IBMBackend(Backend):
 
         if datetime:
             datetime = local_to_utc(datetime)
+            if self._properties_history:
+                return self._properties_history.properties(
+                    self.name, datetime, self._fetch_properties
+                )
+        if refresh:
+            self._faulty_index = None
 
-        if datetime or refresh or self._properties is None:
+        if (
+            not datetime
+            and self._backend_cache
+            and (refresh or self._properties is None)
+        ):
+            self._properties = self._backend_cache.get(
+                "properties",
+                self.name,
+                self._instance,
+                functools.partial(
+                    self.provider._runtime_client.backend_properties, self.name
+                ),
+                self._update_properties,
+                refresh=refresh,
+            )
+        elif datetime or refresh or self._properties is None:
             api_properties = self.provider._runtime_client.backend_properties(
                 self.name, datetime=datetime
             )
             if not api_properties:
                 return None
-            backend_properties = properties_from_server_data(api_properties)
             if datetime:  # Don't cache result.
-                return backend_properties
-            self._properties = backend_properties
+                return properties_from_server_data(api_properties)
+            self._properties = self._update_properties(api_properties)
         return self._properties
 
+    def properties_history(
+        self, start: python_datetime, end: Optional[python_datetime] = None
+    ) -> List[BackendProperties]:
+        """Return the backend properties in effect during a date range.
+
+        The properties are looked up in the
+        :class:`~qiskit_ibm_provider.utils.PropertiesHistory` of the provider,
+        if it has one, and only the snapshots it does not have are downloaded.
+
+        Args:
+            start: Start of the range. Dates without a timezone are in local time.
+            end: End of the range. Defaults to now.
+
+        Returns:
+            The properties in effect at ``start`` and the ones updated until
+            ``end``, sorted by update date. Simulators have no properties.
+        """
+        history = self._properties_history or PropertiesHistory()
+        return history.properties_range(self.name, start, end, self._fetch_properties)
+
+    def properties_arrays(
+        self, start: python_datetime, end: Optional[python_datetime] = None
+    ) -> PropertiesArrays:
+        """Return the qubit and gate properties of a date range as arrays.
+
+        The T1, T2 and readout error of the qubits and the error of the gates of
+        the properties returned by :meth:`properties_history` are returned as
+        NumPy arrays, with one row per snapshot, without decoding the properties.
+
+        Args:
+            start: Start of the range. Dates without a timezone are in local time.
+            end: End of the range. Defaults to now.
+
+        Returns:
+            The properties of each snapshot.
+        """
+        history = self._properties_history or PropertiesHistory()
+        return history.to_arrays(self.name, start, end, self._fetch_properties)
+
+    def _fetch_properties(self, datetime: python_datetime) -> Optional[Dict]:
+        """Return the raw properties in effect at a UTC date from the server."""
+        if self._configuration.simulator:
+            # Simulators do not have backend properties.
+            return None
+        return self.provider._runtime_client.backend_properties(
+            self.name, datetime=datetime
+        )
+
+    def _update_properties(self, raw_properties: Dict) -> BackendProperties:
+        """Decode new properties, reusing the current ones where possible.
+
+        If only the values of some qubits and gates changed since the current
+        properties, a copy of them with the changed values patched is returned,
+        and the target is patched in place, instead of being decoded again. The
+        current properties, which may have been returned to callers, are kept
+        unchanged. The ``ibm.backend.properties_update`` event is
+        published with the backend and the
+        :class:`~qiskit_ibm_provider.utils.PropertiesDelta` when the
+        properties change.
+
+        Args:
+            raw_properties: Raw properties data.
+
+        Returns:
+            The decoded properties.
+        """
+        previous_raw = self._raw_properties
+        self._raw_properties = raw_properties
+        if previous_raw is None or self._properties is None:
+            return properties_from_server_data(copy.deepcopy(raw_properties))
+
+        delta = properties_delta(previous_raw, raw_properties)
+        if not delta:
+            return self._properties
+        if delta.full:
+            properties = properties_from_server_data(copy.deepcopy(raw_properties))
+            # The target is built again when it is next used.
+            self._target = None
+        else:
+            properties = patch_properties(self._properties, raw_properties, delta)
+            if self._target is not None:
+                patch_target(self._target, raw_properties, delta)
+        logger.debug(
+            "Properties of %s updated: %d qubits and %d gates changed%s.",
+            self.name,
+            len(delta.qubits),
+            len(delta.gates),
+            ", decoded again" if delta.full else "",
+        )
+        Publisher().publish("ibm.backend.properties_update", self, delta)
+        return properties
+
     def status(self) -> BackendStatus:
         """Return the backend status.
 
@@ -657,7 +1028,18 @@ class IBMBackend(Backend):
         Returns:
             The backend pulse defaults or ``None`` if the backend does not support pulse.
         """
-        if refresh or self._defaults is None:
+        if self._backend_cache and (refresh or self._defaults is None):
+            self._defaults = self._backend_cache.get(
+                "pulse_defaults",
+                self.name,
+                self._instance,
+                functools.partial(
+                    self.provider._runtime_client.backend_pulse_defaults, self.name
+                ),
+                defaults_from_server_data,
+                refresh=refresh,
+            )
+        elif refresh or self._defaults is None:
             if api_defaults := self.provider._runtime_client.backend_pulse_defaults(
                 self.name
             ):
@@ -732,17 +1114,18 @@ class IBMBackend(Backend):
         """Raise a DeprecationWarning if any circuit contains an 'id' instruction.
 
         Additionally, if 'delay' is a 'supported_instruction', replace each 'id'
-        instruction (in-place) with the equivalent ('sx'-length) 'delay' instruction.
+        instruction with the equivalent ('sx'-length) 'delay' instruction.
 
         Args:
             circuits: The individual or list of :class:`~qiskit.circuits.QuantumCircuit` or
                 :class:`~qiskit.pulse.Schedule` objects passed to
-                :meth:`IBMBackend.run()<IBMBackend.run>`. Modified in-place.
+                :meth:`IBMBackend.run()<IBMBackend.run>`.
 
         Returns:
-            A modified copy of the original circuit where 'id' instructions are replaced with
-            'delay' instructions. A copy is used so the original circuit is not modified.
-            If there are no 'id' instructions or 'delay' is not supported, return the original circuit.
+            The circuits, where the circuits with 'id' instructions are replaced by
+            copies in which they are converted to 'delay' instructions. The other
+            circuits, and the original circuits, are not modified. If there are no
+            'id' instructions or 'delay' is not supported, return the original circuits.
         """
 
         id_support = "id" in getattr(self.configuration(), "basis_gates", [])
@@ -753,13 +1136,12 @@ class IBMBackend(Backend):
         if not delay_support:
             return circuits
 
-        circuit_has_id = any(
-            instr.name == "id"
-            for circuit in circuits
-            if isinstance(circuit, QuantumCircuit)
-            for instr, qargs, cargs in circuit.data
-        )
-        if not circuit_has_id:
+        id_indices = [
+            index
+            for index, circuit in enumerate(circuits)
+            if isinstance(circuit, QuantumCircuit) and _has_id_instruction(circuit)
+        ]
+        if not id_indices:
             return circuits
         if not self.id_warning_issued:
             if id_support:
@@ -769,7 +1151,7 @@ class IBMBackend(Backend):
                     "will be replaced with their equivalent 'delay' instruction. "
                     "Please use the 'delay' instruction instead.",
                     DeprecationWarning,
-                    stacklevel=4,
+                    stacklevel=5,
                 )
             else:
                 warnings.warn(
@@ -778,18 +1160,20 @@ class IBMBackend(Backend):
                     "will be replaced with their equivalent 'delay' instruction. "
                     "Please use the 'delay' instruction instead.",
                     DeprecationWarning,
-                    stacklevel=4,
+                    stacklevel=5,
                 )
 
             self.id_warning_issued = True
 
-        # Make sure we don't mutate user's input circuits
-        circuits = copy.deepcopy(circuits)
-        # Convert id gates to delays.
+        # Convert id gates to delays. The pass manager returns new circuits, so
+        # the user's input circuits are not mutated.
         pm = PassManager(  # pylint: disable=invalid-name
             ConvertIdToDelay(self.target.durations())
         )
-        circuits = pm.run(circuits)
+        converted = pm.run([circuits[index] for index in id_indices])
+        circuits = list(circuits)
+        for index, circuit in zip(id_indices, converted):
+            circuits[index] = circuit
 
         return circuits
 
@@ -809,6 +1193,7 @@ class IBMBackend(Backend):
             "https://qiskit.org/documentation/tutorials/circuits_advanced/05_pulse_gates.html` "
             "on how to use pulse gates."
         )
+        faulty_index: Optional[FaultyIndex] = None
         for circ in circuits:
             if isinstance(circ, Schedule):
                 raise IBMBackendValueError(schedule_error_msg)
@@ -818,7 +1203,11 @@ class IBMBackend(Backend):
                         f"Circuit contains {circ.num_qubits} qubits, "
                         f"but backend has only {self.num_qubits}."
                     )
-                self._check_faulty(circ)
+                if faulty_index is None:
+                    # Properties are fetched once for all the circuits.
+                    faulty_index = self._get_faulty_index()
+                if faulty_index:
+                    faulty_index.check(circ)
 
     def _check_faulty(self, circuit: QuantumCircuit) -> None:
         """Check if the input circuit uses faulty qubits or edges.
@@ -829,32 +1218,40 @@ class IBMBackend(Backend):
         Raises:
             ValueError: If an instruction operating on a faulty qubit or edge is found.
         """
-        if not self.properties():
-            return
+        faulty_index = self._get_faulty_index()
+        if faulty_index:
+            faulty_index.check(circuit)
 
-        faulty_qubits = self.properties().faulty_qubits()
-        faulty_gates = self.properties().faulty_gates()
-        faulty_edges = [
-            tuple(gate.qubits) for gate in faulty_gates if len(gate.qubits) > 1
-        ]
+    def _get_faulty_index(self) -> Optional[FaultyIndex]:
+        """Return the index of the faulty qubits and edges of the current properties.
 
-        for instr in circuit.data:
-            if instr.operation.name == "barrier":
-                continue
-            qubit_indices = tuple(circuit.find_bit(x).index for x in instr.qubits)
+        The index is rebuilt when the properties change.
 
-            for circ_qubit in qubit_indices:
-                if circ_qubit in faulty_qubits:
-                    raise ValueError(
-                        f"Circuit {circuit.name} contains instruction "
-                        f"{instr} operating on a faulty qubit {circ_qubit}."
-                    )
-
-            if len(qubit_indices) == 2 and qubit_indices in faulty_edges:
-                raise ValueError(
-                    f"Circuit {circuit.name} contains instruction "
-                    f"{instr} operating on a faulty edge {qubit_indices}"
-                )
+        Returns:
+            The index, or ``None`` if the backend has no properties.
+        """
+        properties = self.properties()
+        if not properties:
+            return None
+        if (
+            self._faulty_index is None
+            or self._faulty_index.properties is not properties
+        ):
+            self._faulty_index = FaultyIndex(properties, self._configuration.num_qubits)
+        return self._faulty_index
+
+
+def _has_id_instruction(circuit: QuantumCircuit) -> bool:
+    """Return whether a circuit, or one of its control-flow blocks, has an 'id' instruction."""
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name == "id":
+            return True
+        if isinstance(operation, ControlFlowOp) and any(
+            _has_id_instruction(block) for block in operation.blocks
+        ):
+            return True
+    return False
 
 
 class IBMRetiredBackend(IBMBackend):
@@ -902,7 +1299,7 @@ class IBMRetiredBackend(IBMBackend):
         """Return the backend status."""
         return self._status
 
-    def run(self, *args: Any, **kwargs: Any) -> None:    # type: ignore[override]
+    def run(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
         """Run a Circuit."""
         # pylint: disable=arguments-differ
         raise IBMBackendError(f"This backend ({self.name}) is no longer available.")
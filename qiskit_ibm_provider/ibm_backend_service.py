@@ -12,6 +12,7 @@
 
 """Backend namespace for an IBM Quantum account."""
 
+import functools
 import logging
 from datetime import datetime
 from typing import Dict, List, Callable, Optional, Any, Union
@@ -467,7 +468,7 @@ class IBMBackendService:
                 api=self._default_hgp._api_client,
             )
         try:
-            return IBMCircuitJob(
+            job = IBMCircuitJob(
                 backend=backend,
                 api_client=self._default_hgp._api_client,
                 **job_params
@@ -478,7 +479,9 @@ class IBMBackendService:
                     f"Unexpected return value received from the server "
                     f"when retrieving job {job_id}: {ex}"
                 ) from ex
-        return None
+            return None
+        self._provider._register_job(job)
+        return job
 
     def _merge_logical_filters(self, cur_filter: Dict, new_filter: Dict) -> None:
         """Merge the logical operators in the input filters.
@@ -658,12 +661,18 @@ class IBMBackendService:
             instance: the current h/g/p.
         """
         if backend_name not in self._backend_configs:
-            raw_config = self._provider._runtime_client.backend_configuration(
-                backend_name
+            fetch = functools.partial(
+                self._provider._runtime_client.backend_configuration, backend_name
             )
-            config = configuration_from_server_data(
-                raw_config=raw_config, instance=instance
+            decode = functools.partial(
+                configuration_from_server_data, instance=instance
             )
+            if self._provider._backend_cache:
+                config = self._provider._backend_cache.get(
+                    "configuration", backend_name, instance, fetch, decode
+                )
+            else:
+                config = decode(fetch())
             self._backend_configs[backend_name] = config
 
     def _create_backend_obj(
@@ -700,12 +709,20 @@ class IBMBackendService:
                     f"{instance}: please try a different hub/group/project."
                 )
 
-            return ibm_backend.IBMBackend(
+            backend = ibm_backend.IBMBackend(
                 instance=instance,
                 configuration=config,
-                api_client=AccountClient(self._provider._client_params),
+                api_client=AccountClient(
+                    self._provider._client_params,
+                    session_registry=self._provider._session_registry,
+                ),
                 provider=self._provider,
             )
+            backend._backend_cache = self._provider._backend_cache
+            backend._circuit_cache = self._provider._circuit_cache
+            backend._status_ttl = self._provider._backend_status_ttl
+            backend._properties_history = self._provider._properties_history
+            return backend
         return None
 
     @staticmethod
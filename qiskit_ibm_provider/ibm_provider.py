@@ -13,20 +13,33 @@
 """Provider for a single IBM Quantum account."""
 
 import logging
+import threading
+import time
 import traceback
 import warnings
 from datetime import datetime
 from collections import OrderedDict
+from concurrent import futures
 from typing import Dict, List, Optional, Any, Callable, Union
 from typing_extensions import Literal
 
+from requests.adapters import DEFAULT_POOLSIZE
+
 from qiskit.providers import ProviderV1 as Provider  # type: ignore[attr-defined]
 from qiskit.providers.backend import BackendV1 as Backend
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 
 from .accounts import AccountManager, Account
 from .api.client_parameters import ClientParameters
-from .api.clients import AuthClient, VersionClient, RuntimeClient
+from .api.download import DEFAULT_DOWNLOAD_TIMEOUT
+from .api.session import SessionRegistry
+from .api.clients import (
+    AsyncRuntimeClient,
+    AuthClient,
+    VersionClient,
+    RuntimeClient,
+    WebsocketConnectionPool,
+)
 from .apiconstants import QISKIT_IBM_API_URL
 from .exceptions import IBMAccountError
 from .exceptions import (
@@ -36,9 +49,16 @@ from .exceptions import (
 from .hub_group_project import HubGroupProject  # pylint: disable=cyclic-import
 from .ibm_backend import IBMBackend  # pylint: disable=cyclic-import
 from .ibm_backend_service import IBMBackendService  # pylint: disable=cyclic-import
-from .job import IBMJob  # pylint: disable=cyclic-import
+from .job import (  # pylint: disable=cyclic-import
+    IBMJob,
+    IBMCircuitJob,
+    JobStatusPoller,
+)
 from .proxies.configuration import ProxyConfiguration
 from .utils.hgp import to_instance_format, from_instance_format
+from .utils.backend_cache import BackendDataCache
+from .utils.circuit_cache import EncodedCircuitCache
+from .utils.properties_history import PropertiesHistory
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +143,9 @@ class IBMProvider(Provider):
         in Jupyter Notebook and the Python interpreter.
     """
 
+    _BOOTSTRAP_MAX_WORKERS = 8
+    """Maximum number of threads used to discover the backends of an account."""
+
     def __init__(
         self,
         token: Optional[str] = None,
@@ -131,6 +154,15 @@ class IBMProvider(Provider):
         instance: Optional[str] = None,
         proxies: Optional[dict] = None,
         verify: Optional[bool] = None,
+        cache_dir: Optional[str] = None,
+        lazy: bool = False,
+        bootstrap_callback: Optional[Callable[[str, float], None]] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        result_download_timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        circuit_cache: Optional[EncodedCircuitCache] = None,
+        backend_status_ttl: float = 0,
+        properties_history: Optional[PropertiesHistory] = None,
     ) -> None:
         """IBMProvider constructor
 
@@ -146,6 +178,33 @@ class IBMProvider(Provider):
                 ``username_ntlm``, ``password_ntlm`` (username and password to enable NTLM user
                 authentication)
             verify: Whether to verify the server's TLS certificate.
+            cache_dir: Directory used to persist decoded backend configurations,
+                properties and pulse defaults across sessions. If ``None``, backend
+                data is only cached in memory.
+            lazy: If ``True``, defer the discovery of the hub/group/projects and
+                backends of the account until they are first needed.
+            bootstrap_callback: Function called with the name and the duration,
+                in seconds, of each provider bootstrap phase: ``"authenticate"``,
+                ``"initialize_hgps"``, ``"discover_backends"`` and
+                ``"initialize_services"``.
+            pool_connections: Number of host connection pools cached by the HTTP
+                sessions shared by the clients of this provider.
+            pool_maxsize: Maximum number of connections kept in each pool. Raise
+                it to the number of threads using the provider concurrently.
+            result_download_timeout: Number of seconds to wait for data while
+                downloading job results stored externally. Interrupted downloads
+                are resumed from where they stopped.
+            circuit_cache: Cache of encoded circuits shared by the backends of this
+                provider. Circuits found in it are not encoded again when they are
+                submitted. If ``None``, circuits are encoded for each job.
+            backend_status_ttl: Number of seconds the status of a backend, checked
+                when a job is submitted to warn if the backend is paused, is reused
+                for the following jobs. By default, the status is queried for each
+                job. Raise it when submitting many small jobs.
+            properties_history: Store of the historical properties of the backends
+                of this provider. Properties queried by date are looked up in it,
+                and only downloaded if it does not have them. If ``None``, they are
+                downloaded for each query.
 
         Returns:
             An instance of IBMProvider
@@ -155,6 +214,10 @@ class IBMProvider(Provider):
 
         """
         super().__init__()
+        self._bootstrap_callback = bootstrap_callback
+        self._bootstrap_lock = threading.RLock()
+        self._hgps_data: Optional[Dict[str, HubGroupProject]] = None
+        self._backend_service: Optional[IBMBackendService] = None
         self._account = self._discover_account(
             token=token,
             url=url,
@@ -171,15 +234,82 @@ class IBMProvider(Provider):
             proxies=self._account.proxies,
             verify=self._account.verify,
         )
+        self._bootstrap_phase("authenticate", self._authenticate)
+        self._session_registry = SessionRegistry(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self._runtime_client = RuntimeClient(
+            self._client_params, session_registry=self._session_registry
+        )
+        self._async_runtime_client: Optional[AsyncRuntimeClient] = None
+        self._job_status_poller = JobStatusPoller(self._runtime_client)
+        self._websocket_pool = WebsocketConnectionPool()
+        self._backend_cache = BackendDataCache(cache_dir) if cache_dir else None
+        self._result_download_timeout = result_download_timeout
+        self._circuit_cache = circuit_cache
+        self._backend_status_ttl = backend_status_ttl
+        self._properties_history = properties_history
+
+        if not lazy:
+            _ = self._backend
+
+    def _authenticate(self) -> None:
+        """Authenticate the account and set up the runtime connection parameters."""
         self._auth_client = self._authenticate_ibm_quantum_account(self._client_params)
         self._client_params.url = self._auth_client.current_service_urls()["services"][
             "runtime"
         ]
         self._client_params.token = self._auth_client.current_access_token()
-        self._runtime_client = RuntimeClient(self._client_params)
 
-        self._hgps = self._initialize_hgps(self._auth_client)
-        self._initialize_services()
+    def _bootstrap_phase(self, name: str, function: Callable, *args: Any) -> Any:
+        """Run a bootstrap phase and report its duration.
+
+        Args:
+            name: Name of the phase.
+            function: Function running the phase.
+            *args: Arguments of the function.
+
+        Returns:
+            The value returned by the function.
+        """
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            duration = time.perf_counter() - start
+            logger.debug("Provider bootstrap phase %s took %.3fs.", name, duration)
+            if self._bootstrap_callback:
+                self._bootstrap_callback(name, duration)
+
+    @property
+    def _hgps(self) -> Dict[str, HubGroupProject]:
+        """Return the hub/group/projects of the account, initializing them if needed."""
+        if self._hgps_data is None:
+            with self._bootstrap_lock:
+                if self._hgps_data is None:
+                    self._hgps_data = self._bootstrap_phase(
+                        "initialize_hgps", self._initialize_hgps, self._auth_client
+                    )
+        return self._hgps_data
+
+    @_hgps.setter
+    def _hgps(self, value: Dict[str, HubGroupProject]) -> None:
+        """Set the hub/group/projects of the account."""
+        self._hgps_data = value
+
+    @property
+    def _backend(self) -> IBMBackendService:
+        """Return the backend service, initializing the services if needed."""
+        if self._backend_service is None:
+            with self._bootstrap_lock:
+                if self._backend_service is None:
+                    self._initialize_services()
+        return self._backend_service
+
+    @_backend.setter
+    def _backend(self, value: IBMBackendService) -> None:
+        """Set the backend service."""
+        self._backend_service = value
 
     @staticmethod
     def _discover_account(
@@ -394,16 +524,31 @@ class IBMProvider(Provider):
 
     def _initialize_services(self) -> None:
         """Initialize all services."""
-        self._backend = None
         hgps = self._get_hgps()
-        for hgp in hgps:
-            # Initialize backend service
-            if not self._backend:
-                self._backend = IBMBackendService(self, hgp)
-            if self._backend:
-                break
+        self._bootstrap_phase("discover_backends", self._discover_backends, hgps)
+        self._backend = self._bootstrap_phase(
+            "initialize_services", IBMBackendService, self, hgps[0]
+        )
         self._services = {"backend": self._backend}
 
+    def _discover_backends(self, hgps: List[HubGroupProject]) -> None:
+        """Discover the backends of the hub/group/projects concurrently.
+
+        Args:
+            hgps: The hub/group/projects whose backends are discovered.
+        """
+        max_workers = min(self._BOOTSTRAP_MAX_WORKERS, len(hgps))
+        if max_workers <= 1:
+            for hgp in hgps:
+                _ = hgp.backends
+            return
+        with futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ibm-provider-bootstrap"
+        ) as executor:
+            # Consume the results to propagate discovery errors.
+            for _ in executor.map(lambda hgp: hgp.backends, hgps):
+                pass
+
     @property
     def backend(self) -> IBMBackendService:
         """Return the backend service.
@@ -413,6 +558,57 @@ class IBMProvider(Provider):
         """
         return self._backend
 
+    def _register_job(self, job: IBMCircuitJob) -> None:
+        """Attach the provider-wide status poller, websocket pool and settings to a job.
+
+        Args:
+            job: The job to register.
+        """
+        self._job_status_poller.register(job)
+        job._ws_pool = self._websocket_pool
+        job._download_timeout = self._result_download_timeout
+
+    @property
+    def job_status_poller(self) -> JobStatusPoller:
+        """Return the poller that batches status queries of this provider's jobs.
+
+        Returns:
+            The job status poller instance.
+        """
+        return self._job_status_poller
+
+    @property
+    def async_runtime_client(self) -> AsyncRuntimeClient:
+        """Return the asyncio client used by the awaitable methods of backends and jobs.
+
+        The client is created on first access. It requires ``aiohttp``, installed
+        with ``pip install 'qiskit-ibm-provider[async]'``.
+
+        Returns:
+            The asyncio runtime client instance.
+        """
+        if self._async_runtime_client is None:
+            self._async_runtime_client = AsyncRuntimeClient(self._client_params)
+        return self._async_runtime_client
+
+    @property
+    def session_registry(self) -> SessionRegistry:
+        """Return the registry of HTTP sessions shared by this provider's clients.
+
+        Returns:
+            The session registry instance.
+        """
+        return self._session_registry
+
+    @property
+    def websocket_pool(self) -> WebsocketConnectionPool:
+        """Return the pool of websocket connections used to stream job results.
+
+        Returns:
+            The websocket connection pool instance.
+        """
+        return self._websocket_pool
+
     def active_account(self) -> Optional[Dict[str, str]]:
         """Return the IBM Quantum account currently in use for the session.
 
@@ -28,6 +28,8 @@ Classes
 
     IBMCircuitJob
     IBMCompositeJob
+    ColumnarResult
+    JobStatusPoller
     QueueInfo
 
 Functions
@@ -53,7 +55,9 @@ Exception
 from .ibm_job import IBMJob
 from .ibm_circuit_job import IBMCircuitJob
 from .ibm_composite_job import IBMCompositeJob
+from .columnar_result import ColumnarResult
 from .queueinfo import QueueInfo
+from .status_poller import JobStatusPoller
 from .exceptions import (
     IBMJobError,
     IBMJobApiError,
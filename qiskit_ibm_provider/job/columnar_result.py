@@ -0,0 +1,447 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Result storing counts and memory in NumPy arrays."""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.pulse import Schedule
+from qiskit.result import Result, postprocess
+from qiskit.result.counts import Counts
+from qiskit.result.models import ExperimentResult
+from qiskit.qobj.utils import MeasLevel
+
+from ..utils import RuntimeDecoder, RuntimeEncoder
+
+ExperimentKey = Optional[Union[str, QuantumCircuit, Schedule, int]]
+
+_METADATA_FILE = "result.json"
+_COLUMNS_KEY = "__columns__"
+
+
+class _ExperimentColumns:
+    """Counts and memory of an experiment, stored as packed bits.
+
+    Each outcome is stored as the big-endian bytes of its integer value, so
+    bit ``i`` of the outcome is the value of classical bit ``i``.
+    """
+
+    def __init__(
+        self,
+        num_bits: int,
+        counts_keys: Optional[np.ndarray] = None,
+        counts: Optional[np.ndarray] = None,
+        memory: Optional[np.ndarray] = None,
+    ) -> None:
+        """_ExperimentColumns constructor.
+
+        Args:
+            num_bits: Number of classical bits of an outcome.
+            counts_keys: Packed outcomes of the counts, one row per outcome.
+            counts: Number of occurrences of each outcome.
+            memory: Packed outcomes of each shot, one row per shot.
+        """
+        self.num_bits = num_bits
+        self.counts_keys = counts_keys
+        self.counts = counts
+        self.memory = memory
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counts and memory in the format of the results schema."""
+        out_dict: Dict[str, Any] = {}
+        if self.counts is not None:
+            out_dict["counts"] = dict(
+                zip(_packed_to_hex(self.counts_keys), self.counts.tolist())
+            )
+        if self.memory is not None:
+            out_dict["memory"] = _packed_to_hex(self.memory)
+        return out_dict
+
+
+def _hex_to_packed(values: Sequence[str], num_bytes: int) -> np.ndarray:
+    """Convert hexadecimal outcomes to packed bits.
+
+    Args:
+        values: Outcomes in hexadecimal format, e.g. ``0x5``.
+        num_bytes: Number of bytes of each packed outcome.
+
+    Returns:
+        A ``uint8`` array with one row of ``num_bytes`` bytes per outcome.
+    """
+    if num_bytes <= 8:
+        integers = np.fromiter(
+            (int(value, 16) for value in values), dtype=np.uint64, count=len(values)
+        )
+        packed = integers.astype(">u8").view(np.uint8).reshape(-1, 8)
+        return np.ascontiguousarray(packed[:, 8 - num_bytes :])
+    buffer = b"".join(int(value, 16).to_bytes(num_bytes, "big") for value in values)
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(-1, num_bytes).copy()
+
+
+def _packed_to_hex(packed: np.ndarray) -> List[str]:
+    """Convert packed bits to hexadecimal outcomes.
+
+    Args:
+        packed: A ``uint8`` array with one row per outcome.
+
+    Returns:
+        Outcomes in hexadecimal format.
+    """
+    num_bytes = packed.shape[1]
+    if num_bytes <= 8:
+        padded = np.zeros((packed.shape[0], 8), dtype=np.uint8)
+        padded[:, 8 - num_bytes :] = packed
+        return [hex(value) for value in padded.view(">u8").ravel().tolist()]
+    return [hex(int.from_bytes(row.tobytes(), "big")) for row in packed]
+
+
+def _unpack(packed: np.ndarray, num_bits: int) -> np.ndarray:
+    """Unpack outcomes into one column per classical bit.
+
+    Args:
+        packed: A ``uint8`` array with one row per outcome.
+        num_bits: Number of classical bits of an outcome.
+
+    Returns:
+        A ``uint8`` array of shape ``(outcomes, num_bits)`` whose column ``i``
+        is the value of classical bit ``i``.
+    """
+    return np.unpackbits(packed, axis=1)[:, ::-1][:, :num_bits]
+
+
+class ColumnarResult(Result):
+    """Result that stores counts and memory in NumPy arrays.
+
+    The counts and per-shot memory of measurement level 2 experiments are
+    stored as packed bits instead of dictionaries and lists of strings, which
+    reduces the memory needed to hold results with many shots. They are
+    converted back to the usual format on demand, so :meth:`get_counts`,
+    :meth:`get_memory` and :meth:`data` return the same values as they do for
+    a :class:`~qiskit.result.Result`. :meth:`get_counts_array` and
+    :meth:`get_memory_array` return the outcomes as arrays of bits instead.
+
+    Note:
+        The ``data`` attribute of the experiment results in ``results`` does
+        not contain the counts and memory stored in arrays. Use the methods of
+        this class to access them.
+
+    A ``ColumnarResult`` can be saved to a directory with :meth:`save`, and
+    loaded with :meth:`load`, which memory-maps the arrays by default.
+    """
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ColumnarResult":
+        """Create a new ``ColumnarResult`` object from a dictionary.
+
+        Args:
+            data: A dictionary representing the result, in the same format as
+                output by :meth:`to_dict`.
+
+        Returns:
+            The ``ColumnarResult`` object from the input dictionary.
+        """
+        columns = []
+        experiments = []
+        for experiment in data["results"]:
+            experiment = dict(experiment)
+            if _COLUMNS_KEY in experiment:
+                # Already packed by ``ColumnarDecoder``.
+                columns.append(experiment.pop(_COLUMNS_KEY))
+            else:
+                experiment["data"] = dict(experiment.get("data", {}))
+                columns.append(cls._pop_columns(experiment))
+            experiments.append(experiment)
+        result = super().from_dict({**data, "results": experiments})
+        for exp_result, exp_columns in zip(result.results, columns):
+            if exp_columns is not None:
+                exp_result._columns = exp_columns
+        return result
+
+    @classmethod
+    def from_result(cls, result: Result) -> "ColumnarResult":
+        """Create a new ``ColumnarResult`` object from a result.
+
+        Args:
+            result: Result to convert.
+
+        Returns:
+            The ``ColumnarResult`` object with the data of the input result.
+        """
+        if isinstance(result, ColumnarResult):
+            return result
+        return cls.from_dict(result.to_dict())
+
+    @staticmethod
+    def _pop_columns(experiment: Dict) -> Optional[_ExperimentColumns]:
+        """Remove the counts and memory of an experiment and store them in arrays.
+
+        Args:
+            experiment: An experiment result in dictionary format.
+
+        Returns:
+            The arrays, or ``None`` if the experiment has no level 2 data.
+        """
+        if experiment.get("meas_level", MeasLevel.CLASSIFIED) != MeasLevel.CLASSIFIED:
+            return None
+        data = experiment["data"]
+        counts = data.get("counts")
+        memory = data.get("memory")
+        if counts is None and memory is None:
+            return None
+        if memory is not None and memory and not isinstance(memory[0], str):
+            return None
+
+        num_bits = (experiment.get("header") or {}).get("memory_slots")
+        if num_bits is None:
+            num_bits = max(
+                (int(value, 16).bit_length() for value in (counts or memory or [])),
+                default=0,
+            )
+        num_bytes = max(1, (num_bits + 7) // 8)
+        columns = _ExperimentColumns(num_bits)
+        if counts is not None:
+            columns.counts_keys = _hex_to_packed(list(counts), num_bytes)
+            columns.counts = np.fromiter(
+                counts.values(), dtype=np.int64, count=len(counts)
+            )
+            del data["counts"]
+        if memory is not None:
+            columns.memory = _hex_to_packed(memory, num_bytes)
+            del data["memory"]
+        return columns
+
+    def _get_columns(self, experiment: ExperimentKey) -> Optional[_ExperimentColumns]:
+        """Return the arrays of an experiment, if any."""
+        return getattr(self._get_experiment(experiment), "_columns", None)
+
+    @staticmethod
+    def _get_header(exp_result: ExperimentResult) -> Optional[Dict]:
+        """Return the header of an experiment in dictionary format, if any."""
+        try:
+            return exp_result.header.to_dict()
+        except (AttributeError, QiskitError):
+            return None
+
+    def data(self, experiment: ExperimentKey = None) -> Dict:
+        """Get the raw data for an experiment.
+
+        See :meth:`qiskit.result.Result.data`.
+
+        Args:
+            experiment: The index of the experiment.
+
+        Returns:
+            A dictionary of results data for an experiment.
+        """
+        data = super().data(experiment)
+        if columns := self._get_columns(experiment):
+            data.update(columns.to_dict())
+        return data
+
+    def get_counts(
+        self, experiment: ExperimentKey = None
+    ) -> Union[Counts, List[Counts]]:
+        """Get the histogram data of an experiment.
+
+        See :meth:`qiskit.result.Result.get_counts`.
+
+        Args:
+            experiment: The index of the experiment.
+
+        Returns:
+            A dictionary or a list of dictionaries with the counts of each outcome.
+        """
+        if experiment is None:
+            exp_keys: Sequence[ExperimentKey] = range(len(self.results))
+        else:
+            exp_keys = [experiment]
+
+        dict_list = []
+        for key in exp_keys:
+            columns = self._get_columns(key)
+            if columns is None or columns.counts is None:
+                dict_list.append(super().get_counts(key))
+                continue
+            header = self._get_header(self._get_experiment(key)) or {}
+            counts_header = {
+                k: v
+                for k, v in header.items()
+                if k in {"time_taken", "creg_sizes", "memory_slots"}
+            }
+            counts = dict(
+                zip(_packed_to_hex(columns.counts_keys), columns.counts.tolist())
+            )
+            dict_list.append(Counts(counts, **counts_header))
+
+        if len(dict_list) == 1:
+            return dict_list[0]
+        return dict_list
+
+    def get_memory(
+        self, experiment: ExperimentKey = None
+    ) -> Union[List[str], np.ndarray]:
+        """Get the sequence of memory states (readouts) for each shot.
+
+        See :meth:`qiskit.result.Result.get_memory`.
+
+        Args:
+            experiment: The index of the experiment.
+
+        Returns:
+            The outcome of each shot, formatted according to the registers
+            of the circuit.
+        """
+        columns = self._get_columns(experiment)
+        if columns is None or columns.memory is None:
+            return super().get_memory(experiment)
+        header = self._get_header(self._get_experiment(experiment))
+        return postprocess.format_level_2_memory(_packed_to_hex(columns.memory), header)
+
+    def get_counts_array(
+        self, experiment: ExperimentKey = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the histogram data of an experiment as arrays.
+
+        Args:
+            experiment: The index of the experiment.
+
+        Returns:
+            A tuple of an array of shape ``(outcomes, memory_slots)`` whose
+            column ``i`` is the value of classical bit ``i`` of each outcome,
+            and an array with the number of occurrences of each outcome.
+
+        Raises:
+            QiskitError: If there are no counts for the experiment.
+        """
+        columns = self._get_columns(experiment)
+        if columns is None or columns.counts is None:
+            raise QiskitError(f'No counts for experiment "{repr(experiment)}"')
+        return _unpack(columns.counts_keys, columns.num_bits), columns.counts
+
+    def get_memory_array(self, experiment: ExperimentKey = None) -> np.ndarray:
+        """Get the memory states (readouts) of each shot as an array.
+
+        Args:
+            experiment: The index of the experiment.
+
+        Returns:
+            An array of shape ``(shots, memory_slots)`` whose column ``i`` is the
+            value of classical bit ``i`` in each shot.
+
+        Raises:
+            QiskitError: If there is no level 2 memory for the experiment.
+        """
+        columns = self._get_columns(experiment)
+        if columns is None or columns.memory is None:
+            raise QiskitError(
+                f'No memory for experiment "{repr(experiment)}". Please verify that '
+                'you ran a measurement level 2 job with the memory flag set, eg., "memory=True".'
+            )
+        return _unpack(columns.memory, columns.num_bits)
+
+    def to_dict(self) -> Dict:
+        """Return a dictionary format representation of the result.
+
+        Returns:
+            The dictionary form of the result, including the counts and memory
+            stored in arrays.
+        """
+        out_dict = super().to_dict()
+        for exp_result, exp_dict in zip(self.results, out_dict["results"]):
+            if columns := getattr(exp_result, "_columns", None):
+                exp_dict["data"].update(columns.to_dict())
+        return out_dict
+
+    def save(self, directory: str) -> None:
+        """Save the result to a directory.
+
+        The arrays are saved in ``.npy`` files, and the rest of the result in
+        a JSON file.
+
+        Args:
+            directory: Directory to save the result to. It is created if needed.
+        """
+        os.makedirs(directory, exist_ok=True)
+        metadata = super().to_dict()
+        for idx, (exp_result, exp_dict) in enumerate(
+            zip(self.results, metadata["results"])
+        ):
+            columns = getattr(exp_result, "_columns", None)
+            if columns is None:
+                continue
+            exp_dict["columns"] = {"num_bits": columns.num_bits, "arrays": []}
+            for name in ["counts_keys", "counts", "memory"]:
+                array = getattr(columns, name)
+                if array is not None:
+                    np.save(os.path.join(directory, f"{idx}_{name}.npy"), array)
+                    exp_dict["columns"]["arrays"].append(name)
+        with open(
+            os.path.join(directory, _METADATA_FILE), "w", encoding="utf-8"
+        ) as file:
+            json.dump(metadata, file, cls=RuntimeEncoder)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Optional[str] = "r") -> "ColumnarResult":
+        """Load a result saved with :meth:`save`.
+
+        Args:
+            directory: Directory the result was saved to.
+            mmap_mode: Memory-map mode of the arrays, as accepted by
+                ``numpy.load``. If ``None``, the arrays are read into memory.
+
+        Returns:
+            The loaded result.
+        """
+        with open(os.path.join(directory, _METADATA_FILE), encoding="utf-8") as file:
+            metadata = json.load(file, cls=RuntimeDecoder)
+        all_columns = [
+            exp_dict.pop("columns", None) for exp_dict in metadata["results"]
+        ]
+        result = super().from_dict(metadata)
+        for idx, (exp_result, exp_columns) in enumerate(
+            zip(result.results, all_columns)
+        ):
+            if exp_columns is None:
+                continue
+            columns = _ExperimentColumns(exp_columns["num_bits"])
+            for name in exp_columns["arrays"]:
+                path = os.path.join(directory, f"{idx}_{name}.npy")
+                setattr(columns, name, np.load(path, mmap_mode=mmap_mode))
+            exp_result._columns = columns
+        return result
+
+
+class ColumnarDecoder(RuntimeDecoder):
+    """JSON decoder that packs the counts and memory of experiment results.
+
+    The counts and memory of each experiment result are stored in arrays as
+    soon as the experiment is decoded, so the outcome strings of all the
+    experiments are never held in memory together. The decoded dictionary
+    is meant to be passed to :meth:`ColumnarResult.from_dict`.
+    """
+
+    def object_hook(self, obj: Any) -> Any:
+        """Called to decode object."""
+        obj = super().object_hook(obj)
+        if (
+            isinstance(obj, dict)
+            and isinstance(obj.get("data"), dict)
+            and "shots" in obj
+            and "success" in obj
+        ):
+            obj[_COLUMNS_KEY] = ColumnarResult._pop_columns(obj)
+        return obj
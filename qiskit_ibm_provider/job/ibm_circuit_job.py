@@ -12,15 +12,15 @@
 
 """IBM Quantum job."""
 
+import asyncio
+import io
 import json
 import logging
 import time
-import queue
 from concurrent import futures
 from datetime import datetime
 from typing import Dict, Optional, Any, List, Union
 import re
-import requests
 
 import dateutil.parser
 from qiskit.providers.jobstatus import JOB_FINAL_STATES, JobStatus
@@ -38,24 +38,32 @@ from .exceptions import (
     IBMJobTimeoutError,
     IBMJobInvalidStateError,
 )
+from .columnar_result import ColumnarDecoder, ColumnarResult
 from .ibm_job import IBMJob
 from .queueinfo import QueueInfo
+from . import status_poller  # pylint: disable=unused-import,cyclic-import
 from .utils import build_error_report, api_to_job_error
 from ..api.clients import (
     AccountClient,
+    AsyncRuntimeClient,
     RuntimeClient,
     RuntimeWebsocketClient,
     WebsocketClientCloseCode,
+    WebsocketConnectionPool,
 )
-from ..api.exceptions import ApiError, RequestsApiError
+from ..api.download import DEFAULT_DOWNLOAD_TIMEOUT, RangeDownload
+from ..api.exceptions import ApiError, RequestsApiError, WebsocketError
 from ..apiconstants import ApiJobStatus, ApiJobKind
 from ..utils.converters import utc_to_local
-from ..utils.json_decoder import decode_result
+from ..utils.json_decoder import decode_result, decode_result_stream
 from ..utils.json import RuntimeDecoder
-from ..utils.utils import validate_job_tags, api_status_to_job_status
+from ..utils.utils import validate_job_tags, api_status_to_job_status, RefreshQueue
 
 logger = logging.getLogger(__name__)
 
+RESULT_QUEUE_MAXSIZE = 64
+"""Maximum number of streamed messages kept for a job. Older messages are dropped."""
+
 
 class IBMCircuitJob(IBMJob):
     """Representation of a job that executes on an IBM Quantum backend.
@@ -173,22 +181,21 @@ class IBMCircuitJob(IBMJob):
         self._cancelled = False
         self._job_error_msg = None  # type: Optional[str]
         self._refreshed = False
+        self._status_poller = None  # type: Optional[status_poller.JobStatusPoller]
 
+        self._ws_pool = None  # type: Optional[WebsocketConnectionPool]
+        self._ws_client = None  # type: Optional[RuntimeWebsocketClient]
         self._ws_client_future = None  # type: Optional[futures.Future]
-        self._result_queue = queue.Queue()  # type: queue.Queue
-        self._ws_client = RuntimeWebsocketClient(
-            websocket_url=self._api_client._params.get_runtime_api_base_url().replace(
-                "https", "wss"
-            ),
-            client_params=self._api_client._params,
-            job_id=job_id,
-            message_queue=self._result_queue,
-        )
+        self._result_queue = RefreshQueue(maxsize=RESULT_QUEUE_MAXSIZE)
+        self._async_runtime_client = None  # type: Optional[AsyncRuntimeClient]
+        self._download_timeout = DEFAULT_DOWNLOAD_TIMEOUT
+        self._submission_times: Optional[Dict[str, float]] = None
 
     def result(  # type: ignore[override]
         self,
         timeout: Optional[float] = None,
         refresh: bool = False,
+        columnar: bool = False,
     ) -> Result:
         """Return the result of the job.
 
@@ -227,6 +234,9 @@ class IBMCircuitJob(IBMJob):
             timeout: Number of seconds to wait for job.
             refresh: If ``True``, re-query the server for the result. Otherwise
                 return the cached value.
+            columnar: If ``True``, return a
+                :class:`~qiskit_ibm_provider.job.ColumnarResult`, which stores
+                counts and memory in NumPy arrays instead of Python objects.
 
         Returns:
             Job result.
@@ -247,7 +257,9 @@ class IBMCircuitJob(IBMJob):
             if self._status == JobStatus.ERROR:
                 error_message = self.error_message()
                 raise IBMJobFailureError(f"Job failed: " f"{error_message}")
-            self._retrieve_result(refresh=refresh)
+            self._retrieve_result(refresh=refresh, columnar=columnar)
+        if columnar and self._result is not None:
+            self._result = ColumnarResult.from_result(self._result)
         return self._result
 
     def cancel(self) -> bool:
@@ -272,7 +284,8 @@ class IBMCircuitJob(IBMJob):
                 self.job_id(),
                 self._cancelled,
             )
-            self._ws_client.disconnect(WebsocketClientCloseCode.CANCEL)
+            if self._ws_client is not None:
+                self._ws_client.disconnect(WebsocketClientCloseCode.CANCEL)
             self._status = JobStatus.CANCELLED
             return self._cancelled
         except RequestsApiError as ex:
@@ -328,6 +341,10 @@ class IBMCircuitJob(IBMJob):
             your request.
             Use :meth:`wait_for_final_state()` if you want to wait for the job to finish.
 
+        Note:
+            If the provider's job status poller refreshed the status of this job
+            within its polling interval, the cached status is returned instead.
+
         Note:
             If the job failed, you can use :meth:`error_message()` to get
             more information.
@@ -341,16 +358,126 @@ class IBMCircuitJob(IBMJob):
         """
         if self._status is not None and self._status in JOB_FINAL_STATES:
             return self._status
+        if self._status_poller is not None and self._status_poller.is_current(self):
+            return self._status
 
         with api_to_job_error():
             api_response = self._runtime_client.job_get(self.job_id())["state"]
             # response state possibly has two values: status and reason
             # reason is not used in the current interface
-            self._api_status = api_response["status"]
-            self._status = api_status_to_job_status(self._api_status)
+            self._update_status(api_response["status"])
 
         return self._status
 
+    async def astatus(self) -> JobStatus:
+        """Asynchronously query the server for the latest job status.
+
+        This is the awaitable counterpart of :meth:`status`.
+
+        Returns:
+            The status of the job.
+
+        Raises:
+            IBMJobApiError: If an unexpected error occurred when communicating
+                with the server.
+        """
+        if self._status is not None and self._status in JOB_FINAL_STATES:
+            return self._status
+        if self._status_poller is not None and self._status_poller.is_current(self):
+            return self._status
+
+        with api_to_job_error():
+            api_response = await self._get_async_runtime_client().job_get(self.job_id())
+            self._update_status(api_response["state"]["status"])
+
+        return self._status
+
+    async def await_final_state(
+        self, timeout: Optional[float] = None, wait: float = 3
+    ) -> None:
+        """Asynchronously wait until the job progresses to a final state.
+
+        This is the awaitable counterpart of :meth:`wait_for_final_state`.
+
+        Args:
+            timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
+            wait: Seconds between status queries.
+
+        Raises:
+            IBMJobTimeoutError: If the job does not reach a final state before the
+                specified timeout.
+        """
+        start_time = time.time()
+        status = await self.astatus()
+        while status not in JOB_FINAL_STATES:
+            elapsed_time = time.time() - start_time
+            if timeout is not None and elapsed_time >= timeout:
+                raise IBMJobTimeoutError(
+                    f"Timed out waiting for job to complete after {timeout} secs."
+                )
+            await asyncio.sleep(wait)
+            status = await self.astatus()
+
+    async def aresult(
+        self,
+        timeout: Optional[float] = None,
+        refresh: bool = False,
+        columnar: bool = False,
+    ) -> Result:
+        """Asynchronously return the result of the job.
+
+        This is the awaitable counterpart of :meth:`result`.
+
+        Args:
+            timeout: Number of seconds to wait for job.
+            refresh: If ``True``, re-query the server for the result. Otherwise
+                return the cached value.
+            columnar: If ``True``, return a
+                :class:`~qiskit_ibm_provider.job.ColumnarResult`.
+
+        Returns:
+            Job result.
+
+        Raises:
+            IBMJobInvalidStateError: If the job was cancelled.
+            IBMJobFailureError: If the job failed.
+            IBMJobApiError: If an unexpected error occurred when communicating
+                with the server.
+        """
+        if self._result is None or refresh:
+            await self.await_final_state(timeout=timeout)
+            if self._status is JobStatus.CANCELLED:
+                raise IBMJobInvalidStateError(
+                    f"Unable to retrieve result for job {self.job_id()}. Job was cancelled."
+                )
+            loop = asyncio.get_running_loop()
+            if self._status == JobStatus.ERROR:
+                error_message = await loop.run_in_executor(None, self.error_message)
+                raise IBMJobFailureError(f"Job failed: " f"{error_message}")
+            await self._aretrieve_result(refresh=refresh, columnar=columnar)
+        if columnar and self._result is not None:
+            self._result = ColumnarResult.from_result(self._result)
+        return self._result
+
+    def _get_async_runtime_client(self) -> AsyncRuntimeClient:
+        """Return the asyncio client used by this job.
+
+        Returns:
+            The asyncio runtime client of the provider, unless one was set.
+        """
+        if self._async_runtime_client is None:
+            self._async_runtime_client = self._provider.async_runtime_client
+        return self._async_runtime_client
+
+    def _update_status(self, api_status: str) -> None:
+        """Update the cached status of this job.
+
+        Args:
+            api_status: Job status returned by the server.
+        """
+        self._api_status = api_status
+        self._status = api_status_to_job_status(api_status)
+
     def error_message(self) -> Optional[str]:
         """Provide details about the reason of failure.
 
@@ -492,6 +619,24 @@ class IBMCircuitJob(IBMJob):
             else None
         )
 
+    def submission_times(self) -> Optional[Dict[str, float]]:
+        """Return the time spent in each phase of the submission of the job.
+
+        The output dictionary contains the duration, in seconds, of each client
+        side phase of :meth:`IBMBackend.run()<qiskit_ibm_provider.IBMBackend.run>`:
+        ``validation`` of the circuits and arguments, backend ``status`` check,
+        ``id_conversion`` of 'id' instructions to delays, ``encoding`` of the
+        circuits and ``submit`` request to the server. For example::
+
+            {'validation': 0.0012, 'status': 0.2104, 'id_conversion': 0.0001,
+             'encoding': 0.0153, 'submit': 0.4431}
+
+        Returns:
+            Time spent in each submission phase, or ``None`` if the job was not
+            submitted in this session.
+        """
+        return self._submission_times
+
     @property
     def client_version(self) -> Dict[str, str]:
         """Return version of the client used for this job.
@@ -535,7 +680,7 @@ class IBMCircuitJob(IBMJob):
             api_metadata.get("qiskit_version", None)
         )
         if self._status == JobStatus.DONE:
-            api_result = self._download_external_result(
+            api_result = self._download_and_decode_result(
                 self._runtime_client.job_results(self.job_id())
             )
             self._set_result(api_result)
@@ -601,6 +746,9 @@ class IBMCircuitJob(IBMJob):
             will remain open if the job is still running and the connection will be terminated
             once the job completes. Then update and return the status of the job.
 
+        If the job does not complete within ``timeout``, its websocket connection
+        is closed and returned to the pool of the provider.
+
         Args:
             timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
 
@@ -609,11 +757,27 @@ class IBMCircuitJob(IBMJob):
         """
         try:
             start_time = time.time()
+            self._start_streaming()
             if self._is_streaming():
-                self._ws_client_future.result(timeout)
+                try:
+                    self._ws_client_future.result(timeout)
+                except WebsocketError as err:
+                    # Streaming is only used to wait; poll the status instead.
+                    logger.debug(
+                        "Unable to stream results for job %s: %s", self.job_id(), err
+                    )
             # poll for status after stream has closed until status is final
             # because status doesn't become final as soon as stream closes
             status = self.status()
+            if status not in JOB_FINAL_STATES and self._status_poller is not None:
+                remaining = (
+                    None if timeout is None else timeout - (time.time() - start_time)
+                )
+                if not self._status_poller.wait(self, timeout=remaining):
+                    raise IBMJobTimeoutError(
+                        f"Timed out waiting for job to complete after {timeout} secs."
+                    )
+                return
             while status not in JOB_FINAL_STATES:
                 elapsed_time = time.time() - start_time
                 if timeout is not None and elapsed_time >= timeout:
@@ -623,10 +787,46 @@ class IBMCircuitJob(IBMJob):
                 time.sleep(3)
                 status = self.status()
         except futures.TimeoutError:
+            self._stop_streaming()
             raise IBMJobTimeoutError(
                 f"Timed out waiting for job to complete after {timeout} secs."
             )
 
+    def _start_streaming(self) -> None:
+        """Stream the job results through the websocket pool, if possible.
+
+        The stream is only started once, and only if the job is not yet in a
+        final state and the pool has a free connection. Otherwise the job
+        status is polled.
+        """
+        if self._ws_client_future is not None or self._status in JOB_FINAL_STATES:
+            return
+        if self._ws_pool is None:
+            logger.warning(
+                "Job %s is not attached to a provider websocket pool. Its status "
+                "will be polled instead of streamed.",
+                self.job_id(),
+            )
+            return
+        stream = self._ws_pool.stream(
+            websocket_url=self._api_client._params.get_runtime_api_base_url().replace(
+                "https", "wss"
+            ),
+            client_params=self._api_client._params,
+            job_id=self.job_id(),
+            message_queue=self._result_queue,
+        )
+        if stream is not None:
+            self._ws_client, self._ws_client_future = stream
+
+    def _stop_streaming(self) -> None:
+        """Close the websocket connection of the job, releasing it to the pool."""
+        if self._ws_client_future is None:
+            return
+        self._ws_pool.disconnect(self.job_id(), WebsocketClientCloseCode.CANCEL)
+        self._ws_client = None
+        self._ws_client_future = None
+
     def _is_streaming(self) -> bool:
         """Return whether job results are being streamed.
 
@@ -644,22 +844,57 @@ class IBMCircuitJob(IBMJob):
         Args:
             response: Response to check for url keyword, if available, download result from given URL
         """
+        if url := self._external_result_url(response):
+            with RangeDownload(url, timeout=self._download_timeout) as download:
+                return download.readall()
+        return response
+
+    def _download_and_decode_result(self, response: Any, columnar: bool = False) -> Any:
+        """Download and decode result from external URL.
+
+        The result is decoded while it is downloaded, without loading the whole
+        payload into memory first.
+
+        Args:
+            response: Response to check for url keyword, if available, download result from given URL
+            columnar: Whether to pack counts and memory into arrays while decoding.
+
+        Returns:
+            The decoded result if it was stored externally, else the input response.
+        """
+        if url := self._external_result_url(response):
+            decoder = ColumnarDecoder if columnar else RuntimeDecoder
+            with io.BufferedReader(
+                RangeDownload(url, timeout=self._download_timeout)
+            ) as stream:
+                return decode_result_stream(stream, decoder)
+        return response
+
+    @staticmethod
+    def _external_result_url(response: Any) -> Optional[str]:
+        """Return the URL of a result stored externally.
+
+        Args:
+            response: Response of the results endpoint.
+
+        Returns:
+            The URL of the result, or ``None`` if the response is the result itself.
+        """
         try:
             result_url_json = json.loads(response)
-            if "url" in result_url_json:
-                url = result_url_json["url"]
-                result_response = requests.get(url, timeout=10)
-                return result_response.content
-            return response
+            if isinstance(result_url_json, dict) and "url" in result_url_json:
+                return result_url_json["url"]
         except json.JSONDecodeError:
-            return response
+            pass
+        return None
 
-    def _retrieve_result(self, refresh: bool = False) -> None:
+    def _retrieve_result(self, refresh: bool = False, columnar: bool = False) -> None:
         """Retrieve the job result response.
 
         Args:
             refresh: If ``True``, re-query the server for the result.
                Otherwise return the cached value.
+            columnar: Whether to decode the result into a ``ColumnarResult``.
 
         Raises:
             IBMJobApiError: If an unexpected error occurred when communicating
@@ -678,11 +913,53 @@ class IBMCircuitJob(IBMJob):
                 if self._provider._runtime_client.job_type(self.job_id()) == "IQX":
                     api_result = self._api_client.job_result(self.job_id())
                 else:
-                    api_result = self._download_external_result(
-                        self._runtime_client.job_results(self.job_id())
+                    api_result = self._download_and_decode_result(
+                        self._runtime_client.job_results(self.job_id()),
+                        columnar=columnar,
+                    )
+
+                self._set_result(api_result, columnar=columnar)
+            except ApiError as err:
+                if self._status not in (JobStatus.ERROR, JobStatus.CANCELLED):
+                    raise IBMJobApiError(
+                        f"Unable to retrieve result for job {self.job_id()}: {str(err)}"
+                    ) from err
+
+    async def _aretrieve_result(
+        self, refresh: bool = False, columnar: bool = False
+    ) -> None:
+        """Asynchronously retrieve the job result response.
+
+        Args:
+            refresh: If ``True``, re-query the server for the result.
+               Otherwise return the cached value.
+            columnar: Whether to decode the result into a ``ColumnarResult``.
+
+        Raises:
+            IBMJobApiError: If an unexpected error occurred when communicating
+                with the server.
+        """
+        if self._api_status in (
+            ApiJobStatus.ERROR_CREATING_JOB.value,
+            ApiJobStatus.ERROR_VALIDATING_JOB.value,
+            ApiJobStatus.ERROR_TRANSPILING_JOB.value,
+        ):
+            # No results if job was never executed.
+            return
+
+        if not self._result or refresh:  # type: ignore[has-type]
+            async_client = self._get_async_runtime_client()
+            try:
+                if await async_client.job_type(self.job_id()) == "IQX":
+                    api_result = await asyncio.get_running_loop().run_in_executor(
+                        None, self._api_client.job_result, self.job_id()
                     )
+                else:
+                    api_result = await async_client.job_results(self.job_id())
+                    if url := self._external_result_url(api_result):
+                        api_result = await async_client.download(url)
 
-                self._set_result(api_result)
+                self._set_result(api_result, columnar=columnar)
             except ApiError as err:
                 if self._status not in (JobStatus.ERROR, JobStatus.CANCELLED):
                     raise IBMJobApiError(
@@ -705,11 +982,12 @@ class IBMCircuitJob(IBMJob):
         index = raw_data.rfind("Traceback")
         return f"Unknown error; {raw_data[index:]}" if index != -1 else None
 
-    def _set_result(self, raw_data: str) -> None:
+    def _set_result(self, raw_data: Union[str, Dict], columnar: bool = False) -> None:
         """Set the job result.
 
         Args:
-            raw_data: Raw result data.
+            raw_data: Raw result data, or result data already decoded from JSON.
+            columnar: Whether to decode the result into a ``ColumnarResult``.
 
         Raises:
             IBMJobInvalidStateError: If result is in an unsupported format.
@@ -722,8 +1000,11 @@ class IBMCircuitJob(IBMJob):
         # TODO: check whether client version can be extracted from runtime data
         # raw_data["client_version"] = self.client_version
         try:
-            data_dict = decode_result(raw_data, RuntimeDecoder)
-            self._result = Result.from_dict(data_dict)
+            # Columnar results are packed while the result is decoded.
+            decoder = ColumnarDecoder if columnar else RuntimeDecoder
+            data_dict = decode_result(raw_data, decoder)
+            result_cls = ColumnarResult if columnar else Result
+            self._result = result_cls.from_dict(data_dict)
         except (KeyError, TypeError) as err:
             if not self._kind:
                 raise IBMJobInvalidStateError(
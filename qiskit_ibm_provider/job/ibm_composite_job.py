@@ -14,6 +14,7 @@
 
 import copy
 import logging
+import random
 import re
 import threading
 import time
@@ -23,11 +24,10 @@ from collections import defaultdict
 from concurrent import futures
 from datetime import datetime
 from functools import wraps
-from typing import Dict, Optional, Tuple, Any, List, Callable, Union
+from typing import Dict, Optional, Tuple, Any, List, Callable, Union, Iterator, Set
 
 from qiskit.assembler.disassemble import disassemble
 from qiskit.circuit.quantumcircuit import QuantumCircuit
-from qiskit.compiler import assemble
 from qiskit.providers.jobstatus import JOB_FINAL_STATES, JobStatus
 from qiskit.providers.models import BackendProperties
 from qiskit.pulse import Schedule
@@ -53,7 +53,8 @@ from .queueinfo import QueueInfo
 from .sub_job import SubJob
 from .utils import auto_retry, JOB_STATUS_TO_INT, JobStatusQueueInfo, last_job_stat_pos
 from ..api.clients import AccountClient
-from ..exceptions import IBMBackendJobLimitError
+from ..api.exceptions import RequestsApiError
+from ..exceptions import IBMBackendApiError
 from ..utils.utils import validate_job_tags, api_status_to_job_status
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,16 @@ def _requires_submit(func):  # type: ignore
     return _wrapper
 
 
+def _is_job_limit_error(err: Exception) -> bool:
+    """Return whether a submission failed because the job limit was reached.
+
+    The server refuses new jobs with a ``429 Too Many Requests`` status code
+    while the maximum number of active jobs is reached.
+    """
+    cause = err.__cause__
+    return isinstance(cause, RequestsApiError) and cause.status_code == 429
+
+
 class IBMCompositeJob(IBMJob):
     """Representation of a set of jobs that execute on an IBM Quantum backend.
 
@@ -118,6 +129,9 @@ class IBMCompositeJob(IBMJob):
     _executor = futures.ThreadPoolExecutor()
     """Threads used for asynchronous processing."""
 
+    _max_backoff = 300.0
+    """Maximum number of seconds to wait between submit attempts."""
+
     def __init__(
         self,
         backend: "ibm_backend.IBMBackend",
@@ -132,6 +146,10 @@ class IBMCompositeJob(IBMJob):
         name: Optional[str] = None,
         tags: Optional[List[str]] = None,
         client_version: Optional[Dict] = None,
+        max_in_flight: int = 5,
+        submit_retries: int = 3,
+        retry_backoff: float = 1.0,
+        job_limit_backoff: float = 10.0,
     ) -> None:
         """IBMCompositeJob constructor.
 
@@ -146,6 +164,17 @@ class IBMCompositeJob(IBMJob):
             name: Job name.
             tags: Job tags.
             client_version: Client used for the job.
+            max_in_flight: Maximum number of sub-jobs uploaded at the same time.
+                The next sub-jobs are validated and encoded while these are
+                uploaded.
+            submit_retries: Number of times the submission of a sub-job is
+                retried after a server error.
+            retry_backoff: Base number of seconds to wait before retrying the
+                submission of a sub-job. The wait doubles after each attempt and
+                is randomized to spread the retries of concurrent sub-jobs.
+            job_limit_backoff: Base number of seconds to pause all submissions
+                when the job limit of the backend is reached. The pause doubles
+                each time the limit is reached again without a successful submit.
 
         Raises:
             IBMJobInvalidStateError: If one or more subjobs is missing.
@@ -175,6 +204,15 @@ class IBMCompositeJob(IBMJob):
 
         # Properties used for job submit.
         self._sub_jobs: List[SubJob] = []
+        self._run_config = run_config or {}
+        self._max_in_flight = max_in_flight
+        self._submit_retries = submit_retries
+        self._retry_backoff = retry_backoff
+        self._job_limit_backoff = job_limit_backoff
+        self._job_limit_lock = threading.Lock()
+        self._job_limit_hits = 0
+        self._job_limit_until = 0.0
+        self._cancel_event = threading.Event()
 
         # Properties used for caching.
         self._user_cancelled = False
@@ -185,6 +223,13 @@ class IBMCompositeJob(IBMJob):
         self._result: Optional[Result] = None
         self._circuits = None
 
+        # Properties used for incremental result merging.
+        self._combined_result: Optional[Result] = None
+        self._merged_jobs: Set[int] = set()
+        self._ref_expr_fields: Dict[str, Any] = dict.fromkeys(
+            ["shots", "meas_level", "seed", "meas_return"]
+        )
+
         # Properties used for wait_for_final_state callback.
         self._callback_lock = threading.Lock()
         self._user_callback: Optional[Callable] = None
@@ -199,7 +244,7 @@ class IBMCompositeJob(IBMJob):
 
         if circuits_list is not None:
             self._circuits = [circ for sublist in circuits_list for circ in sublist]
-            self._submit_circuits(circuits_list, run_config)
+            self._submit_circuits(circuits_list)
         else:
             # Validate the jobs.
             total = 0
@@ -260,100 +305,105 @@ class IBMCompositeJob(IBMJob):
     def _submit_circuits(
         self,
         circuit_lists: List[Union[List[QuantumCircuit], List[Schedule]]],
-        run_config: Dict,
     ) -> None:
         """Assemble and submit circuits.
 
         Args:
             circuit_lists: List of circuits to submit.
-            run_config: Configuration used for assembling.
         """
-        # Assemble all circuits first before submitting them with threads to
-        # avoid conflicts with terra assembler.
         exp_index = 0
-        logger.debug("Assembling all circuits.")
         for idx, circs in enumerate(circuit_lists):
-            qobj = assemble(circs, backend=self.backend(), **run_config)
             self._sub_jobs.append(
                 SubJob(
                     start_index=exp_index,
                     end_index=exp_index + len(circs) - 1,
                     job_index=idx,
                     total=len(circuit_lists),
-                    qobj=qobj,
+                    circuits=circs,
                 )
             )
             exp_index += len(circs)
-        self._sub_jobs[0].event.set()  # Tell the first job it can now be submitted.
+        self._start_submit(self._sub_jobs)
 
-        for sub_job in self._sub_jobs:
-            sub_job.future = self._executor.submit(self._async_submit, sub_job=sub_job)
+    def _start_submit(self, sub_jobs: List[SubJob]) -> None:
+        """Start the submission pipeline for the input sub-jobs.
 
-    def _async_submit(self, sub_job: SubJob) -> None:
-        """Submit a Qobj asynchronously.
+        Args:
+            sub_jobs: Sub-jobs to submit.
+        """
+        for sub_job in sub_jobs:
+            # Completed by the pipeline once the sub-job is submitted.
+            sub_job.future = futures.Future()
+        threading.Thread(
+            target=self._submit_pipeline, args=(sub_jobs,), daemon=True
+        ).start()
+
+    def _submit_pipeline(self, sub_jobs: List[SubJob]) -> None:
+        """Prepare sub-jobs in order and upload them concurrently.
+
+        Sub-jobs are validated and encoded one at a time, by
+        :meth:`IBMBackend._prepare_run`, while the previously prepared ones are
+        uploaded, with at most ``max_in_flight`` uploads at once.
+
+        Args:
+            sub_jobs: Sub-jobs to submit.
+        """
+        window = threading.BoundedSemaphore(self._max_in_flight)
+        for sub_job in sub_jobs:
+            if self._user_cancelled:
+                sub_job.future.set_result(None)
+                continue
+            if sub_job.prepared is None and sub_job.circuits is not None:
+                logger.debug("Preparing circuits for sub-job %s.", sub_job.job_index)
+                try:
+                    sub_job.prepared = self.backend()._prepare_run(
+                        sub_job.circuits,
+                        job_tags=self._sub_job_tags(sub_job),
+                        **self._run_config,
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    self._submit_failed(sub_job, err)
+                    continue
+            window.acquire()
+            try:
+                upload = self._executor.submit(self._async_submit, sub_job=sub_job)
+            except Exception:
+                window.release()
+                raise
+            upload.add_done_callback(lambda _: window.release())
+
+    def _sub_job_tags(self, sub_job: SubJob) -> List[str]:
+        """Return the tags of a sub-job, which identify its composite job and index.
 
         Args:
             sub_job: A sub job.
 
-        Raises:
-            Exception: If submit failed.
+        Returns:
+            The tags of the sub-job.
+        """
+        return [*self._tags, sub_job.format_tag(self._index_tag), self.job_id()]
+
+    def _async_submit(self, sub_job: SubJob) -> None:
+        """Submit a prepared sub-job asynchronously.
+
+        The outcome of the submission is set on the future of the sub-job.
+
+        Args:
+            sub_job: A sub job.
         """
-        tags = self._tags.copy()
-        tags.append(sub_job.format_tag(self._index_tag))
-        tags.append(self.job_id())
-        job: Optional[IBMCircuitJob] = None
         logger.debug(
             "Submitting job %s for circuits %s-%s.",
             sub_job.job_index,
             sub_job.start_index,
             sub_job.end_index,
         )
-        sub_job.event.wait()
-
         try:
-            while job is None:
-                if self._user_cancelled:
-                    return  # Abandon submit if user cancelled.
-                try:
-                    job = auto_retry(
-                        self.backend()._submit_job,
-                        qobj=sub_job.qobj,
-                        job_name=self._name,
-                        job_tags=tags,
-                        composite_job_id=self.job_id(),
-                    )
-                except IBMBackendJobLimitError:
-                    if oldest_running := self._provider.backend.jobs(
-                        limit=1,
-                        descending=False,
-                        status=list(set(JobStatus) - set(JOB_FINAL_STATES)),
-                    ):
-                        oldest_running = oldest_running[0]
-                        logger.warning(
-                            "Job limit reached, waiting for job %s to finish "
-                            "before submitting the next one.",
-                            oldest_running.job_id(),
-                        )
-                        try:
-                            # Set a timeout in case the job is stuck.
-                            oldest_running.wait_for_final_state(timeout=300)
-                        except Exception as err:  # pylint: disable=broad-except
-                            # Don't kill the submit if unable to wait for old job.
-                            logger.debug(
-                                "An error occurred while waiting for "
-                                "job %s to finish: %s",
-                                oldest_running.job_id(),
-                                err,
-                            )
-                except Exception as err:  # pylint: disable=broad-except
-                    sub_job.submit_error = err
-                    logger.debug(
-                        "An error occurred submitting sub-job %s: %s",
-                        sub_job.job_index,
-                        traceback.format_exc(),
-                    )
-                    raise
+            job = self._submit_with_retry(sub_job)
+        except Exception as err:  # pylint: disable=broad-except
+            self._submit_failed(sub_job, err)
+            return
 
+        if job is not None:
             if self._user_cancelled:
                 job.cancel()
             sub_job.job = job
@@ -363,16 +413,104 @@ class IBMCompositeJob(IBMJob):
                 sub_job.start_index,
                 sub_job.end_index,
             )
-        finally:
+        sub_job.future.set_result(job)
+
+    def _submit_with_retry(self, sub_job: SubJob) -> Optional[IBMCircuitJob]:
+        """Submit a sub-job, retrying on server errors and when the job limit is reached.
+
+        Args:
+            sub_job: A prepared sub job.
+
+        Returns:
+            The submitted job, or ``None`` if the user cancelled the submission.
+        """
+        attempt = 0
+        while not self._user_cancelled:
+            self._wait_for_job_limit()
+            if self._user_cancelled:
+                break
             try:
-                # Wake up the next submit.
-                next(
-                    sub_job.event
-                    for sub_job in self._sub_jobs
-                    if not sub_job.event.is_set()
-                ).set()
-            except StopIteration:
-                pass
+                job = self.backend()._runtime_run(**sub_job.prepared)
+            except (IBMJobApiError, IBMBackendApiError) as err:
+                if _is_job_limit_error(err):
+                    delay = self._job_limit_reached()
+                    logger.warning(
+                        "Job limit reached, pausing the submission of sub-job %s "
+                        "for %.1f seconds.",
+                        sub_job.job_index,
+                        delay,
+                    )
+                    continue
+                attempt += 1
+                if attempt > self._submit_retries:
+                    raise
+                delay = self._backoff_delay(self._retry_backoff, attempt)
+                logger.debug(
+                    "An error occurred submitting sub-job %s, retrying in "
+                    "%.1f seconds: %s",
+                    sub_job.job_index,
+                    delay,
+                    err,
+                )
+                self._cancel_event.wait(delay)
+            else:
+                with self._job_limit_lock:
+                    self._job_limit_hits = 0
+                return job
+        return None  # Abandon submit if user cancelled.
+
+    def _submit_failed(self, sub_job: SubJob, err: Exception) -> None:
+        """Record the failed submission of a sub-job.
+
+        Args:
+            sub_job: A sub job.
+            err: Submit error.
+        """
+        sub_job.submit_error = err
+        logger.debug(
+            "An error occurred submitting sub-job %s: %s",
+            sub_job.job_index,
+            "".join(traceback.format_exception(type(err), err, err.__traceback__)),
+        )
+        sub_job.future.set_exception(err)
+
+    def _job_limit_reached(self) -> float:
+        """Pause all submissions after the job limit of the backend is reached.
+
+        Returns:
+            Number of seconds until submissions resume.
+        """
+        with self._job_limit_lock:
+            now = time.monotonic()
+            if self._job_limit_until <= now:
+                # Only escalate the backoff once per pause, not once per sub-job.
+                self._job_limit_hits += 1
+                self._job_limit_until = now + self._backoff_delay(
+                    self._job_limit_backoff, self._job_limit_hits
+                )
+            return self._job_limit_until - now
+
+    def _wait_for_job_limit(self) -> None:
+        """Block while submissions are paused because of the job limit."""
+        while not self._user_cancelled:
+            with self._job_limit_lock:
+                remaining = self._job_limit_until - time.monotonic()
+            if remaining <= 0:
+                return
+            self._cancel_event.wait(remaining)
+
+    def _backoff_delay(self, base: float, attempt: int) -> float:
+        """Return a randomized exponential backoff delay.
+
+        Args:
+            base: Delay of the first attempt.
+            attempt: Number of the attempt, starting at 1.
+
+        Returns:
+            Number of seconds to wait.
+        """
+        delay = min(self._max_backoff, base * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
 
     @_requires_submit
     def properties(self) -> Optional[Union[List[BackendProperties], BackendProperties]]:
@@ -428,12 +566,13 @@ class IBMCompositeJob(IBMJob):
             having been consumed.
 
         Note:
-            When `partial=True`, this method will attempt to retrieve partial
-            results of failed jobs. In this case, precaution should
-            be taken when accessing individual experiments, as doing so might
-            cause an exception. The ``success`` attribute of the returned
-            :class:`~qiskit.result.Result` instance can be used to verify
-            whether it contains partial results.
+            When `partial=True`, this method returns the results of the sub-jobs
+            that completed, even if other sub-jobs failed or were cancelled. The
+            experiments of those other sub-jobs are unsuccessful and have no data,
+            so precaution should be taken when accessing individual experiments,
+            as doing so might cause an exception. The ``success`` attribute of
+            the returned :class:`~qiskit.result.Result` instance can be used to
+            verify whether it contains partial results.
 
             For example, if one of the circuits in the job failed, trying to
             get the counts of the unsuccessful circuit would raise an exception
@@ -450,9 +589,9 @@ class IBMCompositeJob(IBMJob):
             timeout: Number of seconds to wait for job.
             wait: Time in seconds between queries.
             partial: If ``True``, return partial results if possible. Partial results
-                refer to experiments within a sub-job, not individual sub-jobs.
-                That is, this method will still block until all sub-jobs finish
-                even if `partial` is set to ``True``.
+                refer to the results of the sub-jobs that completed. This method
+                still blocks until all sub-jobs finish even if `partial` is set
+                to ``True``.
             refresh: If ``True``, re-query the server for the result. Otherwise
                 return the cached value.
 
@@ -485,6 +624,76 @@ class IBMCompositeJob(IBMJob):
             f"Unable to retrieve result for job {self.job_id()}. Job has failed{error_message}"
         )
 
+    def iter_results(
+        self,
+        timeout: Optional[float] = None,
+    ) -> Iterator[ExperimentResult]:
+        """Yield the experiment results of the sub-jobs as they complete.
+
+        Unlike :meth:`result()`, this method does not wait for all sub-jobs to
+        finish. The experiment results of each sub-job are yielded as soon as
+        it reaches a final state, in the order the sub-jobs complete. Use the
+        ``header`` of each experiment result to identify its circuit.
+
+        The results are also merged into the combined result returned by
+        :meth:`result()`, so they are not retrieved again.
+
+        Note:
+            Experiments of sub-jobs that did not complete successfully are
+            yielded as experiment results whose ``success`` attribute is ``False``.
+
+        Args:
+            timeout: Seconds to wait for all the sub-jobs, counted from the call
+                to this method. If ``None``, wait indefinitely.
+
+        Yields:
+            Experiment results.
+
+        Raises:
+            IBMJobTimeoutError: If not all sub-jobs finished before the timeout.
+            IBMJobApiError: If an unexpected error occurred when communicating
+                with the server.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.block_for_submit()
+        pending = {
+            self._executor.submit(self._wait_for_sub_job, sub_job, deadline): sub_job
+            for sub_job in self._sub_jobs
+            if sub_job.job
+        }
+        for future in futures.as_completed(pending):
+            try:
+                future.result()
+            except IBMJobTimeoutError:
+                raise IBMJobTimeoutError(
+                    f"Timeout waiting for job {self.job_id()}"
+                ) from None
+            sub_job = pending[future]
+            experiments = self._merge_sub_result(sub_job, refresh=False)
+            if experiments is None:
+                experiments = self._failed_experiment_results(sub_job)
+            yield from experiments
+
+        self._update_status_queue_info_error()
+        for sub_job in self._sub_jobs:
+            if not sub_job.job:
+                yield from self._failed_experiment_results(sub_job)
+
+    @staticmethod
+    def _wait_for_sub_job(sub_job: SubJob, deadline: Optional[float]) -> None:
+        """Wait for a sub-job to reach a final state.
+
+        Args:
+            sub_job: A submitted sub-job.
+            deadline: Time, as given by :func:`time.monotonic`, by which the
+                sub-job must finish. If ``None``, wait indefinitely.
+
+        Raises:
+            IBMJobTimeoutError: If the sub-job did not finish by the deadline.
+        """
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        sub_job.job.wait_for_final_state(timeout=timeout)
+
     def cancel(self) -> bool:
         """Attempt to cancel the job.
 
@@ -501,8 +710,7 @@ class IBMCompositeJob(IBMJob):
         """
         self._user_cancelled = True
         # Wake up all pending job submits.
-        for sub_job in self._sub_jobs:
-            sub_job.event.set()
+        self._cancel_event.set()
 
         all_cancelled = []
         for job in self._get_circuit_jobs():
@@ -1017,23 +1225,20 @@ class IBMCompositeJob(IBMJob):
             returned by :meth:`qiskit_ibm_provider.IBMBackend.run` and not
             retrieved from the server.
         """
-        for sub_job in self._sub_jobs:
-            if sub_job.submit_error is not None or (
+        failed = [
+            sub_job
+            for sub_job in self._sub_jobs
+            if sub_job.submit_error is not None
+            or (
                 sub_job.job
                 and sub_job.job.status() in [JobStatus.ERROR, JobStatus.CANCELLED]
-            ):
-                sub_job.reset()
-                sub_job.future = self._executor.submit(
-                    self._async_submit, sub_job=sub_job
-                )
-        try:
-            next(
-                sub_job.event
-                for sub_job in self._sub_jobs
-                if not sub_job.event.is_set()
-            ).set()
-        except StopIteration:
-            pass
+            )
+        ]
+        for sub_job in failed:
+            sub_job.reset()
+            self._merged_jobs.discard(sub_job.job_index)
+        if failed:
+            self._start_submit(failed)
         self._status = JobStatus.INITIALIZING
 
     def block_for_submit(self) -> None:
@@ -1093,6 +1298,14 @@ class IBMCompositeJob(IBMJob):
         if self._status is JobStatus.ERROR and self._job_error_msg:
             return
 
+        # Refresh the sub-job statuses in bulk so the status() calls below
+        # are served from cache instead of one request per sub-job.
+        circuit_jobs = self._get_circuit_jobs()
+        if poller := next(
+            (job._status_poller for job in circuit_jobs if job._status_poller), None
+        ):
+            poller.refresh(circuit_jobs)
+
         statuses: Dict[JobStatus, List[SubJob]] = defaultdict(list)
         for sub_job in self._sub_jobs:
             if sub_job.job:
@@ -1174,9 +1387,7 @@ class IBMCompositeJob(IBMJob):
             IBMJobInvalidStateError: If a sub-job is missing proper tags.
         """
         if index_tag := [
-            tag
-            for tag in job.tags()
-            if tag.startswith(IBM_COMPOSITE_JOB_INDEX_PREFIX)
+            tag for tag in job.tags() if tag.startswith(IBM_COMPOSITE_JOB_INDEX_PREFIX)
         ]:
             match = re.match(self._index_pattern, index_tag[0])
         else:
@@ -1205,13 +1416,18 @@ class IBMCompositeJob(IBMJob):
     def _gather_results(self, refresh: bool, partial: bool) -> Optional[Result]:
         """Retrieve the job result response.
 
+        Results of the sub-jobs are merged into the combined result as they are
+        retrieved, so only sub-jobs whose results were not merged yet are queried.
+
         Args:
             refresh: If ``True``, re-query the server for the result.
                Otherwise return the cached value.
-            partial: Whether partial result should be collected.
+            partial: Whether to return the combined result even if some
+                sub-jobs have no result.
 
         Returns:
-            Combined job result, or ``None`` if not all sub-jobs have finished.
+            Combined job result, or ``None`` if not all sub-jobs have a result
+            and `partial` is ``False``.
 
         Raises:
             IBMJobApiError: If an unexpected error occurred when communicating
@@ -1220,52 +1436,95 @@ class IBMCompositeJob(IBMJob):
         if self._result and not refresh:
             return self._result
 
-        job_results = [
-            sub_job.result(refresh=refresh, partial=partial)
+        for sub_job in self._sub_jobs:
+            self._merge_sub_result(sub_job, refresh=refresh)
+
+        missing = [
+            sub_job
             for sub_job in self._sub_jobs
+            if sub_job.job_index not in self._merged_jobs
         ]
-
-        if not partial and any(result is None for result in job_results):
-            return None
-        try:
-            good_result = next(res for res in job_results if res is not None).to_dict()
-        except StopIteration:
+        if self._combined_result is None or (missing and not partial):
             return None
 
-        ref_expr_result = good_result["results"][0]
-        template_expr_result = {"success": False, "data": {}, "status": "ERROR"}
-        for key in ["shots", "meas_level", "seed", "meas_return"]:
-            template_expr_result[key] = ref_expr_result.get(key, None)
-
-        good_result["job_id"] = self.job_id()
-        good_result["success"] = self._status == JobStatus.DONE
-        good_result["results"] = []
-        good_result["status"] = (
+        combined_result = self._combined_result
+        for sub_job in missing:
+            combined_result.results[
+                sub_job.start_index : sub_job.end_index + 1
+            ] = self._failed_experiment_results(sub_job)
+        combined_result.success = self._status == JobStatus.DONE
+        combined_result.status = (
             "PARTIAL COMPLETED" if self._status != JobStatus.DONE else "COMPLETED"
         )
-        combined_result = Result.from_dict(good_result)
+        return combined_result
 
-        for idx, result in enumerate(job_results):
-            if result is not None:
-                combined_result.results.extend(result.results)
-            else:
-                # Get experiment header from Qobj if possible.
-                sub_job = self._sub_jobs[idx]
-                qobj = sub_job.qobj
-                experiments = qobj.experiments if qobj else None
-
-                expr_results = []
-                for circ_idx in range(sub_job.end_index - sub_job.start_index + 1):
-                    if experiments:
-                        template_expr_result["header"] = experiments[
-                            circ_idx
-                        ].header.to_dict()
-                    expr_results.append(
-                        ExperimentResult.from_dict(template_expr_result)
-                    )
-                combined_result.results.extend(expr_results)
+    def _merge_sub_result(
+        self, sub_job: SubJob, refresh: bool
+    ) -> Optional[List[ExperimentResult]]:
+        """Merge the result of a sub-job into the combined result.
 
-        return combined_result
+        The experiment results of the sub-job replace the slots of its circuits
+        in the combined result, without copying the results of other sub-jobs.
+
+        Args:
+            sub_job: A sub job.
+            refresh: If ``True``, re-query the server for the result.
+
+        Returns:
+            Experiment results of the sub-job, or ``None`` if its result is
+            not available.
+        """
+        positions = slice(sub_job.start_index, sub_job.end_index + 1)
+        if sub_job.job_index in self._merged_jobs and not refresh:
+            return self._combined_result.results[positions]
+
+        result = sub_job.result(refresh=refresh)
+        if result is None:
+            return None
+
+        if self._combined_result is None:
+            self._combined_result = Result(
+                backend_name=result.backend_name,
+                backend_version=result.backend_version,
+                qobj_id=result.qobj_id,
+                job_id=self.job_id(),
+                success=False,
+                results=[None] * (self._sub_jobs[-1].end_index + 1),
+                date=result.date,
+                header=result.header,
+                **result._metadata,
+            )
+            ref_expr_result = result.results[0].to_dict()
+            for key in self._ref_expr_fields:
+                self._ref_expr_fields[key] = ref_expr_result.get(key, None)
+
+        self._combined_result.results[positions] = result.results
+        self._merged_jobs.add(sub_job.job_index)
+        return result.results
+
+    def _failed_experiment_results(self, sub_job: SubJob) -> List[ExperimentResult]:
+        """Return placeholder experiment results for a sub-job without result.
+
+        Args:
+            sub_job: A sub job.
+
+        Returns:
+            Unsuccessful experiment results for the circuits of the sub-job.
+        """
+        template_expr_result = {"success": False, "data": {}, "status": "ERROR"}
+        template_expr_result.update(self._ref_expr_fields)
+
+        # Get experiment header from the circuits if possible.
+        expr_results = []
+        for circ_idx in range(sub_job.end_index - sub_job.start_index + 1):
+            if sub_job.circuits:
+                circuit = sub_job.circuits[circ_idx]
+                template_expr_result["header"] = {
+                    "name": circuit.name,
+                    "metadata": circuit.metadata,
+                }
+            expr_results.append(ExperimentResult.from_dict(template_expr_result))
+        return expr_results
 
     def _get_qobj(self) -> Optional[Union[QasmQobj, PulseQobj]]:
         """Return the Qobj for this job.
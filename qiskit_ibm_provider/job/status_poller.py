@@ -0,0 +1,331 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Batched status polling for IBM Quantum circuit jobs."""
+
+import logging
+import threading
+import time
+import weakref
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Iterable
+
+from qiskit.providers.jobstatus import JOB_FINAL_STATES, JobStatus
+
+from qiskit_ibm_provider.job import ibm_circuit_job  # pylint: disable=unused-import
+from .utils import api_to_job_error
+from ..api.clients import RuntimeClient
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatusPoller:
+    """Coalesce the status queries of many live circuit jobs into bulk requests.
+
+    Every :class:`~qiskit_ibm_provider.job.IBMCircuitJob` created through an
+    :class:`~qiskit_ibm_provider.IBMProvider` is registered with the provider's
+    poller. Instead of each job issuing its own ``job_get`` request, the poller
+    periodically lists the pending jobs of the account and fans the statuses
+    back to the registered jobs. Jobs that disappear from the pending list are
+    queried individually once, to pick up their final state.
+
+    Waiting on a job with
+    :meth:`~qiskit_ibm_provider.job.IBMCircuitJob.wait_for_final_state`
+    subscribes it to the poller's background thread, which only runs while
+    there are subscribers.
+    """
+
+    _CREATION_DATE_SLACK = timedelta(minutes=5)
+    """Margin used for the creation date filter of jobs without a known creation date."""
+
+    def __init__(
+        self,
+        runtime_client: RuntimeClient,
+        interval: float = 3,
+        page_size: int = 50,
+        min_bulk_size: int = 10,
+    ) -> None:
+        """JobStatusPoller constructor.
+
+        Args:
+            runtime_client: Client used to query job statuses.
+            interval: Seconds between two status sweeps. A status obtained by a
+                sweep is also considered current for this long.
+            page_size: Number of jobs requested per page of a bulk query.
+            min_bulk_size: Minimum number of pending jobs for a sweep to use bulk
+                queries. Smaller sweeps query each job individually.
+        """
+        self._runtime_client = runtime_client
+        self.interval = interval
+        self.page_size = page_size
+        self.min_bulk_size = min_bulk_size
+
+        self._lock = threading.RLock()
+        self._jobs: "weakref.WeakValueDictionary[str, ibm_circuit_job.IBMCircuitJob]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._registered_at: Dict[str, datetime] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        self._subscribers: Dict[str, threading.Event] = {}
+        self._waiters: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._request_count = 0
+
+    def register(self, job: "ibm_circuit_job.IBMCircuitJob") -> None:
+        """Register a job with this poller.
+
+        Args:
+            job: The job to register.
+        """
+        job_id = job.job_id()
+        with self._lock:
+            self._jobs[job_id] = job
+            if job_id not in self._registered_at:
+                self._registered_at[job_id] = datetime.now(timezone.utc)
+                # The job is only weakly referenced, drop its entries once it is gone.
+                weakref.finalize(job, self._forget_collected, job_id)
+        job._status_poller = self
+
+    def unregister(self, job: "ibm_circuit_job.IBMCircuitJob") -> None:
+        """Remove a job from this poller.
+
+        Args:
+            job: The job to remove.
+        """
+        job_id = job.job_id()
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._forget(job_id)
+            event = self._subscribers.pop(job_id, None)
+        if event is not None:
+            event.set()
+        if job._status_poller is self:
+            job._status_poller = None
+
+    def is_current(self, job: "ibm_circuit_job.IBMCircuitJob") -> bool:
+        """Return whether the cached status of a job was refreshed recently.
+
+        Args:
+            job: The job to check.
+
+        Returns:
+            ``True`` if the job status was updated by a sweep within the last
+            ``interval`` seconds.
+        """
+        refreshed_at = self._refreshed_at.get(job.job_id())
+        return (
+            refreshed_at is not None and time.monotonic() - refreshed_at < self.interval
+        )
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of status requests sent to the server by this poller."""
+        return self._request_count
+
+    def refresh(
+        self, jobs: Optional[Iterable["ibm_circuit_job.IBMCircuitJob"]] = None
+    ) -> Dict[str, JobStatus]:
+        """Update the status of the given jobs with as few requests as possible.
+
+        Jobs that are not yet registered are registered first. Jobs whose status
+        is current, or already final, are not queried again.
+
+        Args:
+            jobs: Jobs to update. If ``None``, all registered jobs are updated.
+
+        Returns:
+            The status of each job, keyed by job ID.
+
+        Raises:
+            IBMJobApiError: If an unexpected error occurred when communicating
+                with the server.
+        """
+        if jobs is None:
+            with self._lock:
+                jobs = list(self._jobs.values())
+        else:
+            jobs = list(jobs)
+            for job in jobs:
+                if job._status_poller is not self:
+                    self.register(job)
+
+        stale = [
+            job
+            for job in jobs
+            if job._status not in JOB_FINAL_STATES and not self.is_current(job)
+        ]
+        if len(stale) >= self.min_bulk_size:
+            self._bulk_update(stale)
+        else:
+            for job in stale:
+                self._single_update(job)
+        return {job.job_id(): job._status for job in jobs}
+
+    def wait(
+        self, job: "ibm_circuit_job.IBMCircuitJob", timeout: Optional[float] = None
+    ) -> bool:
+        """Block until a job reaches a final state.
+
+        Args:
+            job: The job to wait for.
+            timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
+
+        Returns:
+            ``True`` if the job reached a final state, ``False`` if the wait
+            timed out.
+        """
+        if job._status in JOB_FINAL_STATES:
+            return True
+        if job._status_poller is not self:
+            self.register(job)
+        job_id = job.job_id()
+        with self._lock:
+            event = self._subscribers.setdefault(job_id, threading.Event())
+            self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="ibm-job-status-poller", daemon=True
+                )
+                self._thread.start()
+        event.wait(timeout)
+        with self._lock:
+            self._waiters[job_id] -= 1
+            if not self._waiters[job_id]:
+                # Stop polling the job once nobody waits for it anymore.
+                del self._waiters[job_id]
+                if self._subscribers.get(job_id) is event:
+                    del self._subscribers[job_id]
+        return job._status in JOB_FINAL_STATES
+
+    def _run(self) -> None:
+        """Sweep subscribed jobs until none are left."""
+        while True:
+            with self._lock:
+                jobs = [
+                    job
+                    for job in (self._jobs.get(job_id) for job_id in self._subscribers)
+                    if job is not None
+                ]
+                # Subscribers whose job has been garbage collected can't finish.
+                for job_id in list(self._subscribers):
+                    if job_id not in self._jobs:
+                        self._subscribers.pop(job_id).set()
+                if not jobs:
+                    self._thread = None
+                    return
+            try:
+                self.refresh(jobs)
+            except Exception as err:  # pylint: disable=broad-except
+                # Keep polling. Waiters time out on their own if this persists.
+                logger.debug("Unable to refresh job statuses: %s", err)
+            with self._lock:
+                for job in jobs:
+                    if job._status in JOB_FINAL_STATES:
+                        self._forget(job.job_id())
+                        event = self._subscribers.pop(job.job_id(), None)
+                        if event is not None:
+                            event.set()
+            time.sleep(self.interval)
+
+    def _forget(self, job_id: str) -> None:
+        """Drop the registration and refresh dates of a job.
+
+        Args:
+            job_id: ID of the job.
+        """
+        with self._lock:
+            self._registered_at.pop(job_id, None)
+            self._refreshed_at.pop(job_id, None)
+
+    def _forget_collected(self, job_id: str) -> None:
+        """Drop the dates of a garbage collected job, unless it was registered again.
+
+        Args:
+            job_id: ID of the job.
+        """
+        with self._lock:
+            if self._jobs.get(job_id) is None:
+                self._forget(job_id)
+
+    def _creation_date(self, job: "ibm_circuit_job.IBMCircuitJob") -> datetime:
+        """Return a lower bound of the creation date of a job, in UTC.
+
+        Args:
+            job: The job to check.
+
+        Returns:
+            The job creation date if known, otherwise the registration date
+            minus a safety margin.
+        """
+        if job._creation_date is not None:
+            return job._creation_date
+        registered_at = self._registered_at.get(
+            job.job_id(), datetime.now(timezone.utc)
+        )
+        return registered_at - self._CREATION_DATE_SLACK
+
+    def _single_update(self, job: "ibm_circuit_job.IBMCircuitJob") -> None:
+        """Update the status of a single job.
+
+        Args:
+            job: The job to update.
+        """
+        with api_to_job_error():
+            self._request_count += 1
+            api_response = self._runtime_client.job_get(job.job_id())["state"]
+        job._update_status(api_response["status"])
+        with self._lock:
+            self._refreshed_at[job.job_id()] = time.monotonic()
+
+    def _bulk_update(self, jobs: List["ibm_circuit_job.IBMCircuitJob"]) -> None:
+        """Update the status of many jobs through paginated job listings.
+
+        Jobs are grouped by backend, and each backend's pending jobs created
+        after the oldest job of the group are listed. Jobs missing from the
+        listings are no longer pending and are queried individually.
+
+        Args:
+            jobs: Jobs to update.
+        """
+        by_backend: Dict[str, Dict[str, "ibm_circuit_job.IBMCircuitJob"]] = defaultdict(
+            dict
+        )
+        for job in jobs:
+            by_backend[job.backend().name][job.job_id()] = job
+
+        for backend_name, remaining in by_backend.items():
+            created_after = min(self._creation_date(job) for job in remaining.values())
+            skip = 0
+            while remaining:
+                with api_to_job_error():
+                    self._request_count += 1
+                    job_page = self._runtime_client.jobs_get(
+                        limit=self.page_size,
+                        skip=skip,
+                        pending=True,
+                        created_after=created_after,
+                        backend=backend_name,
+                    )["jobs"]
+                now = time.monotonic()
+                for job_info in job_page:
+                    job = remaining.pop(job_info["id"], None)
+                    if job is not None:
+                        job._update_status(job_info["status"])
+                        with self._lock:
+                            self._refreshed_at[job.job_id()] = now
+                if len(job_page) < self.page_size:
+                    break
+                skip += len(job_page)
+
+            for job in remaining.values():
+                self._single_update(job)
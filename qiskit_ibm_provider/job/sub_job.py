@@ -12,10 +12,11 @@
 
 """IBM Quantum sub job."""
 
-import threading
 from concurrent.futures import Future
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.pulse import Schedule
 from qiskit.qobj import QasmQobj, PulseQobj
 from qiskit.result import Result
 
@@ -39,6 +40,7 @@ class SubJob:
         total: int,
         qobj: Optional[Union[QasmQobj, PulseQobj]] = None,
         job: IBMCircuitJob = None,
+        circuits: Optional[Union[List[QuantumCircuit], List[Schedule]]] = None,
     ) -> None:
         """SubJob constructor.
 
@@ -49,6 +51,7 @@ class SubJob:
             total: Total number of jobs.
             qobj: Qobj for this job.
             job: Circuit job.
+            circuits: Circuits of this job.
         """
         self.start_index = start_index
         self.end_index = end_index
@@ -56,7 +59,9 @@ class SubJob:
         self.total_jobs = total
         self._qobj = qobj
         self._job = job
-        self.event = threading.Event()
+        self.circuits = circuits
+        # Arguments of ``IBMBackend._runtime_run`` once the circuits are prepared.
+        self.prepared: Optional[Dict[str, Any]] = None
         self._submit_error: Optional[Exception] = None
         self.future: Optional[Future] = None
 
@@ -129,14 +134,12 @@ class SubJob:
         self.future = None
         self.job = None
         self.submit_error = None
-        self.event.clear()
 
-    def result(self, refresh: bool, partial: bool) -> Optional[Result]:
+    def result(self, refresh: bool) -> Optional[Result]:
         """Return job result.
 
         Args:
             refresh: If ``True``, re-query the server for the result.
-            partial: If ``True``, return partial results if possible.
 
         Returns:
             Job result or ``None`` if job result is not available.
@@ -144,7 +147,7 @@ class SubJob:
         if not self.job:
             return None
         try:
-            return auto_retry(self.job.result, refresh=refresh, partial=partial)
+            return auto_retry(self.job.result, refresh=refresh)
         except (IBMJobFailureError, IBMJobInvalidStateError):
             return None
 
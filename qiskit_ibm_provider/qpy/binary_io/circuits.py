@@ -14,6 +14,7 @@
 
 """Binary IO for circuit objects."""
 
+import functools
 import io
 import json
 import struct
@@ -166,28 +167,46 @@ def _loads_register_param(data_bytes, circuit, registers):  # type: ignore[no-un
     return registers["c"][data_bytes]
 
 
+@functools.lru_cache(maxsize=None)
+def _gate_class(gate_name):  # type: ignore[no-untyped-def]
+    """Return the class of a standard operation from its name, or ``None``."""
+    for module in (library, circuit_mod, extensions, quantum_initializer, controlflow):
+        if hasattr(module, gate_name):
+            return getattr(module, gate_name)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _instruction_args_struct(num_args):  # type: ignore[no-untyped-def]
+    """Return the struct of ``num_args`` consecutive instruction arguments."""
+    return struct.Struct(
+        formats.CIRCUIT_INSTRUCTION_ARG_PACK[0]
+        + formats.CIRCUIT_INSTRUCTION_ARG_PACK[1:] * num_args
+    )
+
+
 def _read_instruction(  # type: ignore[no-untyped-def]
-    file_obj, circuit, registers, custom_operations, version, vectors
+    file_obj, circuit, registers, custom_operations, version, vectors, bits=None
 ):
     if version < 5:
         instruction = formats.CIRCUIT_INSTRUCTION._make(
-            struct.unpack(
-                formats.CIRCUIT_INSTRUCTION_PACK,
-                file_obj.read(formats.CIRCUIT_INSTRUCTION_SIZE),
+            formats.CIRCUIT_INSTRUCTION_STRUCT.unpack(
+                file_obj.read(formats.CIRCUIT_INSTRUCTION_SIZE)
             )
         )
     else:
         instruction = formats.CIRCUIT_INSTRUCTION_V2._make(
-            struct.unpack(
-                formats.CIRCUIT_INSTRUCTION_V2_PACK,
-                file_obj.read(formats.CIRCUIT_INSTRUCTION_V2_SIZE),
+            formats.CIRCUIT_INSTRUCTION_V2_STRUCT.unpack(
+                file_obj.read(formats.CIRCUIT_INSTRUCTION_V2_SIZE)
             )
         )
-    gate_name = file_obj.read(instruction.name_size).decode(common.ENCODE)
-    label = file_obj.read(instruction.label_size).decode(common.ENCODE)
-    condition_register = file_obj.read(instruction.condition_register_size).decode(
-        common.ENCODE
-    )
+    # The name, label and condition register are stored next to each other.
+    name_end = instruction.name_size
+    label_end = name_end + instruction.label_size
+    strings = file_obj.read(label_end + instruction.condition_register_size)
+    gate_name = strings[:name_end].decode(common.ENCODE)
+    label = strings[name_end:label_end].decode(common.ENCODE)
+    condition_register = strings[label_end:].decode(common.ENCODE)
     qargs = []
     cargs = []
     params = []
@@ -199,32 +218,24 @@ def _read_instruction(  # type: ignore[no-untyped-def]
             instruction.condition_value,
         )
     if circuit is not None:
-        qubit_indices = dict(enumerate(circuit.qubits))
-        clbit_indices = dict(enumerate(circuit.clbits))
-        for _qarg in range(instruction.num_qargs):
-            qarg = formats.CIRCUIT_INSTRUCTION_ARG._make(
-                struct.unpack(
-                    formats.CIRCUIT_INSTRUCTION_ARG_PACK,
-                    file_obj.read(formats.CIRCUIT_INSTRUCTION_ARG_SIZE),
-                )
+        if bits is None:
+            bits = {"q": circuit.qubits, "c": circuit.clbits}
+        num_qargs = instruction.num_qargs
+        num_args = num_qargs + instruction.num_cargs
+        if num_args:
+            args = _instruction_args_struct(num_args).unpack(
+                file_obj.read(num_args * formats.CIRCUIT_INSTRUCTION_ARG_SIZE)
             )
-            if qarg.type.decode(common.ENCODE) == "c":
+            arg_types = args[0::2]
+            arg_indices = args[1::2]
+            if b"c" in arg_types[:num_qargs]:
                 raise TypeError("Invalid input carg prior to all qargs")
-            qargs.append(qubit_indices[qarg.size])
-        for _carg in range(instruction.num_cargs):
-            carg = formats.CIRCUIT_INSTRUCTION_ARG._make(
-                struct.unpack(
-                    formats.CIRCUIT_INSTRUCTION_ARG_PACK,
-                    file_obj.read(formats.CIRCUIT_INSTRUCTION_ARG_SIZE),
-                )
-            )
-            if carg.type.decode(common.ENCODE) == "q":
+            if b"q" in arg_types[num_qargs:]:
                 raise TypeError("Invalid input qarg after all qargs")
-            cargs.append(clbit_indices[carg.size])
-
-    else:
-        qubit_indices = {}
-        clbit_indices = {}
+            qubits = bits["q"]
+            clbits = bits["c"]
+            qargs = [qubits[index] for index in arg_indices[:num_qargs]]
+            cargs = [clbits[index] for index in arg_indices[num_qargs:]]
 
     # Load Parameters
     for _param in range(instruction.num_parameters):
@@ -257,18 +268,10 @@ def _read_instruction(  # type: ignore[no-untyped-def]
             return inst_obj
         circuit._append(inst_obj, qargs, cargs)
         return None
-    elif hasattr(library, gate_name):
-        gate_class = getattr(library, gate_name)
-    elif hasattr(circuit_mod, gate_name):
-        gate_class = getattr(circuit_mod, gate_name)
-    elif hasattr(extensions, gate_name):
-        gate_class = getattr(extensions, gate_name)
-    elif hasattr(quantum_initializer, gate_name):
-        gate_class = getattr(quantum_initializer, gate_name)
-    elif hasattr(controlflow, gate_name):
-        gate_class = getattr(controlflow, gate_name)
     else:
-        raise AttributeError(f"Invalid instruction type: {gate_name}")
+        gate_class = _gate_class(gate_name)
+        if gate_class is None:
+            raise AttributeError(f"Invalid instruction type: {gate_name}")
 
     if gate_name in {"IfElseOp", "WhileLoopOp"}:
         gate = gate_class(condition_tuple, *params)
@@ -284,8 +287,13 @@ def _read_instruction(  # type: ignore[no-untyped-def]
             gate = gate_class(*params, instruction.num_ctrl_qubits)
         else:
             gate = gate_class(*params)
-            gate.num_ctrl_qubits = instruction.num_ctrl_qubits
-            gate.ctrl_state = instruction.ctrl_state
+            # The setters validate their input, skip them for default controls.
+            if (gate.num_ctrl_qubits, gate.ctrl_state) != (
+                instruction.num_ctrl_qubits,
+                instruction.ctrl_state,
+            ):
+                gate.num_ctrl_qubits = instruction.num_ctrl_qubits
+                gate.ctrl_state = instruction.ctrl_state
         gate.condition = condition_tuple
     else:
         if gate_name in {
@@ -543,31 +551,38 @@ def _dumps_instruction_parameter(param, index_map):  # type: ignore[no-untyped-d
     return type_key, data_bytes
 
 
-# pylint: disable=too-many-boolean-expressions
+@functools.lru_cache(maxsize=None)
+def _custom_operation_kind(operation_class):  # type: ignore[no-untyped-def]
+    """Return how the operations of a class are stored as custom operations.
+
+    ``"custom"`` for operations stored under their name, ``"evolution"`` for
+    Pauli evolution gates and ``None`` for standard operations.
+    """
+    class_name = operation_class.__name__
+    if (
+        _gate_class(class_name) is None
+        or class_name in {"Gate", "Instruction", "ControlledGate"}
+        or issubclass(operation_class, library.BlueprintCircuit)
+    ):
+        return "custom"
+    if issubclass(operation_class, library.PauliEvolutionGate):
+        return "evolution"
+    return None
+
+
 def _write_instruction(  # type: ignore[no-untyped-def]
     file_obj, instruction, custom_operations, index_map
 ):
     gate_class_name = instruction.operation.__class__.__name__
     custom_operations_list = []
-    if (
-        (
-            not hasattr(library, gate_class_name)
-            and not hasattr(circuit_mod, gate_class_name)
-            and not hasattr(extensions, gate_class_name)
-            and not hasattr(quantum_initializer, gate_class_name)
-            and not hasattr(controlflow, gate_class_name)
-        )
-        or gate_class_name == "Gate"
-        or gate_class_name == "Instruction"
-        or gate_class_name == "ControlledGate"
-        or isinstance(instruction.operation, library.BlueprintCircuit)
-    ):
+    kind = _custom_operation_kind(instruction.operation.__class__)
+    if kind == "custom":
         if instruction.operation.name not in custom_operations:
             custom_operations[instruction.operation.name] = instruction.operation
             custom_operations_list.append(instruction.operation.name)
         gate_class_name = instruction.operation.name
 
-    elif isinstance(instruction.operation, library.PauliEvolutionGate):
+    elif kind == "evolution":
         gate_class_name = f"###PauliEvolutionGate_{str(uuid.uuid4())}"
         custom_operations[gate_class_name] = instruction.operation
         custom_operations_list.append(gate_class_name)
@@ -600,8 +615,7 @@ def _write_instruction(  # type: ignore[no-untyped-def]
 
     num_ctrl_qubits = getattr(instruction.operation, "num_ctrl_qubits", 0)
     ctrl_state = getattr(instruction.operation, "ctrl_state", 0)
-    instruction_raw = struct.pack(
-        formats.CIRCUIT_INSTRUCTION_V2_PACK,
+    instruction_raw = formats.CIRCUIT_INSTRUCTION_V2_STRUCT.pack(
         len(gate_class_name),
         len(label_raw),
         len(instruction_params),
@@ -613,25 +627,25 @@ def _write_instruction(  # type: ignore[no-untyped-def]
         num_ctrl_qubits,
         ctrl_state,
     )
-    file_obj.write(instruction_raw)
-    file_obj.write(gate_class_name)
-    file_obj.write(label_raw)
-    file_obj.write(condition_register)
+    chunks = [instruction_raw, gate_class_name, label_raw, condition_register]
     # Encode instruciton args
-    for qbit in instruction.qubits:
-        instruction_arg_raw = struct.pack(
-            formats.CIRCUIT_INSTRUCTION_ARG_PACK, b"q", index_map["q"][qbit]
-        )
-        file_obj.write(instruction_arg_raw)
-    for clbit in instruction.clbits:
-        instruction_arg_raw = struct.pack(
-            formats.CIRCUIT_INSTRUCTION_ARG_PACK, b"c", index_map["c"][clbit]
-        )
-        file_obj.write(instruction_arg_raw)
+    args = []
+    if instruction.qubits:
+        qubit_indices = index_map["q"]
+        for qbit in instruction.qubits:
+            args += (b"q", qubit_indices[qbit])
+    if instruction.clbits:
+        clbit_indices = index_map["c"]
+        for clbit in instruction.clbits:
+            args += (b"c", clbit_indices[clbit])
+    if args:
+        chunks.append(_instruction_args_struct(len(args) // 2).pack(*args))
     # Encode instruction params
     for param in instruction_params:
         type_key, data_bytes = _dumps_instruction_parameter(param, index_map)
-        common.write_generic_typed_data(file_obj, type_key, data_bytes)
+        chunks.append(formats.INSTRUCTION_PARAM_STRUCT.pack(type_key, len(data_bytes)))
+        chunks.append(data_bytes)
+    file_obj.write(b"".join(chunks))
     return custom_operations_list
 
 
@@ -992,9 +1006,10 @@ def read_circuit(file_obj, version, metadata_deserializer=None):  # type: ignore
     )
 
     custom_operations = _read_custom_operations(file_obj, version, vectors)
+    bits = {"q": circ.qubits, "c": circ.clbits}
     for _instruction in range(num_instructions):
         _read_instruction(
-            file_obj, circ, out_registers, custom_operations, version, vectors
+            file_obj, circ, out_registers, custom_operations, version, vectors, bits
         )
 
     # Read calibrations
@@ -34,14 +34,11 @@ def read_generic_typed_data(file_obj):  # type: ignore[no-untyped-def]
     Returns:
         tuple: Tuple of type key binary and the bytes object of the single data.
     """
-    data = formats.INSTRUCTION_PARAM._make(
-        struct.unpack(
-            formats.INSTRUCTION_PARAM_PACK,
-            file_obj.read(formats.INSTRUCTION_PARAM_SIZE),
-        )
+    type_key, size = formats.INSTRUCTION_PARAM_STRUCT.unpack(
+        file_obj.read(formats.INSTRUCTION_PARAM_SIZE)
     )
 
-    return data.type, file_obj.read(data.size)
+    return type_key, file_obj.read(size)
 
 
 def read_sequence(file_obj, deserializer, **kwargs):  # type: ignore[no-untyped-def]
@@ -124,11 +121,9 @@ def write_generic_typed_data(file_obj, type_key, data_binary):  # type: ignore[n
         type_key (Enum): Object type of the data.
         data_binary (bytes): Binary data to write.
     """
-    data_header = struct.pack(
-        formats.INSTRUCTION_PARAM_PACK, type_key, len(data_binary)
+    file_obj.write(
+        formats.INSTRUCTION_PARAM_STRUCT.pack(type_key, len(data_binary)) + data_binary
     )
-    file_obj.write(data_header)
-    file_obj.write(data_binary)
 
 
 def write_sequence(file_obj, sequence, serializer, **kwargs):  # type: ignore[no-untyped-def]
@@ -94,6 +94,7 @@ CIRCUIT_INSTRUCTION = namedtuple(
 )
 CIRCUIT_INSTRUCTION_PACK = "!HHHII?Hq"
 CIRCUIT_INSTRUCTION_SIZE = struct.calcsize(CIRCUIT_INSTRUCTION_PACK)
+CIRCUIT_INSTRUCTION_STRUCT = struct.Struct(CIRCUIT_INSTRUCTION_PACK)
 
 # CIRCUIT_INSTRUCTION_V2
 CIRCUIT_INSTRUCTION_V2 = namedtuple(
@@ -113,12 +114,14 @@ CIRCUIT_INSTRUCTION_V2 = namedtuple(
 )
 CIRCUIT_INSTRUCTION_V2_PACK = "!HHHII?HqII"
 CIRCUIT_INSTRUCTION_V2_SIZE = struct.calcsize(CIRCUIT_INSTRUCTION_V2_PACK)
+CIRCUIT_INSTRUCTION_V2_STRUCT = struct.Struct(CIRCUIT_INSTRUCTION_V2_PACK)
 
 
 # CIRCUIT_INSTRUCTION_ARG
 CIRCUIT_INSTRUCTION_ARG = namedtuple("CIRCUIT_INSTRUCTION_ARG", ["type", "size"])
 CIRCUIT_INSTRUCTION_ARG_PACK = "!1cI"
 CIRCUIT_INSTRUCTION_ARG_SIZE = struct.calcsize(CIRCUIT_INSTRUCTION_ARG_PACK)
+CIRCUIT_INSTRUCTION_ARG_STRUCT = struct.Struct(CIRCUIT_INSTRUCTION_ARG_PACK)
 
 # SparsePauliOp List
 SPARSE_PAULI_OP_LIST_ELEM = namedtuple("SPARSE_PAULI_OP_LIST_ELEMENT", ["size"])
@@ -226,6 +229,7 @@ SYMBOLIC_PULSE_SIZE_V2 = struct.calcsize(SYMBOLIC_PULSE_PACK_V2)
 INSTRUCTION_PARAM = namedtuple("INSTRUCTION_PARAM", ["type", "size"])
 INSTRUCTION_PARAM_PACK = "!1cQ"
 INSTRUCTION_PARAM_SIZE = struct.calcsize(INSTRUCTION_PARAM_PACK)
+INSTRUCTION_PARAM_STRUCT = struct.Struct(INSTRUCTION_PARAM_PACK)
 
 # PARAMETER
 PARAMETER = namedtuple("PARAMETER", ["name_size", "uuid"])
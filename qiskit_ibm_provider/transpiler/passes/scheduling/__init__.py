@@ -380,12 +380,17 @@ Scheduling & Dynamical Decoupling
     ALAPScheduleAnalysis
     ASAPScheduleAnalysis
     DynamicCircuitInstructionDurations
+    DynamicalDecouplingPlan
     PadDelay
     PadDynamicalDecoupling
+    ScheduleCache
+    schedule_circuits
 """
 
+from .batch import schedule_circuits
 from .block_base_padder import BlockBasePadder
-from .dynamical_decoupling import PadDynamicalDecoupling
+from .dynamical_decoupling import DynamicalDecouplingPlan, PadDynamicalDecoupling
 from .pad_delay import PadDelay
+from .schedule_cache import ScheduleCache
 from .scheduler import ALAPScheduleAnalysis, ASAPScheduleAnalysis
 from .utils import DynamicCircuitInstructionDurations
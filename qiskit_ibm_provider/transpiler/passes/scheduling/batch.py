@@ -0,0 +1,296 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Batch scheduling of circuits for dynamic circuit backends."""
+
+import math
+import numbers
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+import dill
+from qiskit.circuit import Gate, Instruction, ParameterVector, QuantumCircuit
+from qiskit.tools.parallel import CPU_COUNT, parallel_map
+from qiskit.transpiler import PassManager
+
+from .block_base_padder import BlockBasePadder
+from .dynamical_decoupling import PadDynamicalDecoupling
+from .pad_delay import PadDelay
+from .scheduler import BaseDynamicCircuitAnalysis
+from .utils import instruction_structure
+
+# Scheduled template, its parameters and the circuits bound to it.
+_BindTask = Tuple[
+    QuantumCircuit, ParameterVector, List[Tuple[List[float], float, str, Any]]
+]
+
+
+def schedule_circuits(
+    circuits: Union[QuantumCircuit, Sequence[QuantumCircuit]],
+    scheduler: BaseDynamicCircuitAnalysis,
+    padder: Optional[BlockBasePadder] = None,
+    num_processes: Optional[int] = None,
+    reuse_schedules: bool = True,
+) -> Union[QuantumCircuit, List[QuantumCircuit]]:
+    """Schedule and pad circuits in parallel.
+
+    This is equivalent to running ``PassManager([scheduler, padder])`` on each
+    circuit. The circuits are split into one chunk per process, and each process
+    runs the same pass instances on all the circuits of its chunk, so the
+    instruction durations and dynamical decoupling sequence lengths are only
+    computed once per process.
+
+    Instruction durations do not depend on gate parameters, so circuits that
+    only differ in the values of their gate parameters, as is the case in
+    parameter sweeps, have the same schedule. Each group of such circuits is
+    scheduled once, with its gate parameters replaced by
+    :class:`~qiskit.circuit.Parameter` instances, and the scheduled circuit is
+    then bound to the parameter values of each circuit of the group.
+
+    Args:
+        circuits: Physical circuits to schedule.
+        scheduler: Scheduling analysis pass, for example
+            :class:`~.ALAPScheduleAnalysis`.
+        padder: Padding pass, for example :class:`~.PadDynamicalDecoupling`.
+            Defaults to :class:`~.PadDelay`.
+        num_processes: Maximum number of processes to use. Defaults to the number
+            of CPUs.
+        reuse_schedules: Whether to schedule circuits that only differ in their
+            gate parameters once.
+
+    Returns:
+        The scheduled circuits, in the same order as the input circuits.
+    """
+    if isinstance(circuits, QuantumCircuit):
+        return schedule_circuits(
+            [circuits], scheduler, padder, num_processes, reuse_schedules
+        )[0]
+    padder = padder or PadDelay()
+    num_processes = num_processes or CPU_COUNT
+
+    # Group circuits with the same structure, keeping their free parameter values.
+    groups: Dict[Hashable, List[Tuple[int, List[float]]]] = {}
+    unique: List[int] = []
+    fixed_names = _fixed_parameter_gates(scheduler, padder)
+    for idx, circuit in enumerate(circuits):
+        values: List[float] = []
+        key = _structure_key(circuit, fixed_names, values) if reuse_schedules else None
+        if key is None:
+            unique.append(idx)
+        else:
+            groups.setdefault(key, []).append((idx, values))
+
+    # Schedule each group once, as a parametrized template.
+    templates = []
+    template_circuits = []
+    for members in groups.values():
+        first_idx, first_values = members[0]
+        if len(members) == 1:
+            unique.append(first_idx)
+        else:
+            template, parameters = _parametrize(
+                circuits[first_idx], fixed_names, len(first_values)
+            )
+            templates.append((parameters, members))
+            template_circuits.append(template)
+    to_schedule = [circuits[idx] for idx in unique] + template_circuits
+
+    pm_dill = dill.dumps(PassManager([scheduler, padder]))
+    scheduled = _flatten(
+        parallel_map(
+            _schedule_chunk,
+            _chunks(to_schedule, num_processes),
+            task_kwargs={"pm_dill": pm_dill},
+            num_processes=num_processes,
+        )
+    )
+
+    results: List[Optional[QuantumCircuit]] = [None] * len(circuits)
+    for idx, scheduled_circuit in zip(unique, scheduled):
+        results[idx] = scheduled_circuit
+
+    # Bind the scheduled templates to the parameter values of each circuit.
+    bind_tasks: List[_BindTask] = []
+    bind_indices = []
+    chunks_per_group = max(1, math.ceil(num_processes / max(len(templates), 1)))
+    for (parameters, members), template in zip(templates, scheduled[len(unique) :]):
+        for chunk in _chunks(members, chunks_per_group):
+            bind_tasks.append(
+                (
+                    template,
+                    parameters,
+                    [
+                        (
+                            values,
+                            circuits[idx].global_phase,
+                            circuits[idx].name,
+                            circuits[idx].metadata,
+                        )
+                        for idx, values in chunk
+                    ],
+                )
+            )
+            bind_indices.extend(idx for idx, _ in chunk)
+    bound = _flatten(parallel_map(_bind_chunk, bind_tasks, num_processes=num_processes))
+    for idx, bound_circuit in zip(bind_indices, bound):
+        results[idx] = bound_circuit
+
+    return results
+
+
+def _schedule_chunk(
+    circuits: List[QuantumCircuit], pm_dill: bytes
+) -> List[QuantumCircuit]:
+    """Schedule a chunk of circuits with the same pass instances."""
+    pass_manager = dill.loads(pm_dill)
+    return [pass_manager.run(circuit) for circuit in circuits]
+
+
+def _bind_chunk(task: _BindTask) -> List[QuantumCircuit]:
+    """Bind a scheduled template to the parameter values of a chunk of circuits."""
+    template, parameters, members = task
+    bound_circuits = []
+    for values, global_phase, name, metadata in members:
+        bound = template.assign_parameters(dict(zip(parameters, values)))
+        bound.global_phase += global_phase
+        bound.name = name
+        bound.metadata = metadata
+        bound_circuits.append(bound)
+    return bound_circuits
+
+
+def _fixed_parameter_gates(
+    scheduler: BaseDynamicCircuitAnalysis, padder: BlockBasePadder
+) -> Set[str]:
+    """Return the names of gates whose parameters affect scheduling or padding."""
+    # pylint: disable=protected-access
+    fixed_names = {
+        name
+        for name, _, params in scheduler._durations.duration_by_name_qubits_params
+        if params is not None
+    }
+    if isinstance(padder, PadDynamicalDecoupling) and any(
+        len(sequence) == 1 for sequence in padder._dd_sequences
+    ):
+        # Single gate sequences are absorbed into the parameters of neighboring gates.
+        fixed_names.update({"u", "u3"})
+    return fixed_names
+
+
+def _has_free_parameters(operation: Instruction, fixed_names: Set[str]) -> bool:
+    """Return whether the parameters of an operation can be replaced for scheduling.
+
+    Only gates whose definition is built from their parameters qualify, since
+    the definition of other gates would not follow the bound parameter values.
+    """
+    # pylint: disable=protected-access
+    return (
+        isinstance(operation, Gate)
+        and type(operation)._define is not Instruction._define
+        and operation.name not in fixed_names
+        and all(isinstance(param, numbers.Real) for param in operation.params)
+    )
+
+
+def _structure_key(
+    circuit: QuantumCircuit, fixed_names: Set[str], values: List[float]
+) -> Optional[Hashable]:
+    """Return a key identifying the structure of a circuit.
+
+    Args:
+        circuit: Circuit to identify.
+        fixed_names: Names of gates whose parameters are part of the structure.
+        values: List the free parameter values of the circuit are appended to.
+
+    Returns:
+        The key, or ``None`` if the circuit cannot be identified by its structure.
+    """
+    if circuit.calibrations or circuit.parameters:
+        return None
+    key = _circuit_key(circuit, fixed_names, values)
+    try:
+        hash(key)
+    except TypeError:
+        # Parameters such as arrays cannot be compared cheaply.
+        return None
+    return key
+
+
+def _circuit_key(
+    circuit: QuantumCircuit, fixed_names: Set[str], values: Optional[List[float]]
+) -> Tuple:
+    """Return the structure of a circuit as a tuple.
+
+    The parameters of control-flow blocks, for which ``values`` is ``None``,
+    are always part of the structure.
+    """
+    bit_indices = {bit: idx for idx, bit in enumerate(circuit.qubits + circuit.clbits)}
+    key: List[Hashable] = [
+        tuple((reg.name, reg.size) for reg in circuit.qregs),
+        tuple((reg.name, reg.size) for reg in circuit.cregs),
+        len(circuit.qubits),
+        len(circuit.clbits),
+    ]
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if values is not None and _has_free_parameters(operation, fixed_names):
+            values.extend(operation.params)
+            params: Hashable = len(operation.params)
+        else:
+            params = tuple(
+                _circuit_key(param, fixed_names, None)
+                if isinstance(param, QuantumCircuit)
+                else param
+                for param in operation.params
+            )
+        key.append(
+            (
+                instruction_structure(
+                    operation, instruction.qubits, instruction.clbits, bit_indices
+                ),
+                params,
+            )
+        )
+    return tuple(key)
+
+
+def _parametrize(
+    circuit: QuantumCircuit, fixed_names: Set[str], num_parameters: int
+) -> Tuple[QuantumCircuit, ParameterVector]:
+    """Return a copy of a circuit with its free gate parameters replaced by parameters."""
+    # pylint: disable=protected-access
+    parameters = ParameterVector("_schedule", num_parameters)
+    template = circuit.copy_empty_like()
+    template.global_phase = 0
+    next_param = 0
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if _has_free_parameters(operation, fixed_names) and operation.params:
+            operation = operation.copy()
+            num_params = len(operation.params)
+            operation.params = list(parameters[next_param : next_param + num_params])
+            # The cached definition is built from the original parameter values.
+            operation._definition = None
+            next_param += num_params
+            instruction = instruction.replace(operation=operation)
+        template._append(instruction)
+    return template, parameters
+
+
+def _chunks(items: Sequence, num_chunks: int) -> List[List]:
+    """Split items into at most ``num_chunks`` chunks of consecutive items."""
+    size = max(1, math.ceil(len(items) / num_chunks))
+    return [list(items[start : start + size]) for start in range(0, len(items), size)]
+
+
+def _flatten(chunks: List[List]) -> List:
+    """Concatenate chunks of results."""
+    return [item for chunk in chunks for item in chunk]
@@ -27,12 +27,11 @@ from qiskit.circuit.bit import Bit
 from qiskit.circuit.library import Barrier
 from qiskit.circuit.delay import Delay
 from qiskit.circuit.parameterexpression import ParameterExpression
-from qiskit.converters import dag_to_circuit
 from qiskit.dagcircuit import DAGCircuit, DAGNode
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 
-from .utils import block_order_op_nodes
+from .utils import BlockDAGRegistry, block_dag_registry, block_order_op_nodes
 
 
 class BlockBasePadder(TransformationPass):
@@ -65,6 +64,7 @@ class BlockBasePadder(TransformationPass):
     def __init__(self) -> None:
         self._node_start_time = None
         self._node_block_dags = None
+        self._block_dag_registry: Optional[BlockDAGRegistry] = None
         self._idle_after: Optional[Dict[Qubit, int]] = None
         self._root_dag = None
         self._dag = None
@@ -112,6 +112,7 @@ class BlockBasePadder(TransformationPass):
         """Setup for initial run."""
         self._node_start_time = self.property_set["node_start_time"].copy()
         self._node_block_dags = self.property_set["node_block_dags"]
+        self._block_dag_registry = block_dag_registry(self.property_set)
         self._idle_after = {bit: 0 for bit in dag.qubits}
         self._current_block_idx = 0
         self._conditional_block = False
@@ -442,9 +443,10 @@ class BlockBasePadder(TransformationPass):
             )
 
         # Build new control-flow operation containing scheduled blocks
-        # and apply to the DAG.
+        # and apply to the DAG. The padded block dags are registered so that
+        # the next scheduling pass does not convert the blocks back to dags.
         new_control_flow_op = node.op.replace_blocks(
-            dag_to_circuit(block) for block in new_node_block_dags
+            self._block_dag_registry.to_circuit(block) for block in new_node_block_dags
         )
         # Enforce that this control-flow operation contains all wires since it has now been padded
         # such that each qubit is scheduled within each block. Don't added all cargs as these will not
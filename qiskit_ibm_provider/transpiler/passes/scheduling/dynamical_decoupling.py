@@ -13,7 +13,7 @@
 """Dynamical decoupling insertion pass for IBM (dynamic circuit) backends."""
 
 import warnings
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from qiskit.circuit import Qubit, Gate
@@ -30,6 +30,241 @@ from qiskit.transpiler.passes.optimization import Optimize1qGates
 from .block_base_padder import BlockBasePadder
 
 
+def _as_sequence_list(value: Any) -> Any:
+    """Return a list of sequences from a sequence or a list of sequences."""
+    if value:
+        try:
+            iter(value[0])
+        except TypeError:
+            return [value]
+    return value
+
+
+class DynamicalDecouplingPlan:
+    """Precomputed tables of dynamical decoupling sequences.
+
+    A plan validates the DD sequences once and holds the tables that
+    :class:`PadDynamicalDecoupling` looks up to pad idle periods: the gate
+    lengths of each sequence on each physical qubit, the global phase of each
+    sequence, the inverse of single gate sequences, and the aligned delays
+    between the gates of a sequence for each length of idle period.
+
+    A plan only depends on the instruction durations and the sequences. Build it
+    once per backend and share it between passes with the ``dd_plan`` argument
+    of :class:`PadDynamicalDecoupling`. Plans can be pickled, so they can also be
+    shared with passes running in other processes.
+    """
+
+    max_delay_entries = 4096
+    """Maximum number of idle period lengths whose delays are kept in the plan."""
+
+    def __init__(
+        self,
+        durations: InstructionDurations,
+        dd_sequences: Union[List[Gate], List[List[Gate]]],
+        spacings: Optional[Union[List[List[float]], List[float]]] = None,
+        pulse_alignment: int = 16,
+        extra_slack_distribution: str = "middle",
+        sequence_min_length_ratios: Optional[Union[int, List[int]]] = None,
+    ):
+        """DynamicalDecouplingPlan constructor.
+
+        Args:
+            durations: Durations of instructions to be used in scheduling.
+            dd_sequences: Sequence of gates to apply in idle spots, or list of
+                such sequences. See :class:`PadDynamicalDecoupling`.
+            spacings: Spacings between the DD gates of each sequence. Defaults
+                to balanced spacings.
+            pulse_alignment: The hardware constraints for gate timing allocation.
+            extra_slack_distribution: Where the slack left by the alignment is
+                inserted, ``"middle"`` or ``"edges"``.
+            sequence_min_length_ratios: Minimum delay length to DD sequence length
+                ratio of each sequence. Defaults to 2.0.
+
+        Raises:
+            TranspilerError: When invalid DD sequences or options are specified.
+        """
+        self.durations = durations
+        self.dd_sequences = _as_sequence_list(dd_sequences) or []
+        self.pulse_alignment = pulse_alignment
+        if extra_slack_distribution not in ("middle", "edges"):
+            raise TranspilerError(
+                f"Option extra_slack_distribution = {extra_slack_distribution} is invalid."
+            )
+        self.extra_slack_distribution = extra_slack_distribution
+
+        if sequence_min_length_ratios is None:
+            # Use 2.0 as a sane default
+            sequence_min_length_ratios = [2.0 for _ in self.dd_sequences]
+        else:
+            try:
+                iter(sequence_min_length_ratios)  # type: ignore
+            except TypeError:
+                sequence_min_length_ratios = [sequence_min_length_ratios]  # type: ignore
+        if len(sequence_min_length_ratios) != len(self.dd_sequences):  # type: ignore
+            raise TranspilerError(
+                "Number of sequence lengths must equal number of DD sequences."
+            )
+        self.sequence_min_length_ratios = list(sequence_min_length_ratios)  # type: ignore
+
+        spacings = _as_sequence_list(spacings)
+        if spacings and len(spacings) != len(self.dd_sequences):
+            raise TranspilerError(
+                "Number of sequence spacings must equal number of DD sequences."
+            )
+
+        self.spacings: List[List[float]] = []
+        self.sequence_phases: List[float] = []
+        self.inverse_angles: List[Optional[Tuple[float, float, float, float]]] = []
+        for seq_idx, seq in enumerate(self.dd_sequences):
+            num_pulses = len(seq)
+
+            # Set default spacing otherwise validate user input
+            if spacings is None:
+                mid = 1 / num_pulses
+                end = mid / 2
+                self.spacings.append([end] + [mid] * (num_pulses - 1) + [end])
+            elif sum(spacings[seq_idx]) != 1 or any(a < 0 for a in spacings[seq_idx]):
+                raise TranspilerError(
+                    "The spacings must be given in terms of fractions "
+                    "of the slack period and sum to 1."
+                )
+            else:
+                self.spacings.append(list(spacings[seq_idx]))
+
+            # Check if DD sequence is identity
+            phase = 0.0
+            inverse_angles = None
+            if num_pulses != 1:
+                if num_pulses % 2 != 0:
+                    raise TranspilerError(
+                        "DD sequence must contain an even number of gates (or 1)."
+                    )
+                # TODO: this check should use the quantum info package in Qiskit.
+                noop = np.eye(2)
+                for gate in seq:
+                    noop = noop.dot(gate.to_matrix())
+                if not matrix_equal(noop, IGate().to_matrix(), ignore_phase=True):
+                    raise TranspilerError(
+                        "The DD sequence does not make an identity operation."
+                    )
+                phase = np.angle(noop[0][0])
+            else:
+                # A single gate is inverted by a neighboring gate.
+                u_inv = seq[0].inverse().to_matrix()
+                inverse_angles = OneQubitEulerDecomposer().angles_and_phase(u_inv)
+            self.sequence_phases.append(phase)
+            self.inverse_angles.append(inverse_angles)
+
+        self._lengths: Dict[int, Tuple[List[List[int]], List[int]]] = {}
+        self._delays: Dict[Tuple[int, int, int], np.ndarray] = {}
+
+    def sequence_lengths(
+        self, physical_index: int, calibrations: Optional[Dict] = None
+    ) -> Tuple[List[List[int]], List[int]]:
+        """Return the gate lengths and the total length of each sequence on a qubit.
+
+        Args:
+            physical_index: Index of the physical qubit.
+            calibrations: Calibrations of the circuit, which take precedence over
+                the durations. Lengths computed from calibrations are not kept
+                in the plan.
+
+        Returns:
+            The lengths of the gates of each sequence and the total length of
+            each sequence.
+
+        Raises:
+            TranspilerError: If the length of a pulse gate is not a multiple of
+                the pulse alignment.
+        """
+        if not calibrations:
+            lengths = self._lengths.get(physical_index)
+            if lengths is not None:
+                return lengths
+
+        gate_lengths = []
+        for seq in self.dd_sequences:
+            seq_length_ = []
+            for gate in seq:
+                try:
+                    # Check calibration.
+                    gate_length = (calibrations or {})[gate.name][
+                        (physical_index, gate.params)
+                    ]
+                    if gate_length % self.pulse_alignment != 0:
+                        # This is necessary to implement lightweight scheduling logic for this pass.
+                        # Usually the pulse alignment constraint and pulse data chunk size take
+                        # the same value, however, we can intentionally violate this pattern
+                        # at the gate level. For example, we can create a schedule consisting of
+                        # a pi-pulse of 32 dt followed by a post buffer, i.e. delay, of 4 dt
+                        # on the device with 16 dt constraint. Note that the pi-pulse length
+                        # is multiple of 16 dt but the gate length of 36 is not multiple of it.
+                        # Such pulse gate should be excluded.
+                        raise TranspilerError(
+                            f"Pulse gate {gate.name} with length non-multiple of "
+                            f"{self.pulse_alignment} is not acceptable in "
+                            f"PadDynamicalDecoupling pass."
+                        )
+                except KeyError:
+                    gate_length = self.durations.get(gate, physical_index)
+                seq_length_.append(gate_length)
+                # Update gate duration.
+                # This is necessary for current timeline drawer, i.e. scheduled.
+                gate.duration = gate_length
+            gate_lengths.append(seq_length_)
+
+        lengths = (gate_lengths, [sum(seq_length_) for seq_length_ in gate_lengths])
+        if not calibrations:
+            self._lengths[physical_index] = lengths
+        return lengths
+
+    def delays(self, sequence_idx: int, num_sequences: int, slack: int) -> np.ndarray:
+        """Return the delays around the gates of repeated sequences.
+
+        Args:
+            sequence_idx: Index of the sequence.
+            num_sequences: Number of times the sequence is repeated.
+            slack: Idle time not used by the gates of the sequences.
+
+        Returns:
+            The delays before, between and after the gates, aligned to the
+            pulse alignment, which add up to ``slack``.
+        """
+        key = (sequence_idx, num_sequences, slack)
+        taus = self._delays.get(key)
+        if taus is not None:
+            return taus
+
+        spacings = np.asarray(self.spacings[sequence_idx] * num_sequences)
+        spacings = spacings / num_sequences
+
+        # (1) Compute DD intervals satisfying the constraint
+        taus = self._constrained_length(slack * spacings)
+        extra_slack = slack - np.sum(taus)
+        # (2) Distribute extra slack
+        if self.extra_slack_distribution == "middle":
+            mid_ind = int((len(taus) - 1) / 2)
+            to_middle = self._constrained_length(extra_slack)
+            taus[mid_ind] += to_middle
+            if extra_slack - to_middle:
+                # If to_middle is not a multiple value of the pulse alignment,
+                # it is truncated to the nearest multiple value and
+                # the rest of slack is added to the end.
+                taus[-1] += extra_slack - to_middle
+        else:
+            to_begin_edge = self._constrained_length(extra_slack / 2)
+            taus[0] += to_begin_edge
+            taus[-1] += extra_slack - to_begin_edge
+
+        if len(self._delays) < self.max_delay_entries:
+            self._delays[key] = taus
+        return taus
+
+    def _constrained_length(self, values: np.ndarray) -> np.ndarray:
+        return self.pulse_alignment * np.floor(values / self.pulse_alignment)
+
+
 class PadDynamicalDecoupling(BlockBasePadder):
     """Dynamical decoupling insertion pass for IBM dynamic circuit backends.
 
@@ -117,6 +352,7 @@ class PadDynamicalDecoupling(BlockBasePadder):
         extra_slack_distribution: str = "middle",
         sequence_min_length_ratios: Optional[Union[int, List[int]]] = None,
         insert_multiple_cycles: bool = False,
+        dd_plan: Optional[DynamicalDecouplingPlan] = None,
     ):
         """Dynamical decoupling initializer.
 
@@ -161,6 +397,10 @@ class PadDynamicalDecoupling(BlockBasePadder):
             insert_multiple_cycles: If the available duration exceeds
                 2*sequence_min_length_ratio*duration(dd_sequence) enable the insertion of multiple
                 rounds of the dynamical decoupling sequence in that delay.
+            dd_plan: Precomputed plan of the DD sequences, shared with other passes.
+                If specified, the sequences, spacings, pulse alignment, extra slack
+                distribution and minimum length ratios of the plan are used instead
+                of the ones passed to this pass.
         Raises:
             TranspilerError: When invalid DD sequence is specified.
             TranspilerError: When pulse gate with the duration which is
@@ -168,24 +408,21 @@ class PadDynamicalDecoupling(BlockBasePadder):
         """
 
         super().__init__()
+        if dd_plan is not None:
+            dd_sequences = dd_plan.dd_sequences
+            spacings = dd_plan.spacings
+            pulse_alignment = dd_plan.pulse_alignment
+            extra_slack_distribution = dd_plan.extra_slack_distribution
+            sequence_min_length_ratios = dd_plan.sequence_min_length_ratios
+        self._dd_plan = dd_plan
         self._durations = durations
         # Enforce list of DD sequences
-        if dd_sequences:
-            try:
-                iter(dd_sequences[0])
-            except TypeError:
-                dd_sequences = [dd_sequences]
-        self._dd_sequences = dd_sequences
+        self._dd_sequences = _as_sequence_list(dd_sequences)
         self._qubits = qubits
         self._skip_reset_qubits = skip_reset_qubits
         self._alignment = pulse_alignment
 
-        if spacings is not None:
-            try:
-                iter(spacings[0])  # type: ignore
-            except TypeError:
-                spacings = [spacings]  # type: ignore
-        self._spacings = spacings
+        self._spacings = _as_sequence_list(spacings)
 
         if self._spacings and len(self._spacings) != len(self._dd_sequences):
             raise TranspilerError(
@@ -194,8 +431,8 @@ class PadDynamicalDecoupling(BlockBasePadder):
 
         self._extra_slack_distribution = extra_slack_distribution
 
-        self._dd_sequence_lengths: Dict[Qubit, List[List[Gate]]] = {}
-        self._sequence_phase = 0
+        self._dd_sequence_lengths: Dict[Qubit, List[List[int]]] = {}
+        self._dd_sequence_totals: Dict[Qubit, List[int]] = {}
 
         if sequence_min_length_ratios is None:
             # Use 2.0 as a sane default
@@ -214,85 +451,41 @@ class PadDynamicalDecoupling(BlockBasePadder):
 
         self._insert_multiple_cycles = insert_multiple_cycles
 
+    @property
+    def dd_plan(self) -> Optional[DynamicalDecouplingPlan]:
+        """Return the plan of the DD sequences, built on the first run of the pass."""
+        return self._dd_plan
+
     def _pre_runhook(self, dag: DAGCircuit) -> None:
         super()._pre_runhook(dag)
 
-        spacings_required = self._spacings is None
-        if spacings_required:
-            self._spacings = []  # type: ignore
-
-        for seq_idx, seq in enumerate(self._dd_sequences):
-            num_pulses = len(self._dd_sequences[seq_idx])
-
+        if self._dd_sequences:
             # Check if physical circuit is given
             if len(dag.qregs) != 1 or dag.qregs.get("q", None) is None:
                 raise TranspilerError("DD runs on physical circuits only.")
 
-            # Set default spacing otherwise validate user input
-            if spacings_required:
-                mid = 1 / num_pulses
-                end = mid / 2
-                self._spacings.append([end] + [mid] * (num_pulses - 1) + [end])  # type: ignore
-            elif sum(self._spacings[seq_idx]) != 1 or any(  # type: ignore
-                    a < 0 for a in self._spacings[seq_idx]  # type: ignore
-                ):
-                raise TranspilerError(
-                    "The spacings must be given in terms of fractions "
-                    "of the slack period and sum to 1."
-                )
-
-            # Check if DD sequence is identity
-            if num_pulses != 1:
-                if num_pulses % 2 != 0:
-                    raise TranspilerError(
-                        "DD sequence must contain an even number of gates (or 1)."
-                    )
-                # TODO: this check should use the quantum info package in Qiskit.
-                noop = np.eye(2)
-                for gate in self._dd_sequences[seq_idx]:
-                    noop = noop.dot(gate.to_matrix())
-                if not matrix_equal(noop, IGate().to_matrix(), ignore_phase=True):
-                    raise TranspilerError(
-                        "The DD sequence does not make an identity operation."
-                    )
-                self._sequence_phase = np.angle(noop[0][0])
-
-            # Precompute qubit-wise DD sequence length for performance
-            for qubit in dag.qubits:
-                seq_length_ = []
-                if qubit not in self._dd_sequence_lengths:
-                    self._dd_sequence_lengths[qubit] = []
-
-                physical_index = dag.qubits.index(qubit)
-                if self._qubits and physical_index not in self._qubits:
-                    continue
+        # The plan does not depend on the circuit so it is built once.
+        if self._dd_plan is None:
+            self._dd_plan = DynamicalDecouplingPlan(
+                self._durations,
+                self._dd_sequences,
+                spacings=self._spacings,
+                pulse_alignment=self._alignment,
+                extra_slack_distribution=self._extra_slack_distribution,
+                sequence_min_length_ratios=self._sequence_min_length_ratios,
+            )
 
-                for gate in seq:
-                    try:
-                        # Check calibration.
-                        gate_length = dag.calibrations[gate.name][
-                            (physical_index, gate.params)
-                        ]
-                        if gate_length % self._alignment != 0:
-                            # This is necessary to implement lightweight scheduling logic for this pass.
-                            # Usually the pulse alignment constraint and pulse data chunk size take
-                            # the same value, however, we can intentionally violate this pattern
-                            # at the gate level. For example, we can create a schedule consisting of
-                            # a pi-pulse of 32 dt followed by a post buffer, i.e. delay, of 4 dt
-                            # on the device with 16 dt constraint. Note that the pi-pulse length
-                            # is multiple of 16 dt but the gate length of 36 is not multiple of it.
-                            # Such pulse gate should be excluded.
-                            raise TranspilerError(
-                                f"Pulse gate {gate.name} with length non-multiple of {self._alignment} "
-                                f"is not acceptable in {self.__class__.__name__} pass."
-                            )
-                    except KeyError:
-                        gate_length = self._durations.get(gate, physical_index)
-                    seq_length_.append(gate_length)
-                    # Update gate duration.
-                    # This is necessary for current timeline drawer, i.e. scheduled.
-                    gate.duration = gate_length
-                self._dd_sequence_lengths[qubit].append(seq_length_)
+        # Look up qubit-wise DD sequence lengths for performance
+        qubits = set(self._qubits) if self._qubits else None
+        for physical_index, qubit in enumerate(dag.qubits):
+            if qubits is not None and physical_index not in qubits:
+                self._dd_sequence_lengths.setdefault(qubit, [])
+                self._dd_sequence_totals.setdefault(qubit, [])
+                continue
+            (
+                self._dd_sequence_lengths[qubit],
+                self._dd_sequence_totals[qubit],
+            ) = self._dd_plan.sequence_lengths(physical_index, dag.calibrations)
 
     def _pad(
         self,
@@ -356,12 +549,11 @@ class PadDynamicalDecoupling(BlockBasePadder):
             )
             return
 
-        for sequence_idx, _ in enumerate(self._dd_sequences):
-            dd_sequence = self._dd_sequences[sequence_idx]
+        plan = self._dd_plan
+        for sequence_idx, dd_sequence in enumerate(plan.dd_sequences):
             seq_lengths = self._dd_sequence_lengths[qubit][sequence_idx]
-            seq_length = np.sum(seq_lengths)
-            seq_ratio = self._sequence_min_length_ratios[sequence_idx]
-            spacings = self._spacings[sequence_idx]
+            seq_length = self._dd_sequence_totals[qubit][sequence_idx]
+            seq_ratio = plan.sequence_min_length_ratios[sequence_idx]
 
             # Verify the delay duration exceeds the minimum time to insert
             if time_interval / seq_length <= seq_ratio:
@@ -382,23 +574,18 @@ class PadDynamicalDecoupling(BlockBasePadder):
             # multiple dd sequences may be inserted
             if num_sequences > 1:
                 dd_sequence = list(dd_sequence) * num_sequences
-                spacings = spacings * num_sequences
                 seq_lengths = seq_lengths * num_sequences
-                seq_length = np.sum(seq_lengths)
+                seq_length = seq_length * num_sequences
 
-            spacings = np.asarray(spacings) / num_sequences
             slack = time_interval - seq_length
-            sequence_gphase = self._sequence_phase
+            sequence_gphase = plan.sequence_phases[sequence_idx]
 
             if slack <= 0:
                 continue
 
             if len(dd_sequence) == 1:
                 # Special case of using a single gate for DD
-                u_inv = dd_sequence[0].inverse().to_matrix()
-                theta, phi, lam, phase = OneQubitEulerDecomposer().angles_and_phase(
-                    u_inv
-                )
+                theta, phi, lam, phase = plan.inverse_angles[sequence_idx]
                 if isinstance(next_node, DAGOpNode) and isinstance(
                     next_node.op, (UGate, U3Gate)
                 ):
@@ -427,30 +614,8 @@ class PadDynamicalDecoupling(BlockBasePadder):
                     )
                     return
 
-            def _constrained_length(values: np.array) -> np.array:
-                return self._alignment * np.floor(values / self._alignment)
-
-            # (1) Compute DD intervals satisfying the constraint
-            taus = _constrained_length(slack * spacings)
-            extra_slack = slack - np.sum(taus)
-            # (2) Distribute extra slack
-            if self._extra_slack_distribution == "middle":
-                mid_ind = int((len(taus) - 1) / 2)
-                to_middle = _constrained_length(extra_slack)
-                taus[mid_ind] += to_middle
-                if extra_slack - to_middle:
-                    # If to_middle is not a multiple value of the pulse alignment,
-                    # it is truncated to the nearest multiple value and
-                    # the rest of slack is added to the end.
-                    taus[-1] += extra_slack - to_middle
-            elif self._extra_slack_distribution == "edges":
-                to_begin_edge = _constrained_length(extra_slack / 2)
-                taus[0] += to_begin_edge
-                taus[-1] += extra_slack - to_begin_edge
-            else:
-                raise TranspilerError(
-                    f"Option extra_slack_distribution = {self._extra_slack_distribution} is invalid."
-                )
+            # (1) and (2) Compute DD intervals satisfying the constraint
+            taus = plan.delays(sequence_idx, num_sequences, slack)
 
             # (3) Construct DD sequence with delays
             idle_after = t_start
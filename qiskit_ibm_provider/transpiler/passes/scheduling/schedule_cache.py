@@ -0,0 +1,102 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of dynamic circuit schedules."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ScheduleCache:
+    """Least recently used cache of dynamic circuit schedules.
+
+    Pass the same cache to the scheduling passes, for example
+    :class:`~.ALAPScheduleAnalysis`, that schedule many circuits with the same
+    structure, such as the circuits of a parameter sweep. A circuit whose
+    instructions, qubits, classical bits and durations match the ones of a
+    circuit scheduled before reuses its schedule instead of being scheduled
+    again. Gate parameters that do not change the instruction durations are
+    not part of the structure.
+
+    .. code-block:: python
+
+        cache = ScheduleCache(maxsize=16)
+        pm = PassManager(
+            [
+                ALAPScheduleAnalysis(durations, schedule_cache=cache),
+                PadDynamicalDecoupling(durations, dd_sequence),
+            ]
+        )
+        scheduled = [pm.run(circuit) for circuit in sweep_circuits]
+        print(cache.hit_rate)
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """ScheduleCache constructor.
+
+        Args:
+            maxsize: Maximum number of schedules kept in the cache. The least
+                recently used schedule is evicted when it is full.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that found a schedule."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the schedule of a circuit structure.
+
+        Args:
+            key: Structure of the circuit.
+
+        Returns:
+            The schedule, or ``None`` if it is not in the cache.
+        """
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return schedule
+
+    def put(self, key: Hashable, schedule: Any) -> None:
+        """Store the schedule of a circuit structure.
+
+        Args:
+            key: Structure of the circuit.
+            schedule: Schedule of the circuit.
+        """
+        with self._lock:
+            self._entries[key] = schedule
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the schedules and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -13,12 +13,11 @@
 """Scheduler for dynamic circuit backends."""
 
 from abc import abstractmethod
-from typing import Dict, List, Optional, Union, Set, Tuple
+from typing import Callable, Dict, Hashable, List, Optional, Union, Set, Tuple
 import itertools
 
 import qiskit
 from qiskit.circuit.parameterexpression import ParameterExpression
-from qiskit.converters import circuit_to_dag
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.passes.scheduling.time_unit_conversion import TimeUnitConversion
 
@@ -27,7 +26,13 @@ from qiskit.circuit.bit import Bit
 from qiskit.dagcircuit import DAGCircuit, DAGNode
 from qiskit.transpiler.exceptions import TranspilerError
 
-from .utils import block_order_op_nodes
+from .schedule_cache import ScheduleCache
+from .utils import (
+    BlockDAGRegistry,
+    block_dag_registry,
+    block_order_op_nodes,
+    instruction_structure,
+)
 
 
 class BaseDynamicCircuitAnalysis(TransformationPass):
@@ -49,14 +54,19 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
     """
 
     def __init__(
-        self, durations: qiskit.transpiler.instruction_durations.InstructionDurations
+        self,
+        durations: qiskit.transpiler.instruction_durations.InstructionDurations,
+        schedule_cache: Optional[ScheduleCache] = None,
     ) -> None:
         """Scheduler for dynamic circuit backends.
 
         Args:
             durations: Durations of instructions to be used in scheduling.
+            schedule_cache: Cache of schedules, reused for circuits with the same
+                structure and durations as a circuit scheduled before.
         """
         self._durations = durations
+        self._schedule_cache = schedule_cache
 
         self._dag: Optional[DAGCircuit] = None
         self._block_dag: Optional[DAGCircuit] = None
@@ -64,6 +74,8 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         self._node_mapped_wires: Optional[Dict[DAGNode, List[Bit]]] = None
         self._node_block_dags: Dict[DAGNode, DAGCircuit] = {}
         # Mapping of control-flow nodes to their containing blocks
+        self._block_dag_registry: Optional[BlockDAGRegistry] = None
+        # DAGs of blocks padded by previous passes
         self._block_idx_dag_map: Dict[int, DAGCircuit] = {}
         # Mapping of block indices to the respective DAGCircuit
 
@@ -138,7 +150,13 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         # and causes node relationships stored in analysis to be lost between
         # passes as we are constantly recreating the block dags.
         # We resolve this here by caching these dags in the property set.
-        self._node_block_dags[node] = node_block_dags = []
+        # The dags of blocks padded by a previous pass are taken from the
+        # block dag registry rather than converted again.
+        node_block_dags = self._node_block_dags.get(node)
+        if node_block_dags is None:
+            self._node_block_dags[node] = node_block_dags = [
+                self._block_dag_registry.take_dag(block) for block in node.op.blocks
+            ]
 
         t0 = max(  # pylint: disable=invalid-name
             self._current_block_bit_times[bit] for bit in self._map_wires(node)
@@ -147,17 +165,15 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         # Duration is 0 as we do not schedule across terminator
         t1 = t0  # pylint: disable=invalid-name
         self._update_bit_times(node, t1, t1)
-        for block in node.op.blocks:
+        for new_dag in node_block_dags:
             self._control_flow_block = True
 
-            new_dag = circuit_to_dag(block)
             inner_wire_map = {
                 inner: outer
                 for outer, inner in zip(
                     self._map_wires(node), new_dag.qubits + new_dag.clbits
                 )
             }
-            node_block_dags.append(new_dag)
             self._visit_block(new_dag, inner_wire_map)
 
         # Begin new block for exit to "then" block.
@@ -183,6 +199,7 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         self._wire_map = {wire: wire for wire in dag.wires}
         self._node_mapped_wires = {}
         self._node_block_dags = {}
+        self._block_dag_registry = block_dag_registry(self.property_set)
         self._block_idx_dag_map = {}
 
         self._current_block_idx = 0
@@ -200,6 +217,108 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         self._node_tied_to = {}
         self._bit_indices = {q: index for index, q in enumerate(dag.qubits)}
 
+    def _replay_schedule(self, dag: DAGCircuit) -> bool:
+        """Reuse the cached schedule of a circuit with the same structure.
+
+        Args:
+            dag: DAG to schedule.
+
+        Returns:
+            Whether a cached schedule was used.
+        """
+        if self._schedule_cache is None:
+            return False
+
+        node_block_dags: Dict[DAGNode, List[DAGCircuit]] = {}
+
+        def _convert_blocks(node: DAGNode) -> List[DAGCircuit]:
+            node_block_dags[node] = block_dags = []
+            for block in node.op.blocks:
+                block_dag = self._block_dag_registry.take_dag(block)
+                self._time_unit_converter.run(block_dag)
+                block_dags.append(block_dag)
+            return block_dags
+
+        self._time_unit_converter.run(dag)
+        key, nodes = self._schedule_structure(dag, _convert_blocks)
+        # Schedule the converted blocks if the schedule is not cached.
+        self._node_block_dags = node_block_dags
+        if key is None:
+            return False
+        start_times = self._schedule_cache.get(key)
+        if start_times is None:
+            return False
+
+        self._node_start_time = dict(zip(nodes, start_times))
+        return True
+
+    def _store_schedule(self, dag: DAGCircuit) -> None:
+        """Store the schedule of a circuit in the schedule cache.
+
+        Args:
+            dag: Scheduled DAG.
+        """
+        if self._schedule_cache is None:
+            return
+
+        key, nodes = self._schedule_structure(dag, self._node_block_dags.__getitem__)
+        if key is not None and all(node in self._node_start_time for node in nodes):
+            self._schedule_cache.put(
+                key, [self._node_start_time[node] for node in nodes]
+            )
+
+    def _schedule_structure(
+        self,
+        dag: DAGCircuit,
+        get_block_dags: Callable[[DAGNode], List[DAGCircuit]],
+    ) -> Tuple[Optional[Hashable], List[DAGNode]]:
+        """Return the structure a schedule depends on.
+
+        The structure of two circuits is the same if they have the same
+        instructions on the same bits with the same durations, in the same
+        topological order, including the instructions of control-flow blocks.
+
+        Args:
+            dag: DAG with durations assigned to its nodes.
+            get_block_dags: Function returning the DAGs of the blocks of a
+                control-flow node, with durations assigned to their nodes.
+
+        Returns:
+            The structure, or ``None`` if schedules of the DAG cannot be reused,
+            and the nodes the schedule applies to, in the order of the structure.
+        """
+        nodes: List[DAGNode] = []
+
+        def _dag_structure(block: DAGCircuit) -> Optional[Tuple]:
+            if block.calibrations:
+                return None
+            bit_indices = {
+                bit: idx for idx, bit in enumerate(block.qubits + block.clbits)
+            }
+            structure: List[Hashable] = [len(block.qubits), len(block.clbits)]
+            for node in block.topological_op_nodes():
+                nodes.append(node)
+                op = node.op
+                blocks: Tuple = ()
+                if isinstance(op, ControlFlowOp):
+                    blocks = tuple(
+                        _dag_structure(block_dag) for block_dag in get_block_dags(node)
+                    )
+                    if None in blocks:
+                        return None
+                structure.append(
+                    (
+                        instruction_structure(op, node.qargs, node.cargs, bit_indices),
+                        blocks,
+                    )
+                )
+            return tuple(structure)
+
+        structure = _dag_structure(dag)
+        if structure is None:
+            return None, nodes
+        return (type(self), structure), nodes
+
     def _get_duration(self, node: DAGNode, dag: Optional[DAGCircuit] = None) -> int:
         if node.op.condition_bits or isinstance(node.op, ControlFlowOp):
             # As we cannot currently schedule through conditionals model
@@ -333,10 +452,12 @@ class ASAPScheduleAnalysis(BaseDynamicCircuitAnalysis):
         """
         self._init_run(dag)
 
-        # Trivial wire map at the top-level
-        wire_map = {wire: wire for wire in dag.wires}
-        # Top-level dag is the entry block
-        self._visit_block(dag, wire_map)
+        if not self._replay_schedule(dag):
+            # Trivial wire map at the top-level
+            wire_map = {wire: wire for wire in dag.wires}
+            # Top-level dag is the entry block
+            self._visit_block(dag, wire_map)
+            self._store_schedule(dag)
 
         self.property_set["node_start_time"] = self._node_start_time
         self.property_set["node_block_dags"] = self._node_block_dags
@@ -466,11 +587,13 @@ class ALAPScheduleAnalysis(BaseDynamicCircuitAnalysis):
         """
         self._init_run(dag)
 
-        # Trivial wire map at the top-level
-        wire_map = {wire: wire for wire in dag.wires}
-        # Top-level dag is the entry block
-        self._visit_block(dag, wire_map)
-        self._push_block_durations()
+        if not self._replay_schedule(dag):
+            # Trivial wire map at the top-level
+            wire_map = {wire: wire for wire in dag.wires}
+            # Top-level dag is the entry block
+            self._visit_block(dag, wire_map)
+            self._push_block_durations()
+            self._store_schedule(dag)
         self.property_set["node_start_time"] = self._node_start_time
         self.property_set["node_block_dags"] = self._node_block_dags
         return dag
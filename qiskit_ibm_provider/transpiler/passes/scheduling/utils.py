@@ -13,10 +13,21 @@
 """Utility functions for scheduling passes."""
 
 import warnings
-from typing import List, Generator, Optional, Tuple, Union
-
-from qiskit.circuit import ControlFlowOp, Measure, Reset, Parameter
+from typing import Dict, List, Generator, Optional, Sequence, Set, Tuple, Union
+
+from qiskit.circuit import (
+    Clbit,
+    ControlFlowOp,
+    Instruction,
+    Measure,
+    Reset,
+    Parameter,
+    QuantumCircuit,
+)
+from qiskit.circuit.bit import Bit
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.dagcircuit import DAGCircuit, DAGOpNode
+from qiskit.transpiler import PropertySet
 from qiskit.transpiler.instruction_durations import (
     InstructionDurations,
     InstructionDurationsType,
@@ -24,97 +35,102 @@ from qiskit.transpiler.instruction_durations import (
 from qiskit.transpiler.exceptions import TranspilerError
 
 
+def _is_grouped_measure(node: DAGOpNode) -> bool:
+    """Does this node need to be grouped?"""
+    return isinstance(node.op, (Reset, Measure))
+
+
+def _is_block_trigger(node: DAGOpNode) -> bool:
+    """Does this node trigger the end of a block?"""
+    return isinstance(node.op, ControlFlowOp)
+
+
 def block_order_op_nodes(dag: DAGCircuit) -> Generator[DAGOpNode, None, None]:
     """Yield nodes such that they are sorted into groups of blocks that minimize synchronization.
 
     Measurements are also grouped.
+
+    Measurements, resets and control-flow operations are assigned to levels, where
+    the ones of a level only depend on the ones of previous levels. Each level is
+    emitted as the nodes which must precede it, followed by its measurements and
+    resets and then by its control-flow operations. Nodes are only emitted in
+    the final block if none of their descendants follows a measurement, reset or
+    control-flow operation of a later level.
+
+    The levels are computed with a single pass over the DAG in each direction,
+    so the ordering takes time linear in the size of the DAG.
     """
+    nodes = list(dag.topological_op_nodes())
+    index = {node: idx for idx, node in enumerate(nodes)}
+    measures = [_is_grouped_measure(node) for node in nodes]
+    triggers = [
+        measure or _is_block_trigger(node) for node, measure in zip(nodes, measures)
+    ]
+    predecessors = [
+        {index[pred] for pred in dag.predecessors(node) if isinstance(pred, DAGOpNode)}
+        for node in nodes
+    ]
+    successors: List[List[int]] = [[] for _ in nodes]
+    for idx, preds in enumerate(predecessors):
+        for pred in preds:
+            successors[pred].append(idx)
+
+    # The level of a node is the number of measurements, resets or control-flow
+    # operations along the longest chain of them among its ancestors. A node is
+    # free to execute once the nodes of lower levels have executed.
+    levels = [0] * len(nodes)
+    for idx, preds in enumerate(predecessors):
+        levels[idx] = max((levels[pred] + triggers[pred] for pred in preds), default=0)
+    final_level = max(levels, default=0) + 1
+
+    # Nodes are emitted at their level if they precede a measurement, reset or
+    # control-flow operation. Otherwise they are emitted at the first level,
+    # not lower than their own, whose measurements, resets or control-flow
+    # operations are direct predecessors of one of their descendants.
+    emit_levels = list(levels)
+    feeds_trigger = [False] * len(nodes)
+    successor_levels: List[Optional[Set[int]]] = [None] * len(nodes)
+    for idx in reversed(range(len(nodes))):
+        if triggers[idx]:
+            continue
+        if any(triggers[succ] or feeds_trigger[succ] for succ in successors[idx]):
+            feeds_trigger[idx] = True
+            continue
+        trigger_levels: Set[int] = set()
+        for succ in successors[idx]:
+            trigger_levels.update(
+                levels[pred] for pred in predecessors[succ] if triggers[pred]
+            )
+            trigger_levels |= successor_levels[succ]
+        successor_levels[idx] = trigger_levels
+        emit_levels[idx] = min(
+            (level for level in trigger_levels if level >= levels[idx]),
+            default=final_level,
+        )
 
-    def _is_grouped_measure(node: DAGOpNode) -> bool:
-        """Does this node need to be grouped?"""
-        return isinstance(node.op, (Reset, Measure))
-
-    def _is_block_trigger(node: DAGOpNode) -> bool:
-        """Does this node trigger the end of a block?"""
-        return isinstance(node.op, ControlFlowOp)
-
-    def _emit(
-        node: DAGOpNode,
-        grouped_measure: List[DAGOpNode],
-        block_triggers: List[DAGOpNode],
-    ) -> bool:
-        """Should we emit this node?"""
-        for measure in grouped_measure:
-            if dag.is_predecessor(node, measure):
-                return True
-        for block_trigger in block_triggers:
-            if dag.is_predecessor(node, block_trigger):
-                return True
-
-        return _is_grouped_measure(node) or _is_block_trigger(node)
-
-    # Begin processing nodes in order
-    next_nodes = dag.topological_op_nodes()
-    while next_nodes:
-        curr_nodes = next_nodes  # Setup the next iteration nodes
-        next_nodes_set = set()  # Nodes that will make it into the next iteration
-        next_nodes = []  # Nodes to process in order in the next iteration
-        to_push = []  # Do we push this to the very last block?
-        yield_measures = []  # Measures/resets we will yield first
-        yield_block_triggers = []  # Followed by block triggers (conditionals)
-        block_break = False  # Did we encounter a block trigger in this iteration?
-        for node in curr_nodes:
-            # If we have added this node to the next set of nodes
-            # skip for now.
-            if node in next_nodes_set:
-                next_nodes.append(node)
-                continue
-
-            # If this nodes is a measurement
-            # push on the measurements to process
-            if _is_grouped_measure(node):
-                block_break = True
-                node_descendants = dag.descendants(node)
-                next_nodes_set |= set(node_descendants)
-                yield_measures.append(node)
-            # If this node is a block push this onto
-            # the block trigger list.
-            elif _is_block_trigger(node):
-                block_break = True
-                node_descendants = dag.descendants(node)
-                next_nodes_set |= set(node_descendants)
-                yield_block_triggers.append(node)
-            # Otherwise we push onto the final list of blocks to emit
-            # as part of the final block.
-            else:
-                to_push.append(node)
-
-        new_to_push = []
-        for node in to_push:
-            node_descendants = dag.descendants(node)
-            if any(
-                _emit(descendant, yield_measures, yield_block_triggers)
-                for descendant in node_descendants
-                if isinstance(descendant, DAGOpNode)
-            ):
-                yield node
+    # Within a block nodes are processed by level and then in topological order.
+    by_level: List[List[int]] = [[] for _ in range(final_level + 1)]
+    for idx, level in enumerate(levels):
+        by_level[level].append(idx)
+    blocks: List[Tuple[List[int], List[int], List[int]]] = [
+        ([], [], []) for _ in range(final_level + 1)
+    ]
+    for level_nodes in by_level:
+        for idx in level_nodes:
+            block = blocks[emit_levels[idx]]
+            if measures[idx]:
+                block[1].append(idx)
+            elif triggers[idx]:
+                block[2].append(idx)
             else:
-                new_to_push.append(node)
-
-        to_push = new_to_push
+                block[0].append(idx)
 
+    for to_push, yield_measures, yield_block_triggers in blocks:
+        yield from (nodes[idx] for idx in to_push)
         # First emit the measurements which will feed
-        yield from yield_measures
+        yield from (nodes[idx] for idx in yield_measures)
         # Into the block triggers we will emit.
-        yield from yield_block_triggers
-        # We're at the last block and emit the final nodes
-        if not block_break:
-            yield from to_push
-            break
-        # Otherwise emit the final nodes
-        # Add to the front of the list to be processed next
-        to_push.extend(next_nodes)
-        next_nodes = to_push
+        yield from (nodes[idx] for idx in yield_block_triggers)
 
 
 InstrKey = Union[
@@ -124,6 +140,109 @@ InstrKey = Union[
 ]
 
 
+class BlockDAGRegistry:
+    """DAGs of the control-flow blocks built by the scheduling passes.
+
+    The blocks of control-flow operations are stored as circuits, while the
+    scheduling and padding passes work on DAGs. When a pass converts a block DAG
+    it built into a circuit with :meth:`to_circuit`, the DAG is kept in the
+    registry, and the next pass that needs the DAG of this circuit takes it with
+    :meth:`take_dag` instead of converting the circuit back into a DAG.
+
+    The registry lives in the property set of the pass manager, see
+    :func:`block_dag_registry`. A DAG is handed out at most once, as the
+    scheduling passes modify the DAGs they are given.
+    """
+
+    def __init__(self) -> None:
+        self._dags: Dict[int, Tuple[QuantumCircuit, DAGCircuit, int]] = {}
+
+    def take_dag(self, block: QuantumCircuit) -> DAGCircuit:
+        """Return the DAG of a control-flow block.
+
+        The operations are not copied, the DAG must not modify them in place.
+
+        Args:
+            block: Circuit of the block.
+
+        Returns:
+            The registered DAG of the block if it has one, otherwise a new DAG.
+        """
+        entry = self._dags.pop(id(block), None)
+        if entry is not None:
+            circuit, dag, size = entry
+            # The circuit must not have been modified since it was registered.
+            if circuit is block and len(block.data) == size:
+                return dag
+        return circuit_to_dag(block, copy_operations=False)
+
+    def to_circuit(self, dag: DAGCircuit) -> QuantumCircuit:
+        """Convert the DAG of a control-flow block into a circuit and register it.
+
+        The circuit shares its operations with the DAG.
+
+        Args:
+            dag: DAG of the block.
+
+        Returns:
+            The circuit of the block.
+        """
+        circuit = dag_to_circuit(dag, copy_operations=False)
+        self._dags[id(circuit)] = (circuit, dag, len(circuit.data))
+        return circuit
+
+    def __len__(self) -> int:
+        return len(self._dags)
+
+
+def block_dag_registry(property_set: PropertySet) -> BlockDAGRegistry:
+    """Return the block DAG registry of a property set, adding it if missing."""
+    registry = property_set["block_dag_registry"]
+    if registry is None:
+        registry = property_set["block_dag_registry"] = BlockDAGRegistry()
+    return registry
+
+
+def instruction_structure(
+    operation: Instruction,
+    qargs: Sequence[Bit],
+    cargs: Sequence[Bit],
+    bit_indices: Dict[Bit, int],
+) -> Tuple:
+    """Return the part of the structure of a circuit that an instruction defines.
+
+    The schedule of a circuit only depends on the type, name, duration and
+    condition of its instructions and on the bits they act on, so circuits
+    whose instructions have the same structure can share their schedule.
+    Parameters and control-flow blocks are not part of this structure.
+
+    Args:
+        operation: Operation of the instruction.
+        qargs: Qubits of the instruction.
+        cargs: Clbits of the instruction.
+        bit_indices: Index of each qubit and clbit of the circuit.
+
+    Returns:
+        The structure of the instruction.
+    """
+    condition = operation.condition
+    if condition is not None:
+        target, value = condition
+        if isinstance(target, Clbit):
+            condition = (bit_indices[target], value)
+        else:
+            condition = (target.name, target.size, value)
+    return (
+        type(operation),
+        operation.name,
+        operation.duration,
+        operation.unit,
+        condition,
+        tuple(bit_indices[bit] for bit in qargs),
+        tuple(bit_indices[bit] for bit in cargs),
+    )
+
+
 class DynamicCircuitInstructionDurations(InstructionDurations):
     """For dynamic circuits the IBM Qiskit backend currently
     reports instruction durations that differ compared with those
@@ -35,6 +35,24 @@ Misc Functions
     to_python_identifier
     validate_job_tags
 
+Backend Properties
+==================
+.. autosummary::
+    :toctree: ../stubs/
+
+    PropertiesDelta
+    PropertiesHistory
+    PropertiesArrays
+
+Serialization
+=============
+.. autosummary::
+    :toctree: ../stubs/
+
+    encode_circuits
+    CircuitEncodingTimes
+    EncodedCircuitCache
+
 """
 
 from .converters import (
@@ -45,3 +63,7 @@ from .converters import (
 )
 from .utils import to_python_identifier, validate_job_tags, are_circuits_dynamic
 from .json import RuntimeEncoder, RuntimeDecoder
+from .circuit_cache import EncodedCircuitCache
+from .properties_delta import PropertiesDelta
+from .properties_history import PropertiesArrays, PropertiesHistory
+from .circuit_encoder import CircuitEncodingTimes, encode_circuits
@@ -0,0 +1,204 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Persistent on-disk cache of decoded backend data."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+from qiskit import __version__ as terra_version
+
+from ..version import __version__ as provider_version
+from .utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+"""Version of the cache entry layout. Bump to invalidate existing entries."""
+
+
+class BackendDataCache:
+    """Persistent cache of decoded backend configurations, properties and pulse defaults.
+
+    Decoding backend data, and building a :class:`~qiskit.transpiler.Target`
+    from it, is expensive for large devices. This cache stores the decoded
+    objects under ``cache_dir``, keyed by instance, backend name and kind of
+    data, so that they can be reused across processes.
+
+    An entry younger than ``ttl`` seconds is returned without contacting the
+    server. An older entry is revalidated: the raw data is downloaded again and,
+    if its ``last_update_date`` (or its content digest, for data without an
+    update date) matches the one of the entry, the decoded object is reused
+    instead of being decoded again.
+
+    Entries written by a different version of the cache layout, of
+    ``qiskit-terra`` or of ``qiskit-ibm-provider`` are ignored.
+
+    Note:
+        Entries are stored with :mod:`pickle`. Only point ``cache_dir`` to a
+        directory that is not writable by untrusted users.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 3600) -> None:
+        """BackendDataCache constructor.
+
+        Args:
+            cache_dir: Directory where the entries are stored. It is created if
+                it does not exist.
+            ttl: Seconds during which an entry is used without revalidation.
+        """
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.ttl = ttl
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(
+        self,
+        kind: str,
+        backend_name: str,
+        instance: Optional[str],
+        fetch: Callable[[], Any],
+        decode: Callable[[Any], Any],
+        validator: Optional[Callable[[Any], str]] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """Return decoded backend data, from the cache if possible.
+
+        Args:
+            kind: Kind of data, for example ``"properties"``.
+            backend_name: Name of the backend.
+            instance: The hub/group/project the data was retrieved with.
+            fetch: Function returning the raw data from the server.
+            decode: Function returning the decoded data from the raw data.
+            validator: Function returning the validator of the raw data, used to
+                revalidate stale entries. Defaults to the ``last_update_date`` of
+                the raw data, or its content digest.
+            refresh: If ``True``, revalidate the entry even if it is fresh.
+
+        Returns:
+            The decoded data, or ``None`` if the server returned no data.
+        """
+        path = self._entry_path(kind, backend_name, instance)
+        entry = self._load(path)
+        if entry and not refresh and time.time() - entry["stored_at"] < self.ttl:
+            return entry["data"]
+
+        raw_data = fetch()
+        if not raw_data:
+            return None
+        # Compute the validator first, decoders may alter the raw data.
+        raw_validator = (validator or self.raw_data_validator)(raw_data)
+        if entry and entry["validator"] == raw_validator:
+            logger.debug("Revalidated cached %s of %s.", kind, backend_name)
+            data = entry["data"]
+        else:
+            data = decode(raw_data)
+        if data is not None:
+            self._store(path, raw_validator, data)
+        return data
+
+    def clear(self) -> None:
+        """Remove all the entries of this cache."""
+        for root, _, files in os.walk(self.cache_dir):
+            for file_name in files:
+                if file_name.endswith(".pickle"):
+                    os.remove(os.path.join(root, file_name))
+
+    @staticmethod
+    def raw_data_validator(raw_data: Any) -> str:
+        """Return the validator of raw backend data.
+
+        Args:
+            raw_data: Raw data returned by the server.
+
+        Returns:
+            The ``last_update_date`` of the data if it has one, otherwise the
+            digest of its content.
+        """
+        if isinstance(raw_data, dict) and raw_data.get("last_update_date"):
+            return str(raw_data["last_update_date"])
+        serialized = json.dumps(raw_data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, kind: str, backend_name: str, instance: Optional[str]) -> str:
+        """Return the path of a cache entry.
+
+        Args:
+            kind: Kind of data.
+            backend_name: Name of the backend.
+            instance: The hub/group/project the data was retrieved with.
+
+        Returns:
+            Path of the entry.
+        """
+        safe_instance = re.sub(r"[^\w.-]", "_", instance or "default")
+        safe_name = re.sub(r"[^\w.-]", "_", backend_name)
+        return os.path.join(self.cache_dir, safe_instance, safe_name, f"{kind}.pickle")
+
+    def _load(self, path: str) -> Optional[Dict[str, Any]]:
+        """Load a cache entry.
+
+        Args:
+            path: Path of the entry.
+
+        Returns:
+            The entry, or ``None`` if it does not exist or cannot be used.
+        """
+        try:
+            with open(path, "rb") as entry_file:
+                entry = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, err)
+            return None
+        if not isinstance(entry, dict) or entry.get("versions") != self._versions():
+            return None
+        return entry
+
+    def _store(self, path: str, validator: str, data: Any) -> None:
+        """Store a cache entry.
+
+        The entry is written to a temporary file first, so that concurrent
+        readers never see a partial entry.
+
+        Args:
+            path: Path of the entry.
+            validator: Validator of the raw data.
+            data: Decoded data.
+        """
+        entry = {
+            "versions": self._versions(),
+            "stored_at": time.time(),
+            "validator": validator,
+            "data": data,
+        }
+        try:
+            write_atomically(
+                path, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Unable to write cache entry %s: %s", path, err)
+
+    @staticmethod
+    def _versions() -> Dict[str, Any]:
+        """Return the versions an entry must have been written with to be used."""
+        return {
+            "format": CACHE_FORMAT_VERSION,
+            "qiskit-terra": terra_version,
+            "qiskit-ibm-provider": provider_version,
+        }
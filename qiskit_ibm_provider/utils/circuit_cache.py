@@ -0,0 +1,392 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of encoded circuits."""
+
+import functools
+import hashlib
+import io
+import json
+import logging
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from qiskit import __version__ as terra_version
+from qiskit.circuit import (
+    CASE_DEFAULT,
+    ClassicalRegister,
+    Clbit,
+    ControlledGate,
+    Instruction,
+    ParameterExpression,
+    QuantumCircuit,
+)
+from qiskit.circuit.controlflow import SwitchCaseOp
+from qiskit.circuit.parametervector import ParameterVectorElement
+
+from ..qpy import common
+from ..qpy.binary_io import value
+from ..qpy.binary_io.circuits import (
+    _custom_operation_kind,
+    _write_calibrations,
+    _write_registers,
+)
+from ..version import __version__ as provider_version
+from .json import RuntimeEncoder
+from .utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+
+class _Uncacheable(Exception):
+    """Raised when a circuit contains an object that cannot be fingerprinted."""
+
+
+class EncodedCircuitCache:
+    """Least recently used cache of encoded circuits.
+
+    Circuits that are submitted many times, such as calibration, benchmarking or
+    readout mitigation circuits, reuse the QPY serialized, compressed and base64
+    encoded value of their first submission instead of being encoded again.
+
+    Circuits are looked up by a fingerprint of their content: their name, global
+    phase, metadata, registers, calibrations and, for each instruction, its
+    operation, parameters, condition, label, qubits and classical bits. Changing
+    any of them, for example binding parameters or editing the metadata, changes
+    the fingerprint. Circuits with objects the fingerprint cannot represent
+    exactly, such as classical expressions or Pauli evolution gates, are never
+    cached.
+
+    The encoded values are kept in memory up to ``max_bytes``, and the least
+    recently used values are evicted when they exceed it. If ``cache_dir`` is
+    given, the values are also stored in that directory, and the values that are
+    not in memory are read from there. Entries written by a different version of
+    ``qiskit-terra`` or ``qiskit-ibm-provider`` are not used.
+
+    .. code-block:: python
+
+        provider = IBMProvider(circuit_cache=EncodedCircuitCache(cache_dir="~/.qpy"))
+        backend = provider.get_backend("ibm_kyoto")
+        for _ in range(10):
+            backend.run(calibration_circuits)
+    """
+
+    def __init__(
+        self, max_bytes: int = 256 * 1024**2, cache_dir: Optional[str] = None
+    ) -> None:
+        """EncodedCircuitCache constructor.
+
+        Args:
+            max_bytes: Maximum size, in bytes, of the encoded values kept in memory.
+            cache_dir: Optional directory where the encoded values are persisted.
+                It is created if it does not exist.
+        """
+        self.max_bytes = max_bytes
+        self.cache_dir = (
+            os.path.abspath(os.path.expanduser(cache_dir)) if cache_dir else None
+        )
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that found an encoded circuit."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def fingerprint(circuit: QuantumCircuit) -> Optional[str]:
+        """Return the fingerprint of a circuit.
+
+        Args:
+            circuit: Circuit to fingerprint.
+
+        Returns:
+            The fingerprint, or ``None`` if the circuit cannot be cached.
+        """
+        try:
+            parts = [terra_version, provider_version, common.QPY_VERSION]
+            _fingerprint_circuit(circuit, parts)
+        except _Uncacheable:
+            return None
+        return hashlib.sha256(marshal.dumps(parts, 2)).hexdigest()
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Return the encoded value of a circuit.
+
+        Args:
+            fingerprint: Fingerprint of the circuit.
+
+        Returns:
+            The encoded value, or ``None`` if it is not in the cache.
+        """
+        with self._lock:
+            encoded = self._entries.get(fingerprint)
+            if encoded is not None:
+                self.hits += 1
+                self._entries.move_to_end(fingerprint)
+                return encoded
+        encoded = self._load(fingerprint)
+        with self._lock:
+            if encoded is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._insert(fingerprint, encoded)
+        return encoded
+
+    def put(self, fingerprint: str, encoded: str) -> None:
+        """Store the encoded value of a circuit.
+
+        Args:
+            fingerprint: Fingerprint of the circuit.
+            encoded: Encoded value of the circuit.
+        """
+        with self._lock:
+            self._insert(fingerprint, encoded)
+        self._store(fingerprint, encoded)
+
+    def clear(self) -> None:
+        """Remove all the encoded circuits, including the persisted ones, and reset
+        the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+        if self.cache_dir:
+            for root, _, files in os.walk(self.cache_dir):
+                for file_name in files:
+                    if file_name.endswith(".b64"):
+                        os.remove(os.path.join(root, file_name))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, fingerprint: str, encoded: str) -> None:
+        """Insert an entry in memory and evict the least recently used ones."""
+        previous = self._entries.pop(fingerprint, None)
+        if previous is not None:
+            self.nbytes -= len(previous)
+        if len(encoded) > self.max_bytes:
+            return
+        self._entries[fingerprint] = encoded
+        self.nbytes += len(encoded)
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= len(evicted)
+
+    def _entry_path(self, fingerprint: str) -> str:
+        """Return the path of a persisted entry."""
+        return os.path.join(self.cache_dir, fingerprint[:2], f"{fingerprint}.b64")
+
+    def _load(self, fingerprint: str) -> Optional[str]:
+        """Load a persisted entry.
+
+        Args:
+            fingerprint: Fingerprint of the circuit.
+
+        Returns:
+            The encoded value, or ``None`` if it is not persisted.
+        """
+        if not self.cache_dir:
+            return None
+        path = self._entry_path(fingerprint)
+        try:
+            with open(path, "r", encoding="ascii") as entry_file:
+                return entry_file.read()
+        except FileNotFoundError:
+            return None
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, err)
+            return None
+
+    def _store(self, fingerprint: str, encoded: str) -> None:
+        """Persist an entry.
+
+        The entry is written to a temporary file first, so that concurrent
+        readers never see a partial entry.
+
+        Args:
+            fingerprint: Fingerprint of the circuit.
+            encoded: Encoded value of the circuit.
+        """
+        if not self.cache_dir:
+            return
+        path = self._entry_path(fingerprint)
+        try:
+            write_atomically(path, encoded.encode("ascii"))
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Unable to write cache entry %s: %s", path, err)
+
+
+def _fingerprint_circuit(circuit: QuantumCircuit, parts: List[Any]) -> None:
+    """Append the content of a circuit to the parts of a fingerprint.
+
+    The header of the circuit is fingerprinted with its QPY serialization, and
+    each instruction with the data QPY serializes it from.
+    """
+    with io.BytesIO() as header:
+        _write_registers(header, circuit.qregs, circuit.qubits)
+        _write_registers(header, circuit.cregs, circuit.clbits)
+        _write_calibrations(header, circuit.calibrations, RuntimeEncoder)
+        parts.append(header.getvalue())
+    parts.append(circuit.name)
+    parts.append(value.dumps_value(circuit.global_phase))
+    parts.append(
+        json.dumps(circuit.metadata, separators=(",", ":"), cls=RuntimeEncoder)
+    )
+
+    index_map = {
+        "q": {bit: index for index, bit in enumerate(circuit.qubits)},
+        "c": {bit: index for index, bit in enumerate(circuit.clbits)},
+    }
+    # Bits are looked up by identity, which is faster than their hash.
+    qubit_indices = {id(bit): index for index, bit in enumerate(circuit.qubits)}
+    clbit_indices = {id(bit): index for index, bit in enumerate(circuit.clbits)}
+    definitions: Dict[int, Any] = {}
+    for instruction in circuit.data:
+        operation = instruction.operation
+        info = _operation_class_info(operation.__class__)
+        if info is None:
+            raise _Uncacheable()
+        class_name, kind, controlled, switch = info
+        if switch:
+            params = [operation.target, tuple(operation.cases_specifier())]
+        else:
+            params = operation.params
+        condition = operation.condition
+        parts.append(
+            (
+                class_name,
+                operation.name,
+                (operation.num_ctrl_qubits, operation.ctrl_state)
+                if controlled
+                else None,
+                operation.label,
+                None if condition is None else _param_key(condition, index_map),
+                tuple(map(qubit_indices.__getitem__, map(id, instruction.qubits))),
+                tuple(map(clbit_indices.__getitem__, map(id, instruction.clbits))),
+                tuple([_param_key(param, index_map) for param in params]),
+            )
+        )
+        if kind == "custom":
+            parts.append(_definition_key(operation, definitions))
+
+
+@functools.lru_cache(maxsize=None)
+def _operation_class_info(
+    operation_class: type,
+) -> Optional[Tuple[str, Any, bool, bool]]:
+    """Return how the instructions of an operation class are fingerprinted.
+
+    Returns:
+        The class name, the kind of custom operation QPY stores the operations
+        as, and whether the class is a controlled gate and a switch, or ``None``
+        if the operations cannot be fingerprinted.
+    """
+    kind = _custom_operation_kind(operation_class)
+    if kind == "evolution" or not issubclass(operation_class, Instruction):
+        return None
+    return (
+        operation_class.__name__,
+        kind,
+        hasattr(operation_class, "num_ctrl_qubits"),
+        issubclass(operation_class, SwitchCaseOp),
+    )
+
+
+def _definition_key(operation: Any, definitions: Dict[int, Any]) -> Any:
+    """Return the key of the definition QPY stores for a custom operation."""
+    entry = definitions.get(id(operation))
+    if entry is not None:
+        return entry[1]
+    if isinstance(operation, ControlledGate):
+        operation.definition  # pylint: disable=pointless-statement
+        definition = operation._definition  # pylint: disable=protected-access
+        base_gate = operation.base_gate
+        base_key = (
+            base_gate.__class__.__name__,
+            base_gate.name,
+            tuple(_param_key(param, {}) for param in base_gate.params),
+        )
+    else:
+        definition = operation.definition
+        base_key = None
+    definition_parts: List[Any] = [base_key]
+    if definition is not None:
+        _fingerprint_circuit(definition, definition_parts)
+    key = tuple(definition_parts)
+    # The operation is kept referenced so that its id is not reused.
+    definitions[id(operation)] = (operation, key)
+    return key
+
+
+def _param_key(param: Any, index_map: Dict[str, Dict[Any, int]]) -> Any:
+    """Return the key of an instruction parameter.
+
+    Raises:
+        _Uncacheable: If the parameter cannot be fingerprinted exactly.
+    """
+    if isinstance(param, (bool, int, float, complex, str)):
+        return (type(param).__name__, param)
+    if isinstance(param, np.number):
+        return (type(param).__name__, param.item())
+    if isinstance(param, np.ndarray):
+        if param.dtype == object:
+            raise _Uncacheable()
+        return ("ndarray", param.dtype.str, param.shape, param.tobytes())
+    if isinstance(param, ParameterExpression):
+        return (
+            type(param).__name__,
+            str(param),
+            tuple(sorted(_parameter_key(parameter) for parameter in param.parameters)),
+        )
+    if isinstance(param, QuantumCircuit):
+        circuit_parts: List[Any] = []
+        _fingerprint_circuit(param, circuit_parts)
+        return ("circuit", tuple(circuit_parts))
+    if isinstance(param, range):
+        return ("range", param.start, param.stop, param.step)
+    if isinstance(param, tuple):
+        return ("tuple", tuple(_param_key(item, index_map) for item in param))
+    if isinstance(param, list):
+        return ("list", tuple(_param_key(item, index_map) for item in param))
+    if isinstance(param, Clbit):
+        try:
+            return ("clbit", index_map["c"][param])
+        except KeyError as err:
+            raise _Uncacheable() from err
+    if isinstance(param, ClassicalRegister):
+        return ("creg", param.name)
+    if param is None:
+        return None
+    if param is CASE_DEFAULT:
+        return ("default",)
+    raise _Uncacheable()
+
+
+def _parameter_key(parameter: Any) -> Any:
+    """Return the key of a parameter, including the identity QPY stores."""
+    # pylint: disable=protected-access
+    if isinstance(parameter, ParameterVectorElement):
+        return (parameter.name, parameter._uuid.hex, len(parameter.vector))
+    return (parameter.name, parameter._uuid.hex)
@@ -0,0 +1,206 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Parallel encoding of the circuits of a job."""
+
+import multiprocessing
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.tools.parallel import CPU_COUNT, parallel_map
+
+from .circuit_cache import EncodedCircuitCache
+from .json import _encode_circuit
+
+PARALLEL_MIN_INSTRUCTIONS = 50000
+"""Minimum number of instructions of the circuits of a job to encode them in parallel."""
+
+# Circuits inherited by the forked processes of ``encode_circuits``.
+_CIRCUITS: Sequence[Any] = ()
+# Held while the processes inheriting ``_CIRCUITS`` are forked and run, since
+# jobs can be encoded concurrently in several threads.
+_CIRCUITS_LOCK = threading.Lock()
+
+# First and last index of a chunk of circuits and the circuits, unless inherited.
+_Chunk = Tuple[int, int, Optional[Sequence[Any]]]
+
+
+@dataclass
+class CircuitEncodingTimes:
+    """Time spent encoding circuits, in seconds, summed over the processes."""
+
+    qpy: float = 0.0
+    compression: float = 0.0
+    base64: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """Return the total encoding time."""
+        return self.qpy + self.compression + self.base64
+
+    def add(self, other: "CircuitEncodingTimes") -> None:
+        """Add the times of another encoding."""
+        self.qpy += other.qpy
+        self.compression += other.compression
+        self.base64 += other.base64
+
+
+def encode_circuits(
+    circuits: Sequence[Any],
+    num_processes: Optional[int] = None,
+    times: Optional[CircuitEncodingTimes] = None,
+    cache: Optional[EncodedCircuitCache] = None,
+) -> List[Any]:
+    """Encode the circuits of a job in parallel processes.
+
+    Each :class:`~qiskit.circuit.QuantumCircuit` is replaced by the same JSON
+    representation :class:`~qiskit_ibm_provider.utils.RuntimeEncoder` gives it:
+    the QPY serialization of the circuit, compressed with zlib and encoded in
+    base64. Other items, such as OpenQASM 3 strings, are returned unchanged. The
+    result can be serialized with ``RuntimeEncoder`` like the input circuits.
+
+    The circuits are split in one chunk per process, with about the same number
+    of instructions in each chunk. On platforms that fork processes, the processes
+    inherit the circuits instead of receiving a copy of them, and jobs encoded
+    concurrently by several threads are encoded one at a time. Jobs with fewer than
+    :data:`PARALLEL_MIN_INSTRUCTIONS` instructions, for which starting processes
+    takes longer than encoding the circuits, are encoded in the current process.
+    Parallel processes are disabled as for :func:`qiskit.tools.parallel_map`.
+
+    Args:
+        circuits: Circuits of a job.
+        num_processes: Maximum number of processes to use. Defaults to the number
+            of CPUs.
+        times: Optional times the time spent in each encoding step is added to.
+        cache: Optional cache the circuits are looked up in before being encoded,
+            and the encoded circuits are stored in.
+
+    Returns:
+        The encoded circuits, in the same order as the input circuits.
+    """
+    global _CIRCUITS  # pylint: disable=global-statement
+    circuits = list(circuits)
+    if cache is not None:
+        return _encode_cached_circuits(circuits, num_processes, times, cache)
+    sizes = [
+        len(circuit) if isinstance(circuit, QuantumCircuit) else 0
+        for circuit in circuits
+    ]
+    num_processes = min(num_processes or CPU_COUNT, len(circuits))
+    if num_processes < 2 or sum(sizes) < PARALLEL_MIN_INSTRUCTIONS:
+        encoded, chunk_times = _encode_chunk((0, len(circuits), circuits))
+        if times is not None:
+            times.add(chunk_times)
+        return encoded
+
+    # Do not set the start method as a side effect if it was not set yet.
+    start_method = (
+        multiprocessing.get_start_method(allow_none=True)
+        or multiprocessing.get_all_start_methods()[0]
+    )
+    inherit = start_method == "fork"
+    chunks: List[_Chunk] = [
+        (start, stop, None if inherit else circuits[start:stop])
+        for start, stop in _balanced_chunks(sizes, num_processes)
+    ]
+    if inherit:
+        with _CIRCUITS_LOCK:
+            _CIRCUITS = circuits
+            try:
+                results = parallel_map(
+                    _encode_chunk, chunks, num_processes=num_processes
+                )
+            finally:
+                _CIRCUITS = ()
+    else:
+        results = parallel_map(_encode_chunk, chunks, num_processes=num_processes)
+
+    encoded = []
+    for chunk_encoded, chunk_times in results:
+        encoded.extend(chunk_encoded)
+        if times is not None:
+            times.add(chunk_times)
+    return encoded
+
+
+def _encode_cached_circuits(
+    circuits: List[Any],
+    num_processes: Optional[int],
+    times: Optional[CircuitEncodingTimes],
+    cache: EncodedCircuitCache,
+) -> List[Any]:
+    """Encode the circuits that are not in a cache and store them in it."""
+    encoded: List[Any] = list(circuits)
+    missing = []
+    fingerprints = []
+    for idx, circuit in enumerate(circuits):
+        if not isinstance(circuit, QuantumCircuit):
+            continue
+        fingerprint = cache.fingerprint(circuit)
+        value = cache.get(fingerprint) if fingerprint else None
+        if value is None:
+            missing.append(idx)
+            fingerprints.append(fingerprint)
+        else:
+            encoded[idx] = {"__type__": "QuantumCircuit", "__value__": value}
+
+    missing_encoded = encode_circuits(
+        [circuits[idx] for idx in missing], num_processes, times
+    )
+    for idx, fingerprint, circuit_encoded in zip(
+        missing, fingerprints, missing_encoded
+    ):
+        encoded[idx] = circuit_encoded
+        if fingerprint:
+            cache.put(fingerprint, circuit_encoded["__value__"])
+    return encoded
+
+
+def _encode_chunk(chunk: _Chunk) -> Tuple[List[Any], CircuitEncodingTimes]:
+    """Encode a chunk of circuits."""
+    start, stop, circuits = chunk
+    if circuits is None:
+        circuits = _CIRCUITS[start:stop]
+    times = CircuitEncodingTimes()
+    encoded = [
+        _encode_circuit(circuit, times)
+        if isinstance(circuit, QuantumCircuit)
+        else circuit
+        for circuit in circuits
+    ]
+    return encoded, times
+
+
+def _balanced_chunks(sizes: Sequence[int], num_chunks: int) -> List[Tuple[int, int]]:
+    """Split items into contiguous chunks of about the same total size.
+
+    Args:
+        sizes: Sizes of the items.
+        num_chunks: Maximum number of chunks.
+
+    Returns:
+        The first and last index of each non-empty chunk.
+    """
+    target = sum(sizes) / num_chunks
+    chunks = []
+    start = 0
+    total = 0
+    for idx, size in enumerate(sizes):
+        total += size
+        if total >= target * (len(chunks) + 1) and len(chunks) < num_chunks - 1:
+            chunks.append((start, idx + 1))
+            start = idx + 1
+    if start < len(sizes):
+        chunks.append((start, len(sizes)))
+    return chunks
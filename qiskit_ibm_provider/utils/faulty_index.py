@@ -0,0 +1,142 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Index of the faulty qubits and edges of a backend."""
+
+import itertools
+from typing import Optional, Tuple
+
+import numpy as np
+from qiskit.circuit import QuantumCircuit
+from qiskit.providers.models import BackendProperties
+
+
+class FaultyIndex:
+    """Faulty qubits and edges of a backend properties snapshot.
+
+    The faulty qubits are stored as a boolean mask and the faulty edges, the
+    qubit pairs of the faulty multi-qubit gates, as a hashed set, so that the
+    qubits of all the instructions of a circuit are checked with a few array
+    operations instead of a lookup per instruction.
+    """
+
+    def __init__(self, properties: BackendProperties, num_qubits: int) -> None:
+        """FaultyIndex constructor.
+
+        Args:
+            properties: Backend properties.
+            num_qubits: Number of qubits of the backend.
+        """
+        self.properties = properties
+        faulty_qubits = properties.faulty_qubits()
+        self.faulty_edges = {
+            tuple(gate.qubits)
+            for gate in properties.faulty_gates()
+            if len(gate.qubits) > 1
+        }
+        self._size = (
+            max([num_qubits, *faulty_qubits, *itertools.chain(*self.faulty_edges)]) + 1
+        )
+        self.faulty_qubit_mask = np.zeros(self._size, dtype=bool)
+        self.faulty_qubit_mask[faulty_qubits] = True
+        # Ordered pairs of qubits are encoded as ``first * size + second``.
+        self._faulty_edge_codes = np.array(
+            [
+                edge[0] * self._size + edge[1]
+                for edge in self.faulty_edges
+                if len(edge) == 2
+            ],
+            dtype=np.intp,
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.faulty_qubit_mask.any() or self._faulty_edge_codes.size)
+
+    def check(self, circuit: QuantumCircuit) -> None:
+        """Check that a circuit does not use faulty qubits or edges.
+
+        Barriers are allowed on faulty qubits.
+
+        Args:
+            circuit: Circuit to check.
+
+        Raises:
+            ValueError: If an instruction operating on a faulty qubit or edge is found.
+        """
+        if not self or not circuit.data:
+            return
+        faulty = self._first_faulty_instruction(circuit)
+        if faulty is None:
+            return
+        index, is_edge = faulty
+        instr = circuit.data[index]
+        qubit_indices = tuple(circuit.find_bit(qubit).index for qubit in instr.qubits)
+        if is_edge:
+            raise ValueError(
+                f"Circuit {circuit.name} contains instruction "
+                f"{instr} operating on a faulty edge {qubit_indices}"
+            )
+        faulty_qubit = next(
+            qubit for qubit in qubit_indices if self.faulty_qubit_mask[qubit]
+        )
+        raise ValueError(
+            f"Circuit {circuit.name} contains instruction "
+            f"{instr} operating on a faulty qubit {faulty_qubit}."
+        )
+
+    def _first_faulty_instruction(
+        self, circuit: QuantumCircuit
+    ) -> Optional[Tuple[int, bool]]:
+        """Return the first instruction of a circuit operating on a faulty qubit or edge.
+
+        Args:
+            circuit: Circuit to check.
+
+        Returns:
+            The index of the instruction and whether it operates on a faulty edge
+            rather than on a faulty qubit, or ``None`` if there is no such
+            instruction.
+        """
+        data = circuit.data
+        qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        instr_qubits = [instr.qubits for instr in data]
+        lengths = np.fromiter(map(len, instr_qubits), dtype=np.intp, count=len(data))
+        flat_qubits = np.fromiter(
+            map(qubit_indices.__getitem__, itertools.chain.from_iterable(instr_qubits)),
+            dtype=np.intp,
+            count=int(lengths.sum()),
+        )
+
+        faulty_qubit_instrs = np.repeat(np.arange(len(data)), lengths)[
+            self.faulty_qubit_mask[flat_qubits]
+        ]
+        faulty_edge_instrs = np.empty(0, dtype=np.intp)
+        if self._faulty_edge_codes.size:
+            two_qubit_instrs = np.flatnonzero(lengths == 2)
+            starts = np.cumsum(lengths)[two_qubit_instrs] - 2
+            codes = flat_qubits[starts] * self._size + flat_qubits[starts + 1]
+            faulty_edge_instrs = two_qubit_instrs[
+                np.isin(codes, self._faulty_edge_codes)
+            ]
+
+        # Instructions are sorted, and an instruction on a faulty qubit is
+        # reported before an instruction on a faulty edge.
+        candidates = sorted(
+            itertools.chain(
+                ((index, False) for index in np.unique(faulty_qubit_instrs)),
+                ((index, True) for index in faulty_edge_instrs),
+            )
+        )
+        for index, is_edge in candidates:
+            if data[index].operation.name != "barrier":
+                return int(index), is_edge
+        return None
@@ -23,10 +23,11 @@ import inspect
 import io
 import json
 import re
+import time
 import warnings
 import zlib
 from datetime import date
-from typing import Any, Callable, Dict, List, Union, Tuple
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
 
 import dateutil.parser
 import numpy as np
@@ -102,6 +103,32 @@ def _serialize_and_encode(
     return base64.standard_b64encode(serialized_data).decode("utf-8")
 
 
+def _encode_circuit(circuit: QuantumCircuit, times: Optional[Any] = None) -> Dict:
+    """Encode a circuit with QPY, zlib and base64.
+
+    Args:
+        circuit: Circuit to encode.
+        times: Optional :class:`~.CircuitEncodingTimes` the time spent in each
+            step is added to.
+
+    Returns:
+        The JSON representation of the circuit.
+    """
+    start = time.perf_counter()
+    with io.BytesIO() as buff:
+        dump(circuit, buff, RuntimeEncoder)  # type: ignore[no-untyped-call]
+        serialized_data = buff.getvalue()
+    serialized = time.perf_counter()
+    compressed_data = zlib.compress(serialized_data)
+    compressed = time.perf_counter()
+    value = base64.standard_b64encode(compressed_data).decode("utf-8")
+    if times is not None:
+        times.qpy += serialized - start
+        times.compression += compressed - serialized
+        times.base64 += time.perf_counter() - compressed
+    return {"__type__": "QuantumCircuit", "__value__": value}
+
+
 def _decode_and_deserialize(
     data: str, deserializer: Callable, decompress: bool = True
 ) -> Any:
@@ -211,13 +238,7 @@ class RuntimeEncoder(json.JSONEncoder):
         if hasattr(obj, "to_json"):
             return {"__type__": "to_json", "__value__": obj.to_json()}
         if isinstance(obj, QuantumCircuit):
-            value = _serialize_and_encode(
-                data=obj,
-                serializer=lambda buff, data: dump(
-                    data, buff, RuntimeEncoder
-                ),  # type: ignore[no-untyped-call]
-            )
-            return {"__type__": "QuantumCircuit", "__value__": value}
+            return _encode_circuit(obj)
         if isinstance(obj, Parameter):
             value = _serialize_and_encode(
                 data=obj,
@@ -11,7 +11,7 @@
 # that they have been altered from the originals.
 
 """Custom JSON decoder."""
-from typing import Dict, Tuple, Union, List, Any, Optional
+from typing import BinaryIO, Callable, Dict, Tuple, Union, List, Any, Optional
 import json
 import logging
 
@@ -21,7 +21,6 @@ from qiskit.providers.models import (
     PulseBackendConfiguration,
     PulseDefaults,
     BackendProperties,
-    Command,
 )
 from qiskit.providers.models.backendproperties import Gate as GateSchema
 from qiskit.circuit.controlflow import IfElseOp, WhileLoopOp, ForLoopOp
@@ -30,15 +29,19 @@ from qiskit.circuit.parameter import Parameter
 from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
 from qiskit.pulse.calibration_entries import PulseQobjDef
 from qiskit.transpiler.target import Target, InstructionProperties
-from qiskit.qobj.pulse_qobj import PulseLibraryItem
+from qiskit.qobj.pulse_qobj import PulseLibraryItem, PulseQobjInstruction
 from qiskit.qobj.converters.pulse_instruction import QobjToInstructionConverter
-from qiskit.utils import apply_prefix
+from qiskit.utils import LazyImportTester, apply_prefix
 
 from .converters import utc_to_local, utc_to_local_all
 from ..ibm_qubit_properties import IBMQubitProperties
 
 logger = logging.getLogger(__name__)
 
+HAS_IJSON = LazyImportTester(
+    "ijson", name="ijson", install="pip install 'qiskit-ibm-provider[stream]'"
+)
+
 
 def defaults_from_server_data(defaults: Dict) -> PulseDefaults:
     """Decode pulse defaults data.
@@ -132,7 +135,7 @@ def target_from_server_data(
     faulty_ops = set()
 
     # Create name to Qiskit instruction object repr mapping
-    for name in all_instructions:
+    for name in list(all_instructions):
         if name in qiskit_control_flow_mapping:
             continue
         if name in qiskit_inst_mapping:
@@ -223,12 +226,14 @@ def target_from_server_data(
             map(PulseLibraryItem.from_dict, pulse_defaults["pulse_library"])
         )
         converter = QobjToInstructionConverter(pulse_lib)
-        for cmd in map(Command.from_dict, pulse_defaults["cmd_def"]):
-            name = cmd.name
-            qubits = tuple(cmd.qubits)
+        for cmd in pulse_defaults["cmd_def"]:
+            name = cmd["name"]
+            qubits = tuple(cmd.get("qubits", ()))
             if (name, qubits) in faulty_ops:
                 continue
-            if name not in all_instructions or qubits not in prop_name_map[name]:
+            if name not in all_instructions or qubits not in (
+                prop_name_map.get(name) or {}
+            ):
                 logger.info(
                     "Gate calibration for instruction %s on qubits %s is found "
                     "in the PulseDefaults payload. However, this entry is not defined in "
@@ -237,8 +242,8 @@ def target_from_server_data(
                     qubits,
                 )
                 continue
-            entry = PulseQobjDef(converter=converter, name=cmd.name)
-            entry.define(cmd.sequence)
+            entry = _LazyPulseQobjDef(converter=converter, name=name)
+            entry.define_raw(cmd.get("sequence", []))
             try:
                 prop_name_map[name][qubits].calibration = entry
             except AttributeError:
@@ -267,6 +272,47 @@ def target_from_server_data(
     return target
 
 
+class _LazyPulseQobjDef(PulseQobjDef):
+    """Calibration entry whose cmd-def sequence is decoded when it is first used.
+
+    Decoding the sequences of all the calibrations of a large backend dominates
+    the construction of its target, while a transpilation only uses a few of them.
+    """
+
+    def __init__(
+        self,
+        converter: Optional[QobjToInstructionConverter] = None,
+        name: Optional[str] = None,
+    ):
+        self._raw_sequence: Optional[List[Dict]] = None
+        self._decoded_sequence: Optional[List[PulseQobjInstruction]] = None
+        super().__init__(converter=converter, name=name)
+
+    @property
+    def _source(self) -> Optional[List[PulseQobjInstruction]]:
+        if self._raw_sequence is not None:
+            self._decoded_sequence = list(
+                map(PulseQobjInstruction.from_dict, self._raw_sequence)
+            )
+            self._raw_sequence = None
+        return self._decoded_sequence
+
+    @_source.setter
+    def _source(self, sequence: Optional[List[PulseQobjInstruction]]) -> None:
+        self._raw_sequence = None
+        self._decoded_sequence = sequence
+
+    def define_raw(self, sequence: List[Dict]) -> None:
+        """Define the entry from the raw cmd-def sequence of the pulse defaults.
+
+        Args:
+            sequence: Instructions of the sequence, in dictionary format.
+        """
+        self._raw_sequence = sequence
+        self._decoded_sequence = None
+        self._user_provided = False
+
+
 def decode_pulse_qobj(pulse_qobj: Dict) -> None:
     """Decode a pulse Qobj.
 
@@ -296,14 +342,17 @@ def decode_backend_configuration(config: Dict) -> None:
                 u_channel_lo["scale"] = _to_complex(u_channel_lo["scale"])
 
 
-def decode_result(result: str, result_decoder: Any) -> Dict:
+def decode_result(result: Union[str, bytes, Dict], result_decoder: Any) -> Dict:
     """Decode result data.
 
     Args:
-        result: Run result in string format.
+        result: Run result in string format, or already loaded from JSON.
         result_decoder: A decoder class for loading the json
     """
-    result_dict = json.loads(result, cls=result_decoder)
+    if isinstance(result, dict):
+        result_dict = result
+    else:
+        result_dict = json.loads(result, cls=result_decoder)
     if "date" in result_dict:
         if isinstance(result_dict["date"], str):
             result_dict["date"] = dateutil.parser.isoparse(result_dict["date"])
@@ -311,6 +360,69 @@ def decode_result(result: str, result_decoder: Any) -> Dict:
     return result_dict
 
 
+def decode_result_stream(stream: BinaryIO, result_decoder: Any) -> Dict:
+    """Decode result data read incrementally from a binary stream.
+
+    If ``ijson`` is installed, the JSON document is parsed as it is read and each
+    object is passed to the ``object_hook`` of the decoder as soon as it is
+    complete. Tagged values, such as arrays and circuits, are therefore decoded
+    while the rest of the stream is read, and the raw document is never held in
+    memory as a whole. Otherwise, the stream is read and decoded at once.
+
+    Args:
+        stream: Binary stream of the run result in JSON format.
+        result_decoder: A decoder class for loading the json
+
+    Returns:
+        The decoded result data.
+    """
+    if HAS_IJSON:
+        result_dict = _load_json_stream(stream, result_decoder().object_hook)
+    else:
+        result_dict = json.load(stream, cls=result_decoder)
+    return decode_result(result_dict, result_decoder)
+
+
+def _load_json_stream(stream: BinaryIO, object_hook: Callable[[Dict], Any]) -> Any:
+    """Build the objects of a JSON document from the events of an ``ijson`` parser.
+
+    Args:
+        stream: Binary stream of the JSON document.
+        object_hook: Function called with each decoded object, whose return
+            value is used instead of the object.
+
+    Returns:
+        The decoded document.
+    """
+    import ijson  # pylint: disable=import-error
+
+    containers: List[Union[Dict, List]] = []
+    keys: List[Optional[str]] = []
+    document = None
+    for event, value in ijson.basic_parse(stream, use_float=True):
+        if event == "map_key":
+            keys[-1] = value
+            continue
+        if event in ("start_map", "start_array"):
+            containers.append({} if event == "start_map" else [])
+            keys.append(None)
+            continue
+        if event == "end_map":
+            keys.pop()
+            value = object_hook(containers.pop())
+        elif event == "end_array":
+            keys.pop()
+            value = containers.pop()
+
+        if not containers:
+            document = value
+        elif keys[-1] is None:
+            containers[-1].append(value)
+        else:
+            containers[-1][keys[-1]] = value
+    return document
+
+
 def _to_complex(value: Union[List[float], complex]) -> complex:
     """Convert the input value to type ``complex``.
 
@@ -0,0 +1,215 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Incremental updates of decoded backend properties."""
+
+import copy
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import dateutil.parser
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Gate as GateSchema, Nduv
+from qiskit.transpiler.target import Target
+
+from .converters import utc_to_local
+from .json_decoder import (
+    _decode_instruction_property,
+    _decode_measure_property,
+    _decode_qubit_property,
+)
+
+_PROPERTIES_FIELDS = {"last_update_date", "qubits", "gates", "general"}
+
+
+@dataclass
+class PropertiesDelta:
+    """Changes between two versions of the properties of a backend.
+
+    Published, with the backend, as the ``ibm.backend.properties_update`` event
+    when :meth:`IBMBackend.properties(refresh=True)
+    <qiskit_ibm_provider.IBMBackend.properties>` finds updated properties.
+    """
+
+    last_update_date: Optional[datetime] = None
+    """Update date of the new properties, in local time."""
+
+    qubits: List[int] = field(default_factory=list)
+    """Qubits whose properties changed."""
+
+    gates: List[Tuple[str, Tuple[int, ...]]] = field(default_factory=list)
+    """Names and qubits of the gates whose properties changed."""
+
+    general: bool = False
+    """Whether the general properties changed."""
+
+    full: bool = False
+    """Whether the properties were decoded again as a whole, because the set of
+    qubits, gates or faulty components changed, instead of being patched."""
+
+    def __bool__(self) -> bool:
+        return bool(self.full or self.qubits or self.gates or self.general)
+
+
+def properties_delta(old: Dict, new: Dict) -> PropertiesDelta:
+    """Return the changes between two raw properties payloads.
+
+    Args:
+        old: Previous raw properties data.
+        new: New raw properties data.
+
+    Returns:
+        The changes. ``full`` is set if the new payload cannot be applied as a
+        patch: its qubits, gates or other fields differ, or a qubit or gate
+        became faulty or operational.
+    """
+    delta = PropertiesDelta(
+        last_update_date=utc_to_local(dateutil.parser.isoparse(new["last_update_date"]))
+    )
+    if (
+        {key: value for key, value in old.items() if key not in _PROPERTIES_FIELDS}
+        != {key: value for key, value in new.items() if key not in _PROPERTIES_FIELDS}
+        or len(old["qubits"]) != len(new["qubits"])
+        or [(gate["gate"], gate["qubits"]) for gate in old["gates"]]
+        != [(gate["gate"], gate["qubits"]) for gate in new["gates"]]
+    ):
+        delta.full = True
+        return delta
+
+    for qubit, (old_qubit, new_qubit) in enumerate(zip(old["qubits"], new["qubits"])):
+        if old_qubit != new_qubit:
+            if _operational(old_qubit) != _operational(new_qubit):
+                delta.full = True
+            delta.qubits.append(qubit)
+    for old_gate, new_gate in zip(old["gates"], new["gates"]):
+        if old_gate != new_gate:
+            if _operational(old_gate["parameters"]) != _operational(
+                new_gate["parameters"]
+            ):
+                delta.full = True
+            delta.gates.append((new_gate["gate"], tuple(new_gate["qubits"])))
+    delta.general = old["general"] != new["general"]
+    return delta
+
+
+def patch_properties(
+    properties: BackendProperties, new: Dict, delta: PropertiesDelta
+) -> BackendProperties:
+    """Apply the changes of a properties payload to decoded properties.
+
+    The input properties are not modified, since they may already have been
+    returned to callers. A shallow copy is returned instead, in which only the
+    lists and mappings of the changed qubits and gates are replaced.
+
+    Args:
+        properties: Decoded properties of the previous payload.
+        new: New raw properties data.
+        delta: Changes between the previous and the new payload.
+
+    Returns:
+        The decoded properties of the new payload.
+    """
+    # pylint: disable=protected-access
+    patched = copy.copy(properties)
+    patched.last_update_date = delta.last_update_date
+    if delta.qubits:
+        patched.qubits = list(properties.qubits)
+        patched._qubits = dict(properties._qubits)
+    for qubit in delta.qubits:
+        nduvs = list(map(Nduv.from_dict, _local_dates(new["qubits"][qubit])))
+        patched.qubits[qubit] = nduvs
+        patched._qubits[qubit] = {
+            nduv.name: (patched._apply_prefix(nduv.value, nduv.unit), nduv.date)
+            for nduv in nduvs
+        }
+    if delta.gates:
+        changed = set(delta.gates)
+        patched.gates = list(properties.gates)
+        patched._gates = dict(properties._gates)
+        for name in {name for name, _ in changed}:
+            patched._gates[name] = dict(properties._gates[name])
+        for index, raw_gate in enumerate(new["gates"]):
+            key = (raw_gate["gate"], tuple(raw_gate["qubits"]))
+            if key not in changed:
+                continue
+            gate = GateSchema.from_dict(
+                {**raw_gate, "parameters": _local_dates(raw_gate["parameters"])}
+            )
+            patched.gates[index] = gate
+            patched._gates[gate.gate][key[1]] = {
+                param.name: (
+                    patched._apply_prefix(param.value, param.unit),
+                    param.date,
+                )
+                for param in gate.parameters
+            }
+    if delta.general:
+        patched.general = list(map(Nduv.from_dict, _local_dates(new["general"])))
+    return patched
+
+
+def patch_target(target: Target, new: Dict, delta: PropertiesDelta) -> None:
+    """Apply the changes of a properties payload to a target, in place.
+
+    The durations and errors of the changed instructions, and the properties of
+    the changed qubits, are updated. Calibrations are kept.
+
+    Args:
+        target: Target built from the previous payload.
+        new: New raw properties data.
+        delta: Changes between the previous and the new payload.
+    """
+    for qubit in delta.qubits:
+        qubit_specs = new["qubits"][qubit]
+        if target.qubit_properties is not None:
+            target.qubit_properties[qubit] = _decode_qubit_property(qubit_specs)
+        _update_instruction(
+            target, "measure", (qubit,), _decode_measure_property(qubit_specs)
+        )
+    if delta.gates:
+        changed = set(delta.gates)
+        for raw_gate in new["gates"]:
+            key = (raw_gate["gate"], tuple(raw_gate["qubits"]))
+            if key in changed:
+                inst_prop, _ = _decode_instruction_property(
+                    GateSchema.from_dict(raw_gate)
+                )
+                _update_instruction(target, key[0], key[1], inst_prop)
+
+
+def _update_instruction(
+    target: Target, name: str, qubits: Tuple[int, ...], decoded: Any
+) -> None:
+    """Update the duration and error of an instruction of a target, in place."""
+    if name not in target or qubits not in target[name]:
+        return
+    inst_prop = target[name][qubits]
+    if inst_prop is None:
+        return
+    inst_prop.duration = decoded.duration
+    inst_prop.error = decoded.error
+    # Resets the durations and schedule map cached by the target.
+    target.update_instruction_properties(name, qubits, inst_prop)
+
+
+def _local_dates(nduvs: List[Dict]) -> List[Dict]:
+    """Return raw name, date, unit and value entries with dates in local time."""
+    return [
+        {**nduv, "date": utc_to_local(dateutil.parser.isoparse(nduv["date"]))}
+        for nduv in nduvs
+    ]
+
+
+def _operational(nduvs: List[Dict]) -> bool:
+    """Return whether a qubit or gate is operational."""
+    return all(bool(nduv["value"]) for nduv in nduvs if nduv["name"] == "operational")
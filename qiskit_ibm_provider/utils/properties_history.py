@@ -0,0 +1,669 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Local store of the historical properties of backends."""
+
+import bisect
+import copy
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import dateutil.parser
+import numpy as np
+from qiskit.providers.models import BackendProperties
+from qiskit.utils.units import apply_prefix
+
+from ..exceptions import IBMBackendApiProtocolError
+from .converters import local_to_utc
+from .json_decoder import properties_from_server_data
+from .utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+FetchProperties = Callable[[datetime], Optional[Dict]]
+"""Function returning the raw properties of a backend in effect at a UTC date."""
+
+# Smallest step between two queried dates.
+_RESOLUTION = timedelta(microseconds=1)
+
+# Rows of the qubit properties exported by ``PropertiesHistory.to_arrays``.
+_QUBIT_ROWS = {"T1": 0, "T2": 1, "readout_error": 2}
+
+
+@dataclass
+class PropertiesArrays:
+    """Qubit and gate properties of a series of snapshots, as arrays.
+
+    Row ``i`` of each array holds the values of the snapshot updated at
+    ``dates[i]``. Values a snapshot does not report are ``NaN``. Times are in
+    seconds.
+    """
+
+    dates: np.ndarray
+    """UTC update dates of the snapshots, as ``datetime64[us]`` values."""
+
+    t1: np.ndarray
+    """T1 of the qubits, with one column per qubit."""
+
+    t2: np.ndarray
+    """T2 of the qubits, with one column per qubit."""
+
+    readout_error: np.ndarray
+    """Readout error of the qubits, with one column per qubit."""
+
+    gates: List[Tuple[str, Tuple[int, ...]]]
+    """Names and qubits of the gates, in the order of the columns of ``gate_error``."""
+
+    gate_error: np.ndarray
+    """Error of the gates, with one column per gate."""
+
+
+class _Columns(NamedTuple):
+    """Values of a snapshot exported by ``PropertiesHistory.to_arrays``."""
+
+    qubits: np.ndarray
+    gates: Tuple[Tuple[str, Tuple[int, ...]], ...]
+    gate_error: np.ndarray
+
+
+class _Timeline:
+    """Snapshots of the properties of a backend, sorted by update date."""
+
+    def __init__(self) -> None:
+        self.dates: List[datetime] = []
+        # Latest queried date each snapshot is known to be in effect at.
+        self.valid_until: Dict[datetime, datetime] = {}
+        # Latest queried date the backend is known to have no properties at.
+        self.empty_until: Optional[datetime] = None
+
+    def add(self, update_date: datetime, valid_until: datetime) -> bool:
+        """Record that a snapshot is in effect up to a date.
+
+        Returns:
+            Whether the snapshot is new.
+        """
+        if update_date in self.valid_until:
+            self.valid_until[update_date] = max(
+                self.valid_until[update_date], valid_until
+            )
+            return False
+        bisect.insort(self.dates, update_date)
+        self.valid_until[update_date] = max(update_date, valid_until)
+        return True
+
+    def remove(self, update_date: datetime) -> None:
+        """Forget a snapshot."""
+        self.dates.remove(update_date)
+        del self.valid_until[update_date]
+
+    def lookup(self, date: datetime) -> Tuple[bool, Optional[datetime]]:
+        """Return the update date of the snapshot in effect at a date.
+
+        Returns:
+            Whether the snapshot in effect is known and, if so, its update date,
+            or ``None`` if the backend has no properties at that date.
+        """
+        index = bisect.bisect_right(self.dates, date) - 1
+        if index >= 0:
+            update_date = self.dates[index]
+            return date <= self.valid_until[update_date], update_date
+        if self.empty_until is not None and date <= self.empty_until:
+            return True, None
+        return False, None
+
+
+class PropertiesHistory:
+    """Time-indexed store of the properties snapshots of backends.
+
+    Each snapshot of the properties of a backend is downloaded once and indexed
+    by its update date. The store remembers the dates each snapshot was found to
+    be in effect at, so that a query for the properties in effect at a date
+    between two known queries is answered without contacting the server. Range
+    queries download each snapshot of the range at most once, and the qubit and
+    gate properties of a range can be exported as NumPy arrays, for example to
+    analyze their drift.
+
+    If ``cache_dir`` is given, the snapshots and the dates they are in effect at
+    are also stored in that directory, and shared with other sessions. Otherwise
+    up to ``max_raw`` snapshots are kept in memory, and the least recently used
+    ones are downloaded again if needed. The values of up to ``max_raw``
+    snapshots exported as arrays are also kept in memory.
+
+    .. code-block:: python
+
+        provider = IBMProvider(properties_history=PropertiesHistory("~/.properties"))
+        backend = provider.get_backend("ibm_kyoto")
+        arrays = backend.properties_arrays(datetime(2023, 1, 1), datetime(2023, 6, 1))
+        mean_t1 = np.nanmean(arrays.t1, axis=1)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_decoded: int = 32,
+        max_raw: int = 64,
+    ) -> None:
+        """PropertiesHistory constructor.
+
+        Args:
+            cache_dir: Optional directory where the snapshots are persisted. It is
+                created if it does not exist.
+            max_decoded: Maximum number of decoded
+                :class:`~qiskit.providers.models.BackendProperties` kept in memory.
+            max_raw: Maximum number of raw snapshots kept in memory if there is
+                no ``cache_dir``, and of snapshots whose values exported as arrays
+                are kept in memory.
+        """
+        self.cache_dir = (
+            os.path.abspath(os.path.expanduser(cache_dir)) if cache_dir else None
+        )
+        self.max_decoded = max_decoded
+        self.max_raw = max_raw
+        self.hits = 0
+        self.misses = 0
+        self._timelines: Dict[str, _Timeline] = {}
+        self._decoded: "OrderedDict[Tuple[str, datetime], BackendProperties]" = (
+            OrderedDict()
+        )
+        self._raw: "OrderedDict[Tuple[str, datetime], Dict]" = OrderedDict()
+        self._extracted: "OrderedDict[Tuple[str, datetime], _Columns]" = OrderedDict()
+        self._lock = threading.RLock()
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(
+        self, backend_name: str, date: datetime, fetch: FetchProperties
+    ) -> Optional[Dict]:
+        """Return the raw properties of a backend in effect at a date.
+
+        The properties in effect at a date are the most recent snapshot updated
+        at or before it.
+
+        Args:
+            backend_name: Name of the backend.
+            date: Date of the query. Dates without a timezone are in local time.
+            fetch: Function returning the raw properties in effect at a UTC date
+                from the server, used if the store cannot answer the query.
+
+        Returns:
+            The raw properties, which are shared and must not be modified, or
+            ``None`` if the backend has no properties at that date.
+
+        Raises:
+            IBMBackendApiProtocolError: If a snapshot that is no longer stored
+                cannot be downloaded again.
+        """
+        update_date = self._snapshot_date(backend_name, local_to_utc(date), fetch)
+        if update_date is None:
+            return None
+        return self._load_raw(backend_name, update_date, fetch)
+
+    def properties(
+        self, backend_name: str, date: datetime, fetch: FetchProperties
+    ) -> Optional[BackendProperties]:
+        """Return the decoded properties of a backend in effect at a date.
+
+        Args:
+            backend_name: Name of the backend.
+            date: Date of the query. Dates without a timezone are in local time.
+            fetch: Function returning the raw properties in effect at a UTC date
+                from the server, used if the store cannot answer the query.
+
+        Returns:
+            The properties, or ``None`` if the backend has no properties at that
+            date.
+
+        Raises:
+            IBMBackendApiProtocolError: If a snapshot that is no longer stored
+                cannot be downloaded again.
+        """
+        update_date = self._snapshot_date(backend_name, local_to_utc(date), fetch)
+        if update_date is None:
+            return None
+        return self._decode(backend_name, update_date, fetch)
+
+    def properties_range(
+        self,
+        backend_name: str,
+        start: datetime,
+        end: Optional[datetime],
+        fetch: FetchProperties,
+    ) -> List[BackendProperties]:
+        """Return the decoded properties of a backend in effect during a date range.
+
+        Args:
+            backend_name: Name of the backend.
+            start: Start of the range. Dates without a timezone are in local time.
+            end: End of the range. Defaults to now.
+            fetch: Function returning the raw properties in effect at a UTC date
+                from the server, used for the parts of the range the store
+                cannot answer.
+
+        Returns:
+            The properties in effect at ``start`` and the ones updated until
+            ``end``, sorted by update date.
+
+        Raises:
+            IBMBackendApiProtocolError: If a snapshot that is no longer stored
+                cannot be downloaded again.
+        """
+        # Each snapshot is decoded as soon as it is found, while it is in memory.
+        properties = [
+            self._decode(backend_name, update_date, fetch)
+            for update_date in self._range(backend_name, start, end, fetch)
+        ]
+        properties.reverse()
+        return properties
+
+    def to_arrays(
+        self,
+        backend_name: str,
+        start: datetime,
+        end: Optional[datetime],
+        fetch: FetchProperties,
+    ) -> PropertiesArrays:
+        """Return the qubit and gate properties of a date range as arrays.
+
+        The snapshots are the same as the ones returned by
+        :meth:`properties_range`, but they are not decoded.
+
+        Args:
+            backend_name: Name of the backend.
+            start: Start of the range. Dates without a timezone are in local time.
+            end: End of the range. Defaults to now.
+            fetch: Function returning the raw properties in effect at a UTC date
+                from the server, used for the parts of the range the store
+                cannot answer.
+
+        Returns:
+            The T1, T2 and readout error of the qubits and the error of the gates
+            of each snapshot.
+
+        Raises:
+            IBMBackendApiProtocolError: If a snapshot that is no longer stored
+                cannot be downloaded again.
+        """
+        update_dates = []
+        all_columns = []
+        for update_date in self._range(backend_name, start, end, fetch):
+            update_dates.append(update_date)
+            all_columns.append(self._columns(backend_name, update_date, fetch))
+        update_dates.reverse()
+        all_columns.reverse()
+        num_qubits = max(
+            (columns.qubits.shape[1] for columns in all_columns), default=0
+        )
+        gate_index: Dict[Tuple[str, Tuple[int, ...]], int] = {}
+        for columns in all_columns:
+            for gate in columns.gates:
+                gate_index.setdefault(gate, len(gate_index))
+
+        qubit_values = np.full((len(_QUBIT_ROWS), len(all_columns), num_qubits), np.nan)
+        gate_error = np.full((len(all_columns), len(gate_index)), np.nan)
+        gates: Tuple = ()
+        positions = np.empty(0, dtype=np.intp)
+        for row, columns in enumerate(all_columns):
+            qubit_values[:, row, : columns.qubits.shape[1]] = columns.qubits
+            # Consecutive snapshots usually have the same gates.
+            if columns.gates != gates:
+                gates = columns.gates
+                positions = np.fromiter(
+                    map(gate_index.__getitem__, gates), dtype=np.intp, count=len(gates)
+                )
+            gate_error[row, positions] = columns.gate_error
+
+        return PropertiesArrays(
+            dates=np.array(
+                [update_date.replace(tzinfo=None) for update_date in update_dates],
+                dtype="datetime64[us]",
+            ),
+            t1=qubit_values[_QUBIT_ROWS["T1"]],
+            t2=qubit_values[_QUBIT_ROWS["T2"]],
+            readout_error=qubit_values[_QUBIT_ROWS["readout_error"]],
+            gates=list(gate_index),
+            gate_error=gate_error,
+        )
+
+    def dates(self, backend_name: str) -> List[datetime]:
+        """Return the update dates of the stored snapshots of a backend.
+
+        Args:
+            backend_name: Name of the backend.
+
+        Returns:
+            The UTC update dates, sorted.
+        """
+        with self._lock:
+            return list(self._timeline(backend_name).dates)
+
+    def clear(self) -> None:
+        """Remove all the snapshots of this store."""
+        with self._lock:
+            self._timelines.clear()
+            self._decoded.clear()
+            self._raw.clear()
+            self._extracted.clear()
+            if self.cache_dir:
+                for root, _, files in os.walk(self.cache_dir):
+                    for file_name in files:
+                        if file_name.endswith((".json.gz", ".json")):
+                            os.remove(os.path.join(root, file_name))
+
+    def _range(
+        self,
+        backend_name: str,
+        start: datetime,
+        end: Optional[datetime],
+        fetch: FetchProperties,
+    ) -> Iterator[datetime]:
+        """Yield the update dates of the snapshots in effect during a date range.
+
+        The range is walked backwards from its end: the snapshot in effect just
+        before each snapshot is the previous one. The update dates are therefore
+        yielded from the most recent one.
+        """
+        start = local_to_utc(start)
+        date = local_to_utc(end) if end else datetime.now(timezone.utc)
+        previous: Optional[datetime] = None
+        while date >= start or previous is None:
+            update_date = self._snapshot_date(backend_name, date, fetch)
+            if update_date is None:
+                break
+            if previous is not None and update_date >= previous:
+                logger.warning(
+                    "Properties of %s in effect at %s were updated at %s, after "
+                    "the date. The history is truncated.",
+                    backend_name,
+                    date,
+                    update_date,
+                )
+                break
+            yield update_date
+            previous = update_date
+            date = update_date - _RESOLUTION
+
+    def _snapshot_date(
+        self, backend_name: str, date: datetime, fetch: FetchProperties
+    ) -> Optional[datetime]:
+        """Return the update date of the snapshot in effect at a UTC date."""
+        with self._lock:
+            found, update_date = self._timeline(backend_name).lookup(date)
+            if found:
+                self.hits += 1
+                return update_date
+            self.misses += 1
+
+        fetched_at = datetime.now(timezone.utc)
+        raw_properties = fetch(date)
+        # Snapshots can still be added after a future date.
+        return self._record(backend_name, min(date, fetched_at), raw_properties)
+
+    def _record(
+        self, backend_name: str, valid_until: datetime, raw_properties: Optional[Dict]
+    ) -> Optional[datetime]:
+        """Store the snapshot fetched for a UTC date, or that there is none.
+
+        Returns:
+            The update date of the snapshot, or ``None`` if the backend has no
+            properties at that date.
+        """
+        with self._lock:
+            timeline = self._timeline(backend_name)
+            if not raw_properties:
+                timeline.empty_until = max(
+                    timeline.empty_until or valid_until, valid_until
+                )
+                self._store_index(backend_name, timeline)
+                return None
+            update_date = _update_date(raw_properties)
+            # Known snapshots are only kept again if they may have been evicted.
+            if timeline.add(update_date, valid_until) or not self.cache_dir:
+                self._store_snapshot(backend_name, update_date, raw_properties)
+            self._store_index(backend_name, timeline)
+            return update_date
+
+    def _load_raw(
+        self, backend_name: str, update_date: datetime, fetch: FetchProperties
+    ) -> Dict:
+        """Return the raw data of a stored snapshot.
+
+        A snapshot whose file disappeared, or that was evicted from memory, is
+        fetched again.
+
+        Raises:
+            IBMBackendApiProtocolError: If the snapshot fetched again is not the
+                requested one. The fetched snapshot is stored instead, so the
+                next query for the same date returns it.
+        """
+        with self._lock:
+            timeline = self._timeline(backend_name)
+            if self.cache_dir:
+                raw_properties = self._load_snapshot(backend_name, update_date)
+            else:
+                raw_properties = self._raw.get((backend_name, update_date))
+                if raw_properties is not None:
+                    self._raw.move_to_end((backend_name, update_date))
+            if raw_properties is not None:
+                return raw_properties
+            # The snapshot is in effect at the date it was found at.
+            valid_until = timeline.valid_until[update_date]
+            timeline.remove(update_date)
+            self._extracted.pop((backend_name, update_date), None)
+        logger.debug(
+            "Properties of %s updated at %s are no longer stored.",
+            backend_name,
+            update_date,
+        )
+        raw_properties = fetch(valid_until)
+        fetched_date = self._record(backend_name, valid_until, raw_properties)
+        if fetched_date != update_date:
+            found = f"were updated at {fetched_date}" if fetched_date else "are missing"
+            raise IBMBackendApiProtocolError(
+                f"Properties of {backend_name} updated at {update_date} are no "
+                f"longer available. The properties in effect at {valid_until} {found}."
+            )
+        return raw_properties
+
+    def _decode(
+        self, backend_name: str, update_date: datetime, fetch: FetchProperties
+    ) -> BackendProperties:
+        """Return the decoded properties of a stored snapshot."""
+        key = (backend_name, update_date)
+        with self._lock:
+            properties = self._decoded.get(key)
+            if properties is not None:
+                self._decoded.move_to_end(key)
+                return properties
+        properties = properties_from_server_data(
+            copy.deepcopy(self._load_raw(backend_name, update_date, fetch))
+        )
+        with self._lock:
+            self._decoded[key] = properties
+            while len(self._decoded) > self.max_decoded:
+                self._decoded.popitem(last=False)
+        return properties
+
+    def _columns(
+        self, backend_name: str, update_date: datetime, fetch: FetchProperties
+    ) -> _Columns:
+        """Return the values of a stored snapshot exported as arrays."""
+        key = (backend_name, update_date)
+        with self._lock:
+            columns = self._extracted.get(key)
+            if columns is not None:
+                self._extracted.move_to_end(key)
+                return columns
+        columns = _snapshot_columns(self._load_raw(backend_name, update_date, fetch))
+        with self._lock:
+            self._extracted[key] = columns
+            while len(self._extracted) > self.max_raw:
+                self._extracted.popitem(last=False)
+        return columns
+
+    def _timeline(self, backend_name: str) -> _Timeline:
+        """Return the timeline of a backend, loading its index if persisted."""
+        timeline = self._timelines.get(backend_name)
+        if timeline is None:
+            timeline = _Timeline()
+            if self.cache_dir:
+                self._merge_index(backend_name, timeline)
+            self._timelines[backend_name] = timeline
+        return timeline
+
+    def _backend_dir(self, backend_name: str) -> str:
+        """Return the directory of the persisted snapshots of a backend."""
+        return os.path.join(self.cache_dir, re.sub(r"[^\w.-]", "_", backend_name))
+
+    def _snapshot_path(self, backend_name: str, update_date: datetime) -> str:
+        """Return the path of a persisted snapshot."""
+        return os.path.join(
+            self._backend_dir(backend_name),
+            f"{update_date.strftime('%Y%m%dT%H%M%S%fZ')}.json.gz",
+        )
+
+    def _merge_index(self, backend_name: str, timeline: _Timeline) -> None:
+        """Add the persisted snapshot dates of a backend to its timeline."""
+        path = os.path.join(self._backend_dir(backend_name), "index.json")
+        try:
+            with open(path, encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            snapshots = {
+                _parse_date(update_date): _parse_date(valid_until)
+                for update_date, valid_until in index["snapshots"].items()
+            }
+            empty_until = index.get("empty_until")
+        except FileNotFoundError:
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Ignoring unreadable properties index %s: %s", path, err)
+            return
+        for update_date, valid_until in snapshots.items():
+            timeline.add(update_date, valid_until)
+        if empty_until:
+            timeline.empty_until = max(
+                timeline.empty_until or _parse_date(empty_until),
+                _parse_date(empty_until),
+            )
+
+    def _store_index(self, backend_name: str, timeline: _Timeline) -> None:
+        """Persist the snapshot dates of a backend, merged with the persisted ones."""
+        if not self.cache_dir:
+            return
+        self._merge_index(backend_name, timeline)
+        index = {
+            "snapshots": {
+                update_date.isoformat(): valid_until.isoformat()
+                for update_date, valid_until in timeline.valid_until.items()
+            },
+            "empty_until": timeline.empty_until.isoformat()
+            if timeline.empty_until
+            else None,
+        }
+        self._write(
+            os.path.join(self._backend_dir(backend_name), "index.json"),
+            json.dumps(index).encode("utf-8"),
+        )
+
+    def _store_snapshot(
+        self, backend_name: str, update_date: datetime, raw_properties: Dict
+    ) -> None:
+        """Persist the raw data of a snapshot, or keep it in memory."""
+        if self.cache_dir:
+            self._write(
+                self._snapshot_path(backend_name, update_date),
+                gzip.compress(json.dumps(raw_properties, default=str).encode("utf-8")),
+            )
+            return
+        self._raw[(backend_name, update_date)] = raw_properties
+        self._raw.move_to_end((backend_name, update_date))
+        while len(self._raw) > self.max_raw:
+            self._raw.popitem(last=False)
+
+    def _load_snapshot(
+        self, backend_name: str, update_date: datetime
+    ) -> Optional[Dict]:
+        """Load the raw data of a persisted snapshot."""
+        path = self._snapshot_path(backend_name, update_date)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as snapshot_file:
+                return json.load(snapshot_file)
+        except FileNotFoundError:
+            return None
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Ignoring unreadable properties snapshot %s: %s", path, err)
+            return None
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        """Write a file of the store, logging a warning if it cannot be written."""
+        try:
+            write_atomically(path, data)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Unable to write properties history file %s: %s", path, err)
+
+
+def _parse_date(date: str) -> datetime:
+    """Parse a date, in UTC if it has no timezone."""
+    parsed = dateutil.parser.isoparse(date)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _update_date(raw_properties: Dict) -> datetime:
+    """Return the UTC update date of raw properties."""
+    update_date = raw_properties["last_update_date"]
+    if isinstance(update_date, datetime):
+        return local_to_utc(update_date)
+    return _parse_date(update_date)
+
+
+def _snapshot_columns(raw_properties: Dict) -> _Columns:
+    """Extract the values exported as arrays from raw properties."""
+    raw_qubits = raw_properties.get("qubits") or []
+    qubits = np.full((len(_QUBIT_ROWS), len(raw_qubits)), np.nan)
+    for qubit, nduvs in enumerate(raw_qubits):
+        for nduv in nduvs:
+            row = _QUBIT_ROWS.get(nduv["name"])
+            if row is not None:
+                qubits[row, qubit] = _si_value(nduv)
+    gates = []
+    gate_error = []
+    for raw_gate in raw_properties.get("gates") or []:
+        gates.append((raw_gate["gate"], tuple(raw_gate["qubits"])))
+        gate_error.append(
+            next(
+                (
+                    _si_value(param)
+                    for param in raw_gate["parameters"]
+                    if param["name"] == "gate_error"
+                ),
+                np.nan,
+            )
+        )
+    return _Columns(qubits, tuple(gates), np.array(gate_error, dtype=float))
+
+
+def _si_value(nduv: Dict) -> float:
+    """Return the value of a raw name, date, unit and value entry in SI units."""
+    try:
+        return apply_prefix(nduv["value"], nduv.get("unit") or "")
+    except Exception:  # pylint: disable=broad-except
+        return np.nan
@@ -17,6 +17,7 @@ import keyword
 import logging
 import os
 import re
+import tempfile
 from queue import Queue
 from threading import Condition
 from typing import List, Optional, Type, Any, Dict, Union, Tuple
@@ -216,12 +217,39 @@ def are_circuits_dynamic(circuits: List[QuantumCircuit]) -> bool:
     return False
 
 
+def write_atomically(path: str, data: bytes) -> None:
+    """Write a file through a temporary file in the same directory.
+
+    The temporary file is renamed to ``path`` once it is complete, so that
+    concurrent readers, in this or other processes, never see part of the file.
+    Missing parent directories are created.
+
+    Args:
+        path: Path of the file.
+        data: Content of the file.
+
+    Raises:
+        OSError: If the file cannot be written. The temporary file is removed.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(file_descriptor, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class RefreshQueue(Queue):
     """A queue that replaces the oldest item with the new item being added when full.
 
     A FIFO queue with a bounded size. Once the queue is full, when a new item
     is being added, the oldest item on the queue is discarded to make space for
-    the new item.
+    the new item. The number of discarded items is kept in ``discarded``.
     """
 
     def __init__(self, maxsize: int):
@@ -231,6 +259,7 @@ class RefreshQueue(Queue):
             maxsize: Maximum size of the queue.
         """
         self.condition = Condition()
+        self.discarded = 0
         super().__init__(maxsize=maxsize)
 
     def put(self, item: Any) -> None:  # type: ignore[override]
@@ -246,6 +275,7 @@ class RefreshQueue(Queue):
         with self.condition:
             if self.full():
                 super().get(block=False)
+                self.discarded += 1
             super().put(item, block=False)
             self.condition.notify()
 
@@ -25,6 +25,7 @@ REQUIREMENTS = [
     "numpy>=1.13",
     "urllib3>=1.21.1",
     "python-dateutil>=2.8.0",
+    "dill>=0.3",
     "websocket-client>=1.5.1",
     "websockets>=10.0",
     "typing_extensions>=4.3",
@@ -86,7 +87,9 @@ setuptools.setup(
             "ipython>=5.0.0",
             "traitlets!=5.0.5",
             "ipyvue>=1.8.5",
-        ]
+        ],
+        "async": ["aiohttp>=3.8"],
+        "stream": ["ijson>=3.1"],
     },
     project_urls={
         "Bug Tracker": "https://github.com/Qiskit/qiskit-ibm-provider/issues",
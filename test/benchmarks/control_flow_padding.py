@@ -0,0 +1,96 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=attribute-defined-outside-init,missing-function-docstring
+
+"""Benchmarks of the scheduling and padding of nested control-flow blocks."""
+
+import tracemalloc
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import XGate
+from qiskit.transpiler import PassManager
+
+from qiskit_ibm_provider.transpiler.passes.scheduling import (
+    ALAPScheduleAnalysis,
+    DynamicCircuitInstructionDurations,
+    PadDelay,
+    PadDynamicalDecoupling,
+)
+
+
+def nested_if_else_circuit(
+    num_qubits: int, num_blocks: int, depth: int
+) -> QuantumCircuit:
+    """Return a circuit with ``num_blocks`` conditional blocks nested ``depth`` times."""
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+
+    def _add_block(block: QuantumCircuit, level: int) -> None:
+        for qubit in range(num_qubits):
+            block.x(qubit)
+        block.cx(0, 1)
+        block.measure(0, 0)
+        if level:
+            with block.if_test((block.clbits[0], 1)) as else_:
+                _add_block(block, level - 1)
+            with else_:
+                block.x(1)
+
+    for _ in range(num_blocks):
+        _add_block(circuit, depth)
+    return circuit
+
+
+class ControlFlowPaddingSuite:
+    """Schedule and pad nested control-flow blocks twice, as in a pass manager
+    applying dynamical decoupling before padding the remaining idle times."""
+
+    params = ([10, 100], [1, 3])
+    param_names = ["num_blocks", "depth"]
+    timeout = 300
+
+    def setup(self, num_blocks, depth):
+        durations = DynamicCircuitInstructionDurations(
+            [
+                ("x", None, 160),
+                ("sx", None, 160),
+                ("cx", None, 800),
+                ("measure", None, 1600),
+                ("reset", None, 1600),
+            ]
+        )
+        self.circuit = nested_if_else_circuit(5, num_blocks, depth)
+        self.pass_manager = PassManager(
+            [
+                ALAPScheduleAnalysis(durations),
+                PadDynamicalDecoupling(durations, [XGate(), XGate()]),
+                ALAPScheduleAnalysis(durations),
+                PadDelay(),
+            ]
+        )
+
+    def time_schedule_and_pad(self, _, __):
+        self.pass_manager.run(self.circuit)
+
+    def peakmem_schedule_and_pad(self, _, __):
+        self.pass_manager.run(self.circuit)
+
+    def track_allocated_bytes(self, _, __):
+        """Peak size of the memory allocated while running the passes."""
+        tracemalloc.start()
+        try:
+            self.pass_manager.run(self.circuit)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    track_allocated_bytes.unit = "bytes"  # type: ignore[attr-defined]
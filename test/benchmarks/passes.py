@@ -0,0 +1,182 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=attribute-defined-outside-init,missing-function-docstring
+
+"""Benchmarks of the dynamic circuit transpiler passes and plugin stages.
+
+Each suite varies one property of the circuits: the number of qubits, the
+depth, the density of mid-circuit measurements or the nesting of control-flow
+blocks. The time and the peak memory of each pass are tracked separately.
+"""
+
+import tracemalloc
+import warnings
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import XGate
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PropertySet
+from qiskit.transpiler.basepasses import BasePass
+
+from qiskit_ibm_provider.transpiler.passes.basis import ConvertIdToDelay
+from qiskit_ibm_provider.transpiler.passes.scheduling import (
+    ALAPScheduleAnalysis,
+    ASAPScheduleAnalysis,
+    PadDelay,
+    PadDynamicalDecoupling,
+)
+from qiskit_ibm_provider.transpiler.plugin import (
+    IBMDynamicTranslationPlugin,
+    IBMTranslationPlugin,
+)
+
+from .utils import backend_durations, dynamic_circuit, pass_manager_config
+
+PASSES = [
+    "ASAPScheduleAnalysis",
+    "ALAPScheduleAnalysis",
+    "PadDelay",
+    "PadDynamicalDecoupling",
+    "ConvertIdToDelay",
+]
+
+STAGES = ["IBMTranslationPlugin", "IBMDynamicTranslationPlugin"]
+
+
+class _PassBenchmark:
+    """Time and peak memory of a pass on the circuits of a family."""
+
+    timeout = 600
+    # Passes modify their input, which is rebuilt by ``setup`` before each repeat.
+    number = 1
+    warmup_time = 0
+
+    def circuit(self, *params) -> QuantumCircuit:
+        """Return the circuit of the benchmark parameters."""
+        raise NotImplementedError
+
+    def setup(self, pass_name, *params):
+        warnings.simplefilter("ignore")
+        circuit = self.circuit(*params)
+        durations = backend_durations(circuit.num_qubits)
+        self.dag = circuit_to_dag(circuit)
+        property_set = PropertySet()
+
+        if pass_name in ("PadDelay", "PadDynamicalDecoupling"):
+            # Padding passes run on scheduled circuits.
+            scheduler = ALAPScheduleAnalysis(durations)
+            scheduler.property_set = property_set
+            scheduler.run(self.dag)
+
+        self.pass_: BasePass
+        if pass_name == "ASAPScheduleAnalysis":
+            self.pass_ = ASAPScheduleAnalysis(durations)
+        elif pass_name == "ALAPScheduleAnalysis":
+            self.pass_ = ALAPScheduleAnalysis(durations)
+        elif pass_name == "PadDelay":
+            self.pass_ = PadDelay()
+        elif pass_name == "PadDynamicalDecoupling":
+            self.pass_ = PadDynamicalDecoupling(durations, [XGate(), XGate()])
+        else:
+            self.pass_ = ConvertIdToDelay(durations)
+        self.pass_.property_set = property_set
+
+    def time_pass(self, *_):
+        self.pass_.run(self.dag)
+
+    def track_peak_memory(self, *_):
+        """Peak size of the memory allocated by the pass."""
+        tracemalloc.start()
+        try:
+            self.pass_.run(self.dag)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    track_peak_memory.unit = "bytes"  # type: ignore[attr-defined]
+
+
+class QubitsSuite(_PassBenchmark):
+    """Passes on fake backends with an increasing number of qubits."""
+
+    params = (PASSES, [5, 27, 127, 433])
+    param_names = ["pass", "num_qubits"]
+
+    def circuit(self, num_qubits):
+        return dynamic_circuit(num_qubits, depth=20)
+
+
+class DepthSuite(_PassBenchmark):
+    """Passes on circuits with an increasing number of layers."""
+
+    params = (PASSES, [10, 100, 500])
+    param_names = ["pass", "depth"]
+
+    def circuit(self, depth):
+        return dynamic_circuit(27, depth=depth)
+
+
+class MeasurementDensitySuite(_PassBenchmark):
+    """Passes on circuits with an increasing density of mid-circuit measurements."""
+
+    params = (PASSES, [0.0, 0.1, 0.5, 1.0])
+    param_names = ["pass", "measure_density"]
+
+    def circuit(self, measure_density):
+        return dynamic_circuit(
+            27, depth=50, measure_density=measure_density, control_flow="none"
+        )
+
+
+class NestingSuite(_PassBenchmark):
+    """Passes on circuits with increasingly nested control-flow blocks."""
+
+    params = (PASSES, ["if_else", "while_loop"], [1, 2, 4])
+    param_names = ["pass", "control_flow", "nesting"]
+
+    def circuit(self, control_flow, nesting):
+        return dynamic_circuit(27, depth=50, control_flow=control_flow, nesting=nesting)
+
+
+class TranslationStageSuite:
+    """IBM translation stage plugins on fake backends."""
+
+    params = (STAGES, [5, 27, 127, 433])
+    param_names = ["stage", "num_qubits"]
+    timeout = 600
+
+    def setup(self, stage, num_qubits):
+        warnings.simplefilter("ignore")
+        self.circuit = dynamic_circuit(num_qubits, depth=20)
+        plugin = (
+            IBMTranslationPlugin()
+            if stage == "IBMTranslationPlugin"
+            else IBMDynamicTranslationPlugin()
+        )
+        self.pass_manager = plugin.pass_manager(
+            pass_manager_config(num_qubits), optimization_level=1
+        )
+
+    def time_stage(self, *_):
+        self.pass_manager.run(self.circuit)
+
+    def track_peak_memory(self, *_):
+        """Peak size of the memory allocated by the stage."""
+        tracemalloc.start()
+        try:
+            self.pass_manager.run(self.circuit)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    track_peak_memory.unit = "bytes"  # type: ignore[attr-defined]
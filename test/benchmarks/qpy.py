@@ -0,0 +1,97 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=attribute-defined-outside-init,missing-function-docstring
+
+"""Benchmarks of the QPY serialization of large circuits."""
+
+import io
+import json
+import random
+
+from qiskit.circuit import QuantumCircuit
+
+from qiskit_ibm_provider import qpy
+from qiskit_ibm_provider.utils import EncodedCircuitCache, encode_circuits
+from qiskit_ibm_provider.utils.json import RuntimeDecoder, RuntimeEncoder
+
+
+def wide_circuit(
+    num_qubits: int, num_instructions: int, seed: int = 1234
+) -> QuantumCircuit:
+    """Return a circuit of single qubit gates, CX gates and measurements."""
+    rng = random.Random(seed)
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    for _ in range(num_instructions):
+        qubit = rng.randrange(num_qubits)
+        choice = rng.random()
+        if choice < 0.4:
+            circuit.rz(rng.uniform(0, 3.14), qubit)
+        elif choice < 0.7:
+            circuit.sx(qubit)
+        elif choice < 0.95:
+            circuit.cx(qubit, (qubit + 1) % num_qubits)
+        else:
+            circuit.measure(qubit, qubit)
+    return circuit
+
+
+class QpySuite:
+    """Serialize and deserialize a wide circuit."""
+
+    params = [10_000, 100_000]
+    param_names = ["num_instructions"]
+    timeout = 600
+
+    def setup(self, num_instructions):
+        self.circuit = wide_circuit(400, num_instructions)
+        with io.BytesIO() as buffer:
+            qpy.dump(self.circuit, buffer)
+            self.payload = buffer.getvalue()
+        self.json_payload = json.dumps(self.circuit, cls=RuntimeEncoder)
+
+    def time_dump(self, _):
+        with io.BytesIO() as buffer:
+            qpy.dump(self.circuit, buffer)
+
+    def time_load(self, _):
+        with io.BytesIO(self.payload) as buffer:
+            qpy.load(buffer)
+
+    def time_runtime_decoder(self, _):
+        json.loads(self.json_payload, cls=RuntimeDecoder)
+
+
+class JobEncodingSuite:
+    """Encode the circuits of a job."""
+
+    params = [1, 2, 4]
+    param_names = ["num_processes"]
+    timeout = 600
+
+    def setup(self, _):
+        self.circuits = [wide_circuit(127, 10_000, seed=seed) for seed in range(50)]
+        self.cache = EncodedCircuitCache()
+        encode_circuits(self.circuits, cache=self.cache)
+
+    def time_runtime_encoder(self, _):
+        json.dumps({"circuits": self.circuits}, cls=RuntimeEncoder)
+
+    def time_encode_circuits(self, num_processes):
+        encoded = encode_circuits(self.circuits, num_processes=num_processes)
+        json.dumps({"circuits": encoded}, cls=RuntimeEncoder)
+
+    def time_encode_cached_circuits(self, num_processes):
+        encoded = encode_circuits(
+            self.circuits, num_processes=num_processes, cache=self.cache
+        )
+        json.dumps({"circuits": encoded}, cls=RuntimeEncoder)
@@ -0,0 +1,169 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Circuits and fake backends used by the benchmarks."""
+
+import random
+import statistics
+from functools import lru_cache
+from typing import Iterable, List, Set, Tuple
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.providers.fake_provider import FakeKolkata, FakeManila, FakeWashington
+from qiskit.transpiler import PassManagerConfig
+
+from qiskit_ibm_provider.transpiler.passes.scheduling import (
+    DynamicCircuitInstructionDurations,
+)
+
+FAKE_BACKENDS = {5: FakeManila, 27: FakeKolkata, 127: FakeWashington}
+"""Fake backends by number of qubits."""
+
+CONTROL_FLOW_NAMES = ["if_else", "while_loop", "for_loop"]
+
+
+@lru_cache(maxsize=None)
+def backend_durations(num_qubits: int) -> DynamicCircuitInstructionDurations:
+    """Return the instruction durations of a fake backend with ``num_qubits`` qubits.
+
+    The durations of backends larger than the available fake backends repeat the
+    single qubit durations of the largest fake backend, with a two qubit gate
+    between neighboring qubits taking its median two qubit gate duration.
+    """
+    if num_qubits in FAKE_BACKENDS:
+        return DynamicCircuitInstructionDurations.from_backend(
+            FAKE_BACKENDS[num_qubits]()
+        )
+
+    largest = max(FAKE_BACKENDS)
+    base = backend_durations(largest)
+    durations = []
+    for name in ["id", "rz", "sx", "x", "measure", "reset"]:
+        for qubit in range(num_qubits):
+            duration = base.get(name, [qubit % largest])
+            durations.append((name, qubit, duration))
+    cx_duration = int(
+        statistics.median(
+            base.get(name, list(qubits))
+            for name, qubits in base.duration_by_name_qubits
+            if name == "cx"
+        )
+    )
+    for qubit in range(num_qubits - 1):
+        durations.append(("cx", [qubit, qubit + 1], cx_duration))
+        durations.append(("cx", [qubit + 1, qubit], cx_duration))
+    return DynamicCircuitInstructionDurations(durations, dt=base.dt)
+
+
+def pass_manager_config(num_qubits: int) -> PassManagerConfig:
+    """Return the pass manager configuration of a fake backend."""
+    durations = backend_durations(num_qubits)
+    if num_qubits in FAKE_BACKENDS:
+        config = PassManagerConfig.from_backend(FAKE_BACKENDS[num_qubits]())
+        config.basis_gates = config.basis_gates + CONTROL_FLOW_NAMES
+    else:
+        config = PassManagerConfig(
+            basis_gates=["id", "rz", "sx", "x", "cx", "reset"] + CONTROL_FLOW_NAMES
+        )
+    config.instruction_durations = durations
+    return config
+
+
+@lru_cache(maxsize=None)
+def coupling_edges(num_qubits: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the directed two qubit gate edges of a fake backend."""
+    if num_qubits in FAKE_BACKENDS:
+        coupling_map = FAKE_BACKENDS[num_qubits]().configuration().coupling_map
+        return tuple(tuple(edge) for edge in coupling_map)
+    return tuple((qubit, qubit + 1) for qubit in range(num_qubits - 1))
+
+
+def _disjoint_edges(edges: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Return edges that do not share qubits, in the order they are given."""
+    used: Set[int] = set()
+    disjoint = []
+    for edge in edges:
+        if not used.intersection(edge):
+            used.update(edge)
+            disjoint.append(edge)
+    return disjoint
+
+
+def dynamic_circuit(
+    num_qubits: int,
+    depth: int,
+    measure_density: float = 0.1,
+    control_flow: str = "if_else",
+    nesting: int = 1,
+    seed: int = 1234,
+) -> QuantumCircuit:
+    """Return a physical circuit with mid-circuit measurements and control flow.
+
+    Each layer applies single qubit gates to all qubits, two qubit gates on
+    disjoint edges of the coupling map of the fake backend, measures each qubit with probability ``measure_density``
+    and ends every few layers with a control-flow block conditioned on the
+    measurements, which contains a layer and ``nesting - 1`` nested blocks.
+
+    Args:
+        num_qubits: Number of qubits.
+        depth: Number of layers.
+        measure_density: Probability that a qubit is measured in a layer.
+        control_flow: Type of control-flow blocks, ``"if_else"``,
+            ``"while_loop"`` or ``"none"``.
+        nesting: Depth of nested control-flow blocks.
+        seed: Seed of the random gates and measurements.
+
+    Returns:
+        The circuit.
+    """
+    rng = random.Random(seed)
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    edges = coupling_edges(num_qubits)
+    layer_edges = [_disjoint_edges(edges), _disjoint_edges(reversed(edges))]
+
+    def _layer(block: QuantumCircuit, layer: int) -> None:
+        for qubit in range(num_qubits):
+            gate = rng.choice(["sx", "x", "rz", "id"])
+            if gate == "rz":
+                block.rz(rng.uniform(0, 3.14), qubit)
+            else:
+                getattr(block, gate)(qubit)
+        for control, target in layer_edges[layer % 2]:
+            block.cx(control, target)
+        for qubit in range(num_qubits):
+            if rng.random() < measure_density:
+                block.measure(qubit, qubit)
+
+    def _control_flow(block: QuantumCircuit, layer: int, level: int) -> None:
+        # Blocks span all the bits so that their bit indices are physical ones.
+        if level == 0:
+            return
+        bit = rng.randrange(num_qubits)
+        body = QuantumCircuit(num_qubits, num_qubits)
+        _layer(body, layer)
+        if control_flow == "while_loop":
+            body.measure(bit, bit)
+            _control_flow(body, layer + 1, level - 1)
+            block.while_loop((block.clbits[bit], 1), body, block.qubits, block.clbits)
+        else:
+            _control_flow(body, layer + 1, level - 1)
+            else_body = QuantumCircuit(num_qubits, num_qubits)
+            _layer(else_body, layer + 1)
+            block.if_else(
+                (block.clbits[bit], 1), body, else_body, block.qubits, block.clbits
+            )
+
+    for layer in range(depth):
+        _layer(circuit, layer)
+        if control_flow != "none" and layer % 5 == 4:
+            _control_flow(circuit, layer, nesting)
+    return circuit
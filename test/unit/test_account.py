@@ -17,6 +17,7 @@ import os
 import uuid
 from typing import Any
 from unittest import skipIf
+from unittest.mock import MagicMock
 
 from qiskit_ibm_provider.accounts import (
     AccountManager,
@@ -486,6 +487,24 @@ class TestEnableAccount(IBMTestCase):
         self.assertTrue(service._account)
         self.assertEqual(service._account.instance, instance)
 
+    def test_enable_account_lazy(self):
+        """Test discovery is deferred until first needed when initializing lazily."""
+        phases = []
+        service = FakeProvider(
+            token="some_token",
+            lazy=True,
+            bootstrap_callback=lambda name, duration: phases.append(name),
+        )
+        self.assertEqual(phases, ["authenticate"])
+        self.assertEqual(service.instances(), FakeProvider.DEFAULT_HGPS)
+        self.assertEqual(phases, ["authenticate", "initialize_hgps"])
+
+        service._runtime_client = MagicMock()
+        service._runtime_client.list_backends.side_effect = lambda hgp: [hgp]
+        service._discover_backends(service._get_hgps())
+        for hgp in service._get_hgps():
+            self.assertEqual(list(hgp.backends), [hgp.name])
+
     def _verify_prefs(self, prefs, account):
         if "proxies" in prefs:
             self.assertEqual(account.proxies, ProxyConfiguration(**prefs["proxies"]))
@@ -0,0 +1,130 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the asyncio runtime client."""
+
+import asyncio
+import json
+from unittest import mock, skipIf
+
+from qiskit import QuantumCircuit
+from qiskit.providers.fake_provider import FakeBogota
+from qiskit.providers.jobstatus import JobStatus
+from qiskit.providers.models import BackendStatus
+
+from qiskit_ibm_provider.api.async_session import HAS_AIOHTTP
+from qiskit_ibm_provider.api.client_parameters import ClientParameters
+from qiskit_ibm_provider.api.clients import AsyncRuntimeClient
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+
+from ..ibm_test_case import IBMTestCase
+
+RESULT = {
+    "backend_name": "ibmq_bogota",
+    "backend_version": "1.0",
+    "qobj_id": "qobj",
+    "job_id": "job1",
+    "success": True,
+    "results": [
+        {
+            "shots": 10,
+            "success": True,
+            "data": {"counts": {"0x0": 10}},
+            "header": {"name": "circuit"},
+        }
+    ],
+}
+
+
+@skipIf(not HAS_AIOHTTP, "aiohttp is not installed.")
+class TestAsyncRuntimeClient(IBMTestCase):
+    """Tests for AsyncRuntimeClient."""
+
+    async def _run_with_server(self, test):
+        """Run a test coroutine against a local mock of the runtime API."""
+        # pylint: disable=import-error
+        from aiohttp import web
+
+        requests = {"status": 0, "failures": 0}
+
+        async def program_run(_):
+            return web.json_response({"id": "job1"})
+
+        async def job_get(_):
+            requests["status"] += 1
+            if requests["failures"] == 0:
+                requests["failures"] += 1
+                return web.Response(status=502)
+            status = "Queued" if requests["status"] < 3 else "Completed"
+            return web.json_response({"id": "job1", "state": {"status": status}})
+
+        async def job_type(_):
+            return web.json_response({"type": "RUNTIME"})
+
+        async def job_results(_):
+            return web.Response(text=json.dumps(RESULT))
+
+        app = web.Application()
+        app.router.add_post("/jobs", program_run)
+        app.router.add_get("/jobs/job1", job_get)
+        app.router.add_get("/facade/v1/jobs/job1/type", job_type)
+        app.router.add_get("/jobs/job1/results", job_results)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        client = AsyncRuntimeClient(
+            ClientParameters(token="token", url=f"http://127.0.0.1:{port}")
+        )
+        client._session._retry = client._session._retry.new(backoff_factor=0)
+        try:
+            await test(client, requests)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    def test_arun(self):
+        """Test submitting a job and awaiting its result."""
+        provider = mock.MagicMock()
+        provider._get_hgp.return_value.name = "hub/group/project"
+        provider._runtime_client.backend_properties.return_value = json.loads(
+            json.dumps(
+                FakeBogota().properties().to_dict(),
+                default=lambda date: date.isoformat(),
+            )
+        )
+        backend = IBMBackend(
+            FakeBogota().configuration(), provider, api_client=mock.MagicMock()
+        )
+        backend.status = lambda: BackendStatus(
+            backend_name="ibmq_bogota",
+            backend_version="1.0",
+            operational=True,
+            pending_jobs=0,
+            status_msg="active",
+        )
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+
+        async def test(client, requests):
+            provider.async_runtime_client = client
+            job = await backend.arun(circuit)
+            self.assertEqual(job.job_id(), "job1")
+            await job.await_final_state(wait=0.01)
+            self.assertEqual(await job.astatus(), JobStatus.DONE)
+            # The first status query failed with a retried 502 error.
+            self.assertEqual(requests["status"], 3)
+            result = await job.aresult()
+            self.assertEqual(result.get_counts(), {"0": 10})
+
+        asyncio.run(self._run_with_server(test))
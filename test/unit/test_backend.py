@@ -13,12 +13,15 @@
 """Tests for the backend functions."""
 
 from datetime import datetime
+import json
+import threading
 from unittest import mock
 import warnings
 
 from qiskit import transpile, qasm3, QuantumCircuit
-from qiskit.providers.fake_provider import FakeManila
+from qiskit.providers.fake_provider import FakeManila, FakeWashington
 from qiskit.providers.models import BackendStatus, BackendProperties
+from qiskit.transpiler import InstructionDurations
 
 from qiskit_ibm_provider.ibm_backend import IBMBackend
 
@@ -89,6 +92,170 @@ class TestBackend(IBMTestCase):
         self.assertIn("cx", str(err.exception))
         self.assertIn(f"faulty edge {tuple(edge_qubits)}", str(err.exception))
 
+    def test_faulty_first_instruction(self):
+        """Test the first instruction on a faulty qubit or edge is reported."""
+        faulty_qubit = 4
+        ibm_backend = self._create_faulty_backend(
+            FakeManila(), faulty_qubit=faulty_qubit, faulty_edge=("cx", [1, 2])
+        )
+        circ = QuantumCircuit(5)
+        circ.barrier()
+        circ.cx(2, 1)
+        circ.cx(1, 2)
+        circ.x(faulty_qubit)
+
+        with self.assertRaises(ValueError) as err:
+            ibm_backend.run(circ)
+        self.assertIn("faulty edge (1, 2)", str(err.exception))
+
+        circ.data.insert(1, circ.data[-1])
+        with self.assertRaises(ValueError) as err:
+            ibm_backend.run(circ)
+        self.assertIn(f"faulty qubit {faulty_qubit}", str(err.exception))
+
+    def test_faulty_index_refresh(self):
+        """Test the faulty qubits are indexed once per properties snapshot."""
+        ibm_backend = IBMBackend(
+            configuration=FakeManila().configuration(),
+            provider=mock.MagicMock(),
+            api_client=None,
+            instance=None,
+        )
+        ibm_backend.status = lambda: BackendStatus(
+            backend_name="foo",
+            backend_version="1.0",
+            operational=True,
+            pending_jobs=0,
+            status_msg="",
+        )
+        ibm_backend._properties = FakeManila().properties()
+        circ = QuantumCircuit(2)
+        circ.cx(0, 1)
+
+        with mock.patch.object(IBMBackend, "_runtime_run"):
+            ibm_backend.run([circ, circ])
+            faulty_index = ibm_backend._faulty_index
+            ibm_backend.run(circ)
+            self.assertIs(ibm_backend._faulty_index, faulty_index)
+
+            faulty_properties = FakeManila().properties().to_dict()
+            faulty_properties["qubits"][1].append(
+                {"date": datetime.now(), "name": "operational", "unit": "", "value": 0}
+            )
+            ibm_backend.provider._runtime_client.backend_properties.return_value = (
+                json.loads(
+                    json.dumps(faulty_properties, default=lambda date: date.isoformat())
+                )
+            )
+            ibm_backend.properties(refresh=True)
+            with self.assertRaises(ValueError) as err:
+                ibm_backend.run(circ)
+        self.assertIn("faulty qubit 1", str(err.exception))
+
+    def test_status_ttl(self):
+        """Test the backend status is reused for the status time to live."""
+        ibm_backend = self._create_faulty_backend(FakeManila())
+        status = ibm_backend.status()
+        ibm_backend.status = mock.MagicMock(return_value=status)
+        circ = QuantumCircuit(1)
+        circ.x(0)
+
+        with mock.patch.object(IBMBackend, "_runtime_run"):
+            for _ in range(2):
+                ibm_backend.run(circ)
+            self.assertEqual(ibm_backend.status.call_count, 2)
+
+            ibm_backend._status_ttl = 60
+            for _ in range(3):
+                ibm_backend.run(circ)
+            self.assertEqual(ibm_backend.status.call_count, 3)
+
+    def test_id_conversion_copies_affected_circuits(self):
+        """Test only the circuits with 'id' instructions are converted and copied."""
+        ibm_backend = self._create_faulty_backend(FakeManila())
+        with_id = QuantumCircuit(2)
+        with_id.x(0)
+        with_id.id(1)
+        nested_id = QuantumCircuit(2, 1)
+        with nested_id.if_test((0, True)):  # pylint: disable=not-context-manager
+            nested_id.id(0)
+        without_id = QuantumCircuit(2)
+        without_id.x(0)
+        circuits = [with_id, without_id, nested_id]
+
+        with mock.patch.object(ibm_backend, "_target") as target:
+            target.durations.return_value = InstructionDurations([("sx", None, 160)])
+            with self.assertWarns(DeprecationWarning):
+                converted = ibm_backend._deprecate_id_instruction(circuits)
+
+        self.assertIs(converted[1], without_id)
+        self.assertEqual(converted[0].count_ops(), {"x": 1, "delay": 1})
+        self.assertEqual(
+            converted[2].data[0].operation.blocks[0].count_ops(), {"delay": 1}
+        )
+        self.assertEqual(with_id.count_ops(), {"x": 1, "id": 1})
+        self.assertEqual(circuits, [with_id, without_id, nested_id])
+
+    def test_submission_times(self):
+        """Test the time spent in each submission phase is recorded on the job."""
+        ibm_backend = self._create_faulty_backend(FakeManila())
+        ibm_backend.provider._runtime_client.program_run.return_value = {"id": "job_id"}
+        circ = QuantumCircuit(1)
+        circ.x(0)
+
+        job = ibm_backend.run(circ)
+        self.assertEqual(
+            list(job.submission_times()),
+            ["validation", "status", "id_conversion", "encoding", "submit"],
+        )
+        self.assertTrue(all(value >= 0 for value in job.submission_times().values()))
+
+    def test_target_from_server_data(self):
+        """Test the target is built from data fetched concurrently."""
+        fake_backend = FakeWashington()
+        raw_properties = json.loads(
+            json.dumps(
+                fake_backend.properties().to_dict(),
+                default=lambda date: date.isoformat(),
+            )
+        )
+        raw_defaults = json.loads(
+            json.dumps(
+                fake_backend.defaults().to_dict(),
+                default=lambda value: [value.real, value.imag],
+            )
+        )
+        defaults_requested = threading.Event()
+
+        def backend_properties(*_args, **_kwargs):
+            # Wait for the pulse defaults to be requested concurrently.
+            self.assertTrue(defaults_requested.wait(timeout=10))
+            return raw_properties
+
+        def backend_pulse_defaults(*_args, **_kwargs):
+            defaults_requested.set()
+            return raw_defaults
+
+        provider = mock.MagicMock()
+        provider._runtime_client.backend_properties.side_effect = backend_properties
+        provider._runtime_client.backend_pulse_defaults.side_effect = (
+            backend_pulse_defaults
+        )
+        ibm_backend = IBMBackend(
+            fake_backend.configuration(), provider, api_client=mock.MagicMock()
+        )
+        with self.assertLogs("qiskit_ibm_provider", "WARNING"):
+            target = ibm_backend.target
+
+        entry = target["cx"][(0, 1)]._calibration
+        self.assertIsNotNone(entry._raw_sequence)
+        self.assertEqual(
+            target["cx"][(0, 1)].calibration,
+            fake_backend.defaults().instruction_schedule_map.get("cx", (0, 1)),
+        )
+        self.assertIsNone(entry._raw_sequence)
+        self.assertIsNotNone(target["x"][(1,)]._calibration._raw_sequence)
+
     def test_faulty_qubit_not_used(self):
         """Test faulty qubit is not raise if not used."""
         fake_backend = FakeManila()
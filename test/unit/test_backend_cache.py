@@ -0,0 +1,80 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the persistent backend data cache."""
+
+import json
+import tempfile
+from unittest import mock
+
+from qiskit.providers.fake_provider import FakeBogota
+
+from qiskit_ibm_provider import ibm_backend
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+from qiskit_ibm_provider.utils.backend_cache import BackendDataCache
+
+from ..ibm_test_case import IBMTestCase
+
+
+class TestBackendDataCache(IBMTestCase):
+    """Tests for BackendDataCache."""
+
+    def setUp(self):
+        super().setUp()
+        # pylint: disable=consider-using-with
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.raw_properties = json.dumps(
+            FakeBogota().properties().to_dict(), default=lambda date: date.isoformat()
+        )
+
+    def _create_backend(self, ttl: float) -> IBMBackend:
+        """Create a backend whose properties are served from the cache."""
+        provider = mock.MagicMock()
+        provider._runtime_client.backend_properties.side_effect = (
+            lambda *_args, **_kwargs: json.loads(self.raw_properties)
+        )
+        backend = IBMBackend(
+            FakeBogota().configuration(), provider, api_client=mock.MagicMock()
+        )
+        backend._backend_cache = BackendDataCache(self.cache_dir.name, ttl=ttl)
+        return backend
+
+    def test_properties_shared_across_backends(self):
+        """Test properties decoded by a backend are reused by another one."""
+        properties = self._create_backend(ttl=3600).properties()
+
+        backend = self._create_backend(ttl=3600)
+        self.assertEqual(backend.properties().to_dict(), properties.to_dict())
+        backend.provider._runtime_client.backend_properties.assert_not_called()
+
+    def test_stale_properties_revalidated(self):
+        """Test stale properties are not decoded again if they did not change."""
+        self._create_backend(ttl=0).properties()
+
+        backend = self._create_backend(ttl=0)
+        with mock.patch.object(
+            ibm_backend, "properties_from_server_data"
+        ) as decode_mock:
+            self.assertIsNotNone(backend.properties())
+        backend.provider._runtime_client.backend_properties.assert_called_once()
+        decode_mock.assert_not_called()
+
+    def test_updated_properties_decoded(self):
+        """Test properties are decoded again after a calibration update."""
+        self._create_backend(ttl=0).properties()
+
+        raw_properties = json.loads(self.raw_properties)
+        raw_properties["last_update_date"] = "2030-01-01T00:00:00+00:00"
+        self.raw_properties = json.dumps(raw_properties)
+        properties = self._create_backend(ttl=0).properties()
+        self.assertEqual(properties.last_update_date.year, 2030)
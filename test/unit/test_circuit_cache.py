@@ -0,0 +1,173 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the cache of encoded circuits."""
+
+import json
+import tempfile
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Instruction, Parameter
+from qiskit.circuit.library import PauliEvolutionGate
+from qiskit.pulse import ScheduleBlock
+from qiskit.quantum_info import SparsePauliOp
+
+from qiskit_ibm_provider.utils import EncodedCircuitCache, encode_circuits
+from qiskit_ibm_provider.utils.json import RuntimeEncoder
+
+from ..ibm_test_case import IBMTestCase
+
+
+def _circuit(angle: float = 0.1) -> QuantumCircuit:
+    """Return a circuit with a parametrized gate and a custom gate."""
+    custom = QuantumCircuit(1, name="custom")
+    custom.h(0)
+    circ = QuantumCircuit(2, 2, name="t1", metadata={"experiment": "t1"})
+    circ.rx(angle, 0)
+    circ.append(custom.to_gate(), [1])
+    circ.cx(0, 1)
+    circ.measure([0, 1], [0, 1])
+    circ.x(0).c_if(0, 1)
+    return circ
+
+
+class TestEncodedCircuitCache(IBMTestCase):
+    """Tests for EncodedCircuitCache."""
+
+    def setUp(self):
+        super().setUp()
+        # pylint: disable=consider-using-with
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def assert_encoded(self, encoded, circuits):
+        """Assert circuits are encoded like the runtime encoder does."""
+        self.assertEqual(
+            json.dumps(encoded, cls=RuntimeEncoder),
+            json.dumps(circuits, cls=RuntimeEncoder),
+        )
+
+    def test_cache_hits(self):
+        """Test circuits submitted again are not encoded again."""
+        cache = EncodedCircuitCache()
+        circuits = [_circuit(), "OPENQASM 3.0;", _circuit(0.2)]
+        self.assert_encoded(encode_circuits(circuits, cache=cache), circuits)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 2, 2))
+
+        self.assert_encoded(encode_circuits(circuits, cache=cache), circuits)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+        # Equal circuits built separately share their entry.
+        self.assert_encoded(encode_circuits([_circuit()], cache=cache), [_circuit()])
+        self.assertEqual(cache.hits, 3)
+
+    def test_fingerprint_changes(self):
+        """Test changes of a circuit change its fingerprint."""
+        fingerprint = EncodedCircuitCache.fingerprint(_circuit())
+        self.assertEqual(EncodedCircuitCache.fingerprint(_circuit()), fingerprint)
+
+        metadata = _circuit()
+        metadata.metadata["experiment"] = "t2"
+        calibrations = _circuit()
+        calibrations.add_calibration("rx", [0], ScheduleBlock(), [0.1])
+        phase = _circuit()
+        phase.global_phase = 0.5
+        condition = _circuit()
+        condition.x(1).c_if(1, 0)
+        label = _circuit()
+        label.data[0].operation.label = "rx0"
+        qubits = _circuit()
+        qubits.data[2] = qubits.data[2].replace(qubits=qubits.qubits[::-1])
+        custom = _circuit()
+        custom.data[1].operation.definition.data[0].operation.name = "x"
+        for name, circ in [
+            ("metadata", metadata),
+            ("calibrations", calibrations),
+            ("global phase", phase),
+            ("condition", condition),
+            ("label", label),
+            ("qubits", qubits),
+            ("custom definition", custom),
+            ("angle", _circuit(0.1 + 1e-15)),
+        ]:
+            with self.subTest(name=name):
+                self.assertNotEqual(EncodedCircuitCache.fingerprint(circ), fingerprint)
+
+    def test_parameters(self):
+        """Test parameters are fingerprinted by identity and bound values."""
+        theta = Parameter("θ")
+        circ = QuantumCircuit(1, name="rx")
+        circ.rx(theta, 0)
+        fingerprint = EncodedCircuitCache.fingerprint(circ)
+
+        other = QuantumCircuit(1, name="rx")
+        other.rx(Parameter("θ"), 0)
+        self.assertNotEqual(EncodedCircuitCache.fingerprint(other), fingerprint)
+
+        bound = [circ.assign_parameters([value]) for value in [0.1, 0.2]]
+        fingerprints = {EncodedCircuitCache.fingerprint(circ) for circ in bound}
+        self.assertEqual(len(fingerprints), 2)
+        self.assertNotIn(fingerprint, fingerprints)
+
+        cache = EncodedCircuitCache()
+        self.assert_encoded(encode_circuits(bound, cache=cache), bound)
+        self.assert_encoded(encode_circuits(bound[::-1], cache=cache), bound[::-1])
+        self.assertEqual(cache.hits, 2)
+
+    def test_uncacheable_circuits(self):
+        """Test circuits that cannot be fingerprinted are encoded each time."""
+        circ = QuantumCircuit(2)
+        circ.append(PauliEvolutionGate(SparsePauliOp("XX"), time=0.1), [0, 1])
+        self.assertIsNone(EncodedCircuitCache.fingerprint(circ))
+
+        cache = EncodedCircuitCache()
+        for _ in range(2):
+            encoded = encode_circuits([circ], cache=cache)
+            self.assertEqual(encoded[0]["__type__"], "QuantumCircuit")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+        opaque = QuantumCircuit(1)
+        opaque.append(Instruction("opaque", 1, 0, [object()]), [0])
+        self.assertIsNone(EncodedCircuitCache.fingerprint(opaque))
+
+    def test_eviction(self):
+        """Test the least recently used circuits are evicted beyond the maximum size."""
+        circuits = [_circuit(0.1 * idx) for idx in range(4)]
+        encoded = encode_circuits(circuits)
+        size = len(encoded[0]["__value__"])
+        cache = EncodedCircuitCache(max_bytes=int(2.5 * size))
+
+        encode_circuits(circuits[:2], cache=cache)
+        encode_circuits(circuits[:1], cache=cache)
+        encode_circuits(circuits[2:3], cache=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+
+        cache.hits = 0
+        encode_circuits(circuits[:3], cache=cache)
+        # The second circuit was the least recently used one.
+        self.assertEqual(cache.hits, 2)
+
+    def test_persisted_entries(self):
+        """Test encoded circuits are shared through the cache directory."""
+        circuits = [_circuit(), _circuit(0.2)]
+        cache = EncodedCircuitCache(cache_dir=self.cache_dir.name)
+        encode_circuits(circuits, cache=cache)
+
+        other = EncodedCircuitCache(cache_dir=self.cache_dir.name)
+        self.assert_encoded(encode_circuits(circuits, cache=other), circuits)
+        self.assertEqual((other.hits, other.misses, len(other)), (2, 0, 2))
+
+        other.clear()
+        self.assertEqual(len(other), 0)
+        self.assertIsNone(cache._load(cache.fingerprint(circuits[0])))
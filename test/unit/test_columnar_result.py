@@ -0,0 +1,165 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the columnar result store."""
+
+import io
+import json
+import random
+import tempfile
+from unittest import mock
+
+import numpy as np
+from qiskit.result import Result
+
+from qiskit_ibm_provider.job import ColumnarResult, IBMCircuitJob
+from qiskit_ibm_provider.job.columnar_result import ColumnarDecoder
+from qiskit_ibm_provider.utils.json_decoder import decode_result_stream
+
+from ..ibm_test_case import IBMTestCase
+
+
+def _result_dict(num_bits=5, shots=200):
+    """Return a result dictionary with level 2 and level 1 experiments."""
+    rng = random.Random(1234)
+    memory = [hex(rng.getrandbits(num_bits)) for _ in range(shots)]
+    counts = {}
+    for value in memory:
+        counts[value] = counts.get(value, 0) + 1
+    return {
+        "backend_name": "ibmq_bogota",
+        "backend_version": "1.0",
+        "qobj_id": "qobj",
+        "job_id": "job",
+        "success": True,
+        "results": [
+            {
+                "shots": shots,
+                "success": True,
+                "meas_level": 2,
+                "data": {"counts": counts, "memory": memory},
+                "header": {
+                    "name": "level2",
+                    "memory_slots": num_bits,
+                    "creg_sizes": [["c0", 2], ["c1", num_bits - 2]],
+                },
+            },
+            {
+                "shots": 2,
+                "success": True,
+                "meas_level": 1,
+                "meas_return": "single",
+                "data": {"memory": [[[0.1, 0.2]], [[0.3, 0.4]]]},
+                "header": {"name": "level1", "memory_slots": 1},
+            },
+        ],
+    }
+
+
+class TestColumnarResult(IBMTestCase):
+    """Tests for ColumnarResult."""
+
+    def assert_same_data(self, result, expected):
+        """Assert a columnar result has the same data as a result."""
+        for experiment in ["level2", "level1"]:
+            self.assertEqual(
+                json.dumps(result.data(experiment), sort_keys=True),
+                json.dumps(expected.data(experiment), sort_keys=True),
+            )
+            np.testing.assert_equal(
+                result.get_memory(experiment), expected.get_memory(experiment)
+            )
+        self.assertEqual(result.get_counts("level2"), expected.get_counts("level2"))
+        self.assertEqual(result.to_dict(), expected.to_dict())
+
+    def test_accessors(self):
+        """Test accessors match the ones of a result."""
+        for num_bits in [5, 70]:
+            with self.subTest(num_bits=num_bits):
+                data = _result_dict(num_bits=num_bits)
+                result = ColumnarResult.from_dict(data)
+                self.assertEqual(result.results[0].data.to_dict(), {})
+                self.assert_same_data(result, Result.from_dict(data))
+
+    def test_arrays(self):
+        """Test counts and memory are returned as arrays of bits."""
+        data = _result_dict()
+        result = ColumnarResult.from_dict(data)
+
+        memory = result.get_memory_array("level2")
+        self.assertEqual(memory.shape, (200, 5))
+        for bits, value in zip(memory, data["results"][0]["data"]["memory"]):
+            self.assertEqual(
+                sum(int(bit) << idx for idx, bit in enumerate(bits)), int(value, 16)
+            )
+
+        outcomes, counts = result.get_counts_array("level2")
+        self.assertEqual(outcomes.shape[1], 5)
+        self.assertEqual(counts.sum(), 200)
+
+    def test_decoder(self):
+        """Test counts and memory are packed while the result is decoded."""
+        data = _result_dict()
+        raw_data = json.dumps(data)
+        decoded = [
+            json.loads(raw_data, cls=ColumnarDecoder),
+            decode_result_stream(io.BytesIO(raw_data.encode()), ColumnarDecoder),
+        ]
+        for data_dict in decoded:
+            self.assertEqual(data_dict["results"][0]["data"], {})
+            self.assertIn("memory", data_dict["results"][1]["data"])
+            self.assert_same_data(
+                ColumnarResult.from_dict(data_dict), Result.from_dict(data)
+            )
+
+    def test_save_load(self):
+        """Test a saved result is loaded with memory-mapped arrays."""
+        result = ColumnarResult.from_dict(_result_dict())
+        with tempfile.TemporaryDirectory() as directory:
+            result.save(directory)
+            loaded = ColumnarResult.load(directory)
+            self.assertIsInstance(loaded.results[0]._columns.memory, np.memmap)
+            self.assert_same_data(loaded, result)
+            del loaded
+
+    def test_job_result(self):
+        """Test a job returns a columnar result when requested."""
+        data = _result_dict()
+        job = IBMCircuitJob(
+            backend=mock.MagicMock(),
+            api_client=mock.MagicMock(),
+            job_id="job",
+            result=json.dumps(data),
+        )
+        result = job.result(columnar=True)
+        self.assertIsInstance(result, ColumnarResult)
+        self.assertEqual(
+            result.get_memory("level2"), Result.from_dict(data).get_memory("level2")
+        )
+
+        runtime_client = mock.MagicMock()
+        runtime_client.job_results.return_value = json.dumps(data)
+        job = IBMCircuitJob(
+            backend=mock.MagicMock(),
+            api_client=mock.MagicMock(),
+            job_id="job",
+            status="Completed",
+            runtime_client=runtime_client,
+        )
+        with mock.patch.object(
+            ColumnarResult, "_pop_columns", wraps=ColumnarResult._pop_columns
+        ) as pop_columns:
+            result = job.result(columnar=True)
+        self.assertIsInstance(result, ColumnarResult)
+        self.assert_same_data(result, Result.from_dict(data))
+        # Experiments are packed while decoding, not again from the dictionary.
+        self.assertEqual(pop_columns.call_count, 2)
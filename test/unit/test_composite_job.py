@@ -0,0 +1,259 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for IBMCompositeJob."""
+
+import json
+import threading
+import time
+from unittest import mock
+
+from qiskit import QuantumCircuit
+from qiskit.providers.fake_provider import FakeBogota
+from qiskit.providers.jobstatus import JobStatus
+from qiskit.providers.models import BackendStatus
+from qiskit.pulse import Schedule
+
+from qiskit_ibm_provider.api.exceptions import RequestsApiError
+from qiskit_ibm_provider.exceptions import IBMBackendApiError, IBMBackendValueError
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+from qiskit_ibm_provider.job import IBMCircuitJob, IBMCompositeJob
+from qiskit_ibm_provider.job.exceptions import IBMJobTimeoutError
+
+from ..ibm_test_case import IBMTestCase
+
+
+class CompositeJobTestCase(IBMTestCase):
+    """Base class for tests of composite jobs run on a mocked runtime client."""
+
+    def setUp(self):
+        super().setUp()
+        fake_backend = FakeBogota()
+        self.backend = IBMBackend(
+            fake_backend.configuration(),
+            mock.MagicMock(),
+            api_client=mock.MagicMock(),
+        )
+        for name, value in [
+            ("status", BackendStatus(self.backend.name, "1", True, 0, "active")),
+            ("properties", fake_backend.properties()),
+        ]:
+            patcher = mock.patch.object(self.backend, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.runtime_client = self.backend.provider._runtime_client
+        self.circuits_list = []
+
+    def _composite_job(self, program_run, **kwargs):
+        """Return a composite job whose sub-jobs are run with ``program_run``."""
+        self.runtime_client.program_run.side_effect = program_run
+        job = IBMCompositeJob(
+            backend=self.backend,
+            api_client=mock.MagicMock(),
+            circuits_list=self.circuits_list,
+            run_config={"shots": 10},
+            **kwargs,
+        )
+        job.block_for_submit()
+        return job
+
+
+class TestCompositeJobSubmit(CompositeJobTestCase):
+    """Tests for the IBMCompositeJob submission pipeline."""
+
+    def setUp(self):
+        super().setUp()
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        self.circuits_list = [[circuit.copy(f"circ{idx}")] for idx in range(6)]
+
+    def test_max_in_flight(self):
+        """Test sub-jobs are uploaded concurrently within the in-flight window."""
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def program_run(params, job_tags, **_):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            self.assertEqual(params["shots"], 10)
+            self.assertEqual(len(params["circuits"]), 1)
+            # The index tag identifies the sub-job.
+            return {"id": job_tags[0]}
+
+        job = self._composite_job(program_run, max_in_flight=2)
+        self.assertEqual(in_flight[1], 2)
+        self.assertEqual(len(job.sub_jobs()), 6)
+        for sub_job in job._sub_jobs:
+            self.assertIsInstance(sub_job.job, IBMCircuitJob)
+            self.assertEqual(
+                sub_job.job.job_id(),
+                sub_job.format_tag(job._index_tag),
+                "Sub-jobs got mixed up.",
+            )
+            self.assertEqual(
+                sub_job.prepared["job_tags"][-1], job.job_id(), "Missing composite tag."
+            )
+
+    def test_retry(self):
+        """Test submissions are retried after job limit and server errors."""
+        errors = [
+            RequestsApiError("limit", status_code=429),
+            RequestsApiError("error", status_code=500),
+        ]
+
+        def program_run(**_):
+            if errors:
+                raise errors.pop(0)
+            return {"id": "job0"}
+
+        self.circuits_list = self.circuits_list[:1]
+        job = self._composite_job(
+            program_run, retry_backoff=0.01, job_limit_backoff=0.01, submit_retries=1
+        )
+        self.assertEqual(self.runtime_client.program_run.call_count, 3)
+        self.assertEqual(job._job_limit_hits, 0)
+        self.assertEqual(len(job.sub_jobs()), 1)
+        self.assertIsNone(job._sub_jobs[0].submit_error)
+
+    def test_retries_exhausted(self):
+        """Test a sub-job fails once its retries are exhausted."""
+        self.circuits_list = self.circuits_list[:2]
+        job = self._composite_job(
+            RequestsApiError("error", status_code=500),
+            retry_backoff=0.01,
+            submit_retries=2,
+        )
+        self.assertEqual(self.runtime_client.program_run.call_count, 6)
+        self.assertEqual(job.sub_jobs(), [])
+        for sub_job in job._sub_jobs:
+            self.assertIsInstance(sub_job.submit_error, IBMBackendApiError)
+
+    def test_invalid_circuits(self):
+        """Test sub-jobs whose circuits cannot be prepared are not uploaded."""
+        self.circuits_list[1] = [Schedule()]
+        job = self._composite_job(lambda **_: {"id": "job"})
+        self.assertIsInstance(job._sub_jobs[1].submit_error, IBMBackendValueError)
+        self.assertEqual(len(job.sub_jobs()), 5)
+
+
+class TestCompositeJobResults(CompositeJobTestCase):
+    """Tests for IBMCompositeJob result aggregation."""
+
+    def setUp(self):
+        super().setUp()
+        for idx in range(3):
+            circuit = QuantumCircuit(1, 1, name=f"circ{idx}")
+            circuit.measure(0, 0)
+            self.circuits_list.append([circuit, circuit.copy(f"circ{idx}_copy")])
+        # Seconds each sub-job runs, and the sub-jobs that fail or never finish.
+        self.delays = [0.0, 0.0, 0.0]
+        self.failed = set()
+        self.running = set()
+        self.runtime_client.job_type.return_value = "RUNTIME"
+        self.runtime_client.job_get.side_effect = self._job_get
+        self.runtime_client.job_results.side_effect = self._job_results
+
+    @staticmethod
+    def _job_index(job_id):
+        """Return the index of the sub-job, whose ID is its index tag."""
+        match = IBMCompositeJob._index_pattern.match(job_id)
+        return int(match.group("job_index"))
+
+    def _job_get(self, job_id, **_):
+        """Return the state of a sub-job once it has run."""
+        job_index = self._job_index(job_id)
+        time.sleep(self.delays[job_index])
+        status = "Completed"
+        if job_index in self.failed:
+            status = "Failed"
+        elif job_index in self.running:
+            status = "Running"
+        return {"state": {"status": status, "reason": "Failure"}}
+
+    def _job_results(self, job_id):
+        """Return the raw result of a sub-job."""
+        job_index = self._job_index(job_id)
+        return json.dumps(
+            {
+                "backend_name": "ibmq_bogota",
+                "backend_version": "1.0",
+                "qobj_id": job_id,
+                "job_id": job_id,
+                "success": True,
+                "results": [
+                    {
+                        "shots": 10,
+                        "success": True,
+                        "data": {"counts": {"0x0": 10}},
+                        "header": {"name": circuit.name},
+                    }
+                    for circuit in self.circuits_list[job_index]
+                ],
+            }
+        )
+
+    def _run(self):
+        """Return a composite job whose sub-jobs are circuit jobs."""
+        return self._composite_job(lambda job_tags, **_: {"id": job_tags[0]})
+
+    def test_iter_results(self):
+        """Test experiment results are yielded as sub-jobs complete."""
+        self.delays = [0.2, 0.1, 0.0]
+        job = self._run()
+        for sub_job in job.sub_jobs():
+            self.assertIsInstance(sub_job, IBMCircuitJob)
+
+        names = [expr.header.name for expr in job.iter_results()]
+        self.assertEqual(
+            names,
+            ["circ2", "circ2_copy", "circ1", "circ1_copy", "circ0", "circ0_copy"],
+        )
+
+        result = job.result()
+        self.assertTrue(result.success)
+        self.assertEqual(result.job_id, job.job_id())
+        self.assertEqual(
+            [expr.header.name for expr in result.results],
+            ["circ0", "circ0_copy", "circ1", "circ1_copy", "circ2", "circ2_copy"],
+        )
+        self.assertEqual(result.get_counts("circ1"), {"0": 10})
+        self.assertEqual(self.runtime_client.job_results.call_count, 3)
+
+    def test_iter_results_timeout(self):
+        """Test the timeout applies to all the sub-jobs together."""
+        self.delays = [0.1, 0.0, 0.0]
+        self.running = {1, 2}
+        job = self._run()
+        results = job.iter_results(timeout=0.5)
+        self.assertEqual(
+            [next(results).header.name, next(results).header.name],
+            ["circ0", "circ0_copy"],
+        )
+        with self.assertRaises(IBMJobTimeoutError):
+            next(results)
+
+    def test_partial_result(self):
+        """Test sub-jobs without result are merged as failed experiments."""
+        self.failed = {1}
+        job = self._run()
+
+        names = [expr.header.name for expr in job.iter_results()]
+        self.assertEqual(len(names), 6)
+        result = job.result(partial=True)
+        self.assertEqual(result.get_counts("circ0"), {"0": 10})
+        self.assertFalse(result.results[2].success)
+        self.assertEqual(result.results[3].header.name, "circ1_copy")
+        self.assertEqual(result.results[3].shots, 10)
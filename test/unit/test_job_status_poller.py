@@ -0,0 +1,137 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the job status poller."""
+
+import gc
+import threading
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+from qiskit.providers.jobstatus import JobStatus
+from qiskit.providers.fake_provider.backends.bogota.fake_bogota import FakeBogota
+
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+from qiskit_ibm_provider.job import IBMCircuitJob, JobStatusPoller
+
+from ..ibm_test_case import IBMTestCase
+
+
+class FakeRuntimeClient:
+    """Fake runtime client that keeps job statuses in memory."""
+
+    def __init__(self, statuses: Dict[str, str]):
+        self.statuses = statuses
+        self.job_get_calls = 0
+        self.jobs_get_calls = 0
+        self._lock = threading.Lock()
+
+    def job_get(self, job_id: str) -> Dict:
+        """Return a single job."""
+        with self._lock:
+            self.job_get_calls += 1
+            return {"id": job_id, "state": {"status": self.statuses[job_id]}}
+
+    def jobs_get(self, limit: int, skip: int, pending: bool, **_kwargs) -> Dict:
+        """Return a page of pending jobs."""
+        with self._lock:
+            self.jobs_get_calls += 1
+            jobs = [
+                {"id": job_id, "status": status}
+                for job_id, status in self.statuses.items()
+                if pending and status in ("Queued", "Running")
+            ]
+            return {"jobs": jobs[skip : skip + limit]}
+
+
+class TestJobStatusPoller(IBMTestCase):
+    """Tests for JobStatusPoller."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = IBMBackend(
+            FakeBogota().configuration(), MagicMock(), api_client=MagicMock()
+        )
+
+    def _create_jobs(self, client: FakeRuntimeClient) -> List[IBMCircuitJob]:
+        """Create a circuit job for each job known by the client."""
+        return [
+            IBMCircuitJob(
+                backend=self.backend,
+                api_client=MagicMock(),
+                runtime_client=client,
+                job_id=job_id,
+            )
+            for job_id in client.statuses
+        ]
+
+    def test_bulk_refresh(self):
+        """Test many pending jobs are refreshed with paginated listings."""
+        statuses = {f"job{idx}": "Queued" for idx in range(120)}
+        statuses["job0"] = "Completed"
+        client = FakeRuntimeClient(statuses)
+        jobs = self._create_jobs(client)
+        poller = JobStatusPoller(client, page_size=50)
+
+        result = poller.refresh(jobs)
+
+        self.assertEqual(result["job0"], JobStatus.DONE)
+        self.assertEqual(result["job1"], JobStatus.QUEUED)
+        self.assertEqual(client.jobs_get_calls, 3)
+        # Only the job missing from the pending list is queried on its own.
+        self.assertEqual(client.job_get_calls, 1)
+        self.assertEqual(poller.request_count, 4)
+
+    def test_status_served_from_cache(self):
+        """Test job status is not queried again right after a refresh."""
+        client = FakeRuntimeClient({"job0": "Running"})
+        job = self._create_jobs(client)[0]
+        poller = JobStatusPoller(client, interval=60)
+        poller.refresh([job])
+
+        self.assertEqual(job.status(), JobStatus.RUNNING)
+        self.assertEqual(client.job_get_calls, 1)
+
+    def test_wait_for_final_state(self):
+        """Test waiting on jobs through the poller."""
+        client = FakeRuntimeClient({"job0": "Running", "job1": "Queued"})
+        jobs = self._create_jobs(client)
+        poller = JobStatusPoller(client, interval=0.05)
+        for job in jobs:
+            poller.register(job)
+
+        threading.Timer(0.2, client.statuses.update, [{"job0": "Completed"}]).start()
+        jobs[0].wait_for_final_state(timeout=5)
+        self.assertEqual(jobs[0].status(), JobStatus.DONE)
+        self.assertFalse(poller.wait(jobs[1], timeout=0.2))
+
+    def test_forget_finished_jobs(self):
+        """Test the poller drops the state of finished, abandoned and collected jobs."""
+        client = FakeRuntimeClient({"job0": "Running", "job1": "Queued"})
+        jobs = self._create_jobs(client)
+        poller = JobStatusPoller(client, interval=0.05)
+
+        threading.Timer(0.2, client.statuses.update, [{"job0": "Completed"}]).start()
+        self.assertTrue(poller.wait(jobs[0], timeout=5))
+        self.assertNotIn("job0", poller._registered_at)
+        self.assertNotIn("job0", poller._refreshed_at)
+
+        # Nobody waits for a job whose wait timed out, so it is no longer polled.
+        self.assertFalse(poller.wait(jobs[1], timeout=0.1))
+        self.assertEqual(poller._subscribers, {})
+        self.assertEqual(poller._waiters, {})
+
+        self.assertIn("job1", poller._registered_at)
+        del jobs[1]
+        gc.collect()
+        self.assertNotIn("job1", poller._registered_at)
+        self.assertNotIn("job1", poller._refreshed_at)
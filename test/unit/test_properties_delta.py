@@ -0,0 +1,136 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the incremental refresh of backend properties."""
+
+import json
+from unittest import mock
+
+from qiskit.providers.fake_provider import FakeManila
+from qiskit.tools.events.pubsub import Subscriber
+
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+from qiskit_ibm_provider.utils.json_decoder import properties_from_server_data
+
+from ..ibm_test_case import IBMTestCase
+
+
+class TestPropertiesDelta(IBMTestCase):
+    """Tests for the incremental refresh of backend properties."""
+
+    def setUp(self):
+        super().setUp()
+        fake_backend = FakeManila()
+        self.raw_properties = json.dumps(
+            fake_backend.properties().to_dict(), default=lambda date: date.isoformat()
+        )
+        self.raw_defaults = json.dumps(
+            fake_backend.defaults().to_dict(),
+            default=lambda value: [value.real, value.imag],
+        )
+        provider = mock.MagicMock()
+        provider._runtime_client.backend_properties.side_effect = (
+            lambda *_args, **_kwargs: json.loads(self.raw_properties)
+        )
+        provider._runtime_client.backend_pulse_defaults.side_effect = (
+            lambda *_args, **_kwargs: json.loads(self.raw_defaults)
+        )
+        self.backend = IBMBackend(
+            fake_backend.configuration(), provider, api_client=mock.MagicMock()
+        )
+        self.updates = []
+        subscriber = Subscriber()
+        subscriber.subscribe(
+            "ibm.backend.properties_update",
+            lambda backend, delta: self.updates.append(delta),
+        )
+        self.addCleanup(subscriber.clear)
+
+    def _update(self, update_date, qubit_updates=None, gate_updates=None):
+        """Update the values of some qubit and gate properties."""
+        raw_properties = json.loads(self.raw_properties)
+        raw_properties["last_update_date"] = update_date
+        for (qubit, name), value in (qubit_updates or {}).items():
+            for nduv in raw_properties["qubits"][qubit]:
+                if nduv["name"] == name:
+                    nduv.update(value=value, date=update_date)
+        for (gate, qubits, name), value in (gate_updates or {}).items():
+            for raw_gate in raw_properties["gates"]:
+                if raw_gate["gate"] == gate and tuple(raw_gate["qubits"]) == qubits:
+                    for param in raw_gate["parameters"]:
+                        if param["name"] == name:
+                            param.update(value=value, date=update_date)
+        self.raw_properties = json.dumps(raw_properties)
+
+    def test_patch_properties_and_target(self):
+        """Test changed qubits and gates are patched without decoding again."""
+        properties = self.backend.properties()
+        previous = properties.to_dict()
+        target = self.backend.target
+        self.backend.properties(refresh=True)
+        self.assertEqual(self.updates, [])
+
+        self._update(
+            "2030-01-01T00:00:00+00:00",
+            qubit_updates={(1, "T1"): 12.5, (2, "readout_error"): 0.25},
+            gate_updates={("cx", (0, 1), "gate_error"): 0.125},
+        )
+        refreshed = self.backend.properties(refresh=True)
+
+        # Properties already returned are not modified.
+        self.assertIsNot(refreshed, properties)
+        self.assertEqual(properties.to_dict(), previous)
+        self.assertIs(self.backend.target, target)
+        self.assertEqual(
+            refreshed.to_dict(),
+            properties_from_server_data(json.loads(self.raw_properties)).to_dict(),
+        )
+        self.assertEqual(refreshed.t1(1), 12.5e-6)
+        self.assertEqual(refreshed.gate_error("cx", [0, 1]), 0.125)
+        self.assertEqual(
+            refreshed.gate_error("cx", [1, 2]), properties.gate_error("cx", [1, 2])
+        )
+        self.assertIs(refreshed.qubits[0], properties.qubits[0])
+        self.assertEqual(target.qubit_properties[1].t1, 12.5e-6)
+        self.assertEqual(target["measure"][(2,)].error, 0.25)
+        self.assertEqual(target["cx"][(0, 1)].error, 0.125)
+        self.assertIsNotNone(target["cx"][(0, 1)].calibration)
+
+        self.assertEqual(len(self.updates), 1)
+        delta = self.updates[0]
+        self.assertEqual(delta.qubits, [1, 2])
+        self.assertEqual(delta.gates, [("cx", (0, 1))])
+        self.assertEqual(delta.last_update_date.year, 2030)
+        self.assertFalse(delta.full)
+
+    def test_faulty_qubit_decoded_again(self):
+        """Test properties are decoded again when a qubit becomes faulty."""
+        properties = self.backend.properties()
+        _ = self.backend.target
+
+        raw_properties = json.loads(self.raw_properties)
+        raw_properties["last_update_date"] = "2030-01-01T00:00:00+00:00"
+        raw_properties["qubits"][3].append(
+            {
+                "date": "2030-01-01T00:00:00+00:00",
+                "name": "operational",
+                "unit": "",
+                "value": 0,
+            }
+        )
+        self.raw_properties = json.dumps(raw_properties)
+        refreshed = self.backend.properties(refresh=True)
+
+        self.assertIsNot(refreshed, properties)
+        self.assertEqual(refreshed.faulty_qubits(), [3])
+        self.assertTrue(self.updates[0].full)
+        self.assertNotIn((3,), self.backend.target["measure"])
@@ -0,0 +1,240 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the store of historical backend properties."""
+
+import bisect
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import numpy as np
+from qiskit.providers.fake_provider import FakeManila
+
+from qiskit_ibm_provider.exceptions import IBMBackendApiProtocolError
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+from qiskit_ibm_provider.utils import PropertiesHistory
+
+from ..ibm_test_case import IBMTestCase
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+class TestPropertiesHistory(IBMTestCase):
+    """Tests for PropertiesHistory."""
+
+    def setUp(self):
+        super().setUp()
+        # pylint: disable=consider-using-with
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        fake_backend = FakeManila()
+        raw_properties = json.dumps(
+            fake_backend.properties().to_dict(), default=lambda date: date.isoformat()
+        )
+        # One snapshot a day, with the T1 of qubit 0 increasing by 1 us.
+        self.dates = [START + timedelta(days=day) for day in range(10)]
+        self.snapshots = []
+        for day, update_date in enumerate(self.dates):
+            snapshot = json.loads(raw_properties)
+            snapshot["last_update_date"] = update_date.isoformat()
+            for nduv in snapshot["qubits"][0]:
+                if nduv["name"] == "T1":
+                    nduv.update(value=100.0 + day, unit="us")
+            self.snapshots.append(snapshot)
+        self.queries = []
+        provider = mock.MagicMock()
+        provider._runtime_client.backend_properties.side_effect = self._fetch
+        self.backend = IBMBackend(
+            fake_backend.configuration(), provider, api_client=mock.MagicMock()
+        )
+
+    def _fetch(self, _backend_name, datetime=None):
+        """Return the snapshot in effect at a date, like the server."""
+        # pylint: disable=redefined-outer-name
+        self.queries.append(datetime)
+        index = bisect.bisect_right(self.dates, datetime or self.dates[-1]) - 1
+        return json.loads(json.dumps(self.snapshots[index])) if index >= 0 else {}
+
+    def test_point_in_time_queries(self):
+        """Test queries between known dates are answered locally."""
+        self.backend._properties_history = PropertiesHistory()
+        properties = self.backend.properties(
+            datetime=self.dates[5] + timedelta(hours=12)
+        )
+        self.assertEqual(properties.t1(0), 105e-6)
+        self.assertEqual(len(self.queries), 1)
+
+        for hours in [0, 6, 12]:
+            self.assertIs(
+                self.backend.properties(
+                    datetime=self.dates[5] + timedelta(hours=hours)
+                ),
+                properties,
+            )
+        self.assertEqual(len(self.queries), 1)
+
+        # A later date may be in effect of a newer snapshot.
+        later = self.backend.properties(datetime=self.dates[6] + timedelta(hours=1))
+        self.assertEqual(later.t1(0), 106e-6)
+        self.assertIsNone(self.backend.properties(datetime=START - timedelta(days=1)))
+        self.assertIsNone(self.backend.properties(datetime=START - timedelta(days=2)))
+        self.assertEqual(len(self.queries), 3)
+
+        target = self.backend.target_history(self.dates[5] + timedelta(hours=3))
+        self.assertEqual(target.qubit_properties[0].t1, 105e-6)
+        self.assertEqual(len(self.queries), 3)
+
+    def test_range_queries(self):
+        """Test each snapshot of a range is downloaded once."""
+        self.backend._properties_history = PropertiesHistory()
+        start = self.dates[2] + timedelta(hours=1)
+        end = self.dates[6] + timedelta(hours=1)
+        history = self.backend.properties_history(start, end)
+        self.assertEqual(
+            [properties.t1(0) for properties in history],
+            [102e-6, 103e-6, 104e-6, 105e-6, 106e-6],
+        )
+        self.assertEqual(len(self.queries), 5)
+
+        self.backend.properties_history(start, end)
+        self.backend.properties_history(self.dates[3], self.dates[5])
+        self.assertEqual(len(self.queries), 5)
+        # Only the snapshots before the known range are downloaded.
+        self.assertEqual(len(self.backend.properties_history(START, end)), 7)
+        self.assertEqual(len(self.queries), 7)
+        self.assertEqual(
+            self.backend._properties_history.dates(self.backend.name), self.dates[:7]
+        )
+
+    def test_arrays(self):
+        """Test the properties of a range are exported as arrays."""
+        self.backend._properties_history = PropertiesHistory()
+        arrays = self.backend.properties_arrays(START, self.dates[-1])
+        self.assertEqual(len(self.queries), 10)
+        properties = self.backend.properties()
+
+        np.testing.assert_array_equal(
+            arrays.dates,
+            np.array(
+                [date.replace(tzinfo=None) for date in self.dates],
+                dtype="datetime64[us]",
+            ),
+        )
+        self.assertEqual(arrays.t1.shape, (10, 5))
+        np.testing.assert_allclose(arrays.t1[:, 0], (100.0 + np.arange(10)) * 1e-6)
+        np.testing.assert_allclose(
+            arrays.t2[3], [properties.t2(qubit) for qubit in range(5)]
+        )
+        np.testing.assert_allclose(
+            arrays.readout_error[3],
+            [properties.readout_error(qubit) for qubit in range(5)],
+        )
+        self.assertEqual(
+            arrays.gates,
+            [(gate.gate, tuple(gate.qubits)) for gate in properties.gates],
+        )
+        np.testing.assert_allclose(
+            arrays.gate_error[3],
+            [
+                properties.gate_property(gate.gate, gate.qubits).get(
+                    "gate_error", (np.nan,)
+                )[0]
+                for gate in properties.gates
+            ],
+        )
+
+        self.snapshots[4]["gates"].pop(0)
+        self.snapshots[4]["qubits"].pop()
+        arrays = PropertiesHistory().to_arrays(
+            self.backend.name, START, self.dates[-1], self.backend._fetch_properties
+        )
+        self.assertTrue(np.isnan(arrays.t1[4, 4]))
+        self.assertTrue(np.isnan(arrays.gate_error[4, 0]))
+        self.assertFalse(np.isnan(arrays.gate_error[5, 0]))
+        np.testing.assert_array_equal(
+            arrays.gate_error[4, 1:], arrays.gate_error[5, 1:]
+        )
+
+    def test_bounded_memory(self):
+        """Test raw snapshots kept in memory are bounded without a cache directory."""
+        fetch = self.backend._fetch_properties
+        arrays = PropertiesHistory(max_raw=3).to_arrays(
+            self.backend.name, START, self.dates[-1], fetch
+        )
+        history = PropertiesHistory(max_decoded=2, max_raw=3)
+        properties = history.properties_range(
+            self.backend.name, START, self.dates[-1], fetch
+        )
+        # Each snapshot is used while it is in memory, so it is fetched once.
+        self.assertEqual(len(self.queries), 20)
+        self.assertEqual([props.t1(0) for props in properties], list(arrays.t1[:, 0]))
+        self.assertEqual(len(history._raw), 3)
+        self.assertEqual(len(history._decoded), 2)
+
+        # An evicted snapshot is fetched again.
+        self.assertEqual(
+            history.get(self.backend.name, self.dates[-1], fetch), self.snapshots[-1]
+        )
+        self.assertEqual(len(self.queries), 21)
+        self.assertEqual(history.dates(self.backend.name), self.dates)
+
+        history.to_arrays(self.backend.name, START, self.dates[-1], fetch)
+        self.assertEqual(len(history._extracted), 3)
+
+    def test_evicted_snapshot_changed(self):
+        """Test an evicted snapshot that the server no longer returns."""
+        history = PropertiesHistory(max_raw=1)
+        fetch = self.backend._fetch_properties
+        history.get(self.backend.name, self.dates[0], fetch)
+        history.get(self.backend.name, self.dates[5] + timedelta(hours=12), fetch)
+        history.get(self.backend.name, self.dates[6], fetch)
+
+        # The server replaced the snapshot of day 5 by the one of day 4.
+        del self.dates[5], self.snapshots[5]
+        with self.assertRaises(IBMBackendApiProtocolError):
+            history.get(self.backend.name, self.dates[4] + timedelta(days=1), fetch)
+        self.assertEqual(
+            history.get(self.backend.name, self.dates[4] + timedelta(days=1), fetch),
+            self.snapshots[4],
+        )
+
+        # The server no longer has any snapshot before day 4.
+        del self.dates[:4], self.snapshots[:4]
+        with self.assertRaises(IBMBackendApiProtocolError):
+            history.get(self.backend.name, START, fetch)
+        self.assertIsNone(history.get(self.backend.name, START, fetch))
+        self.assertEqual(len(self.queries), 5)
+
+    def test_persisted_snapshots(self):
+        """Test snapshots are shared through the cache directory."""
+        history = PropertiesHistory(cache_dir=self.cache_dir.name)
+        fetch = self.backend._fetch_properties
+        history.to_arrays(self.backend.name, self.dates[3], self.dates[6], fetch)
+        self.assertEqual(len(self.queries), 4)
+
+        other = PropertiesHistory(cache_dir=self.cache_dir.name)
+        properties = other.properties_range(
+            self.backend.name, self.dates[3], self.dates[6], fetch
+        )
+        self.assertEqual(properties[-1].t1(0), 106e-6)
+        self.assertEqual(
+            other.get(self.backend.name, self.dates[5], fetch), self.snapshots[5]
+        )
+        self.assertEqual(len(self.queries), 4)
+        self.assertEqual((other.hits, other.misses), (5, 0))
+
+        other.clear()
+        self.assertEqual(other.dates(self.backend.name), [])
+        other.get(self.backend.name, self.dates[5], fetch)
+        self.assertEqual(len(self.queries), 5)
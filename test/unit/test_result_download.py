@@ -0,0 +1,142 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the streaming download of job results."""
+
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+
+from qiskit_ibm_provider.api.download import RangeDownload
+from qiskit_ibm_provider.api.exceptions import RequestsApiError
+from qiskit_ibm_provider.job import IBMCircuitJob
+from qiskit_ibm_provider.utils import RuntimeDecoder, RuntimeEncoder
+from qiskit_ibm_provider.utils.json_decoder import decode_result_stream
+
+from ..ibm_test_case import IBMTestCase
+
+
+class _ResultHandler(BaseHTTPRequestHandler):
+    """Serve a payload, dropping the connection in the middle of the first responses."""
+
+    payload = b""
+    interruptions = 0
+    support_ranges = True
+    ranges = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve the payload."""
+        start = 0
+        range_header = self.headers.get("Range")
+        type(self).ranges.append(range_header)
+        if range_header and self.support_ranges:
+            start = int(range_header[len("bytes=") : -1])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(self.payload) - 1}/{len(self.payload)}",
+            )
+        else:
+            self.send_response(200)
+        body = self.payload[start:]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if type(self).interruptions > 0:
+            type(self).interruptions -= 1
+            self.wfile.write(body[: len(body) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not log requests."""
+
+
+class TestResultDownload(IBMTestCase):
+    """Tests for the streaming download of job results."""
+
+    def setUp(self):
+        super().setUp()
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        self.result = {
+            "backend_name": "ibmq_bogota",
+            "date": "2023-01-01T00:00:00+00:00",
+            "results": [
+                {
+                    "data": {
+                        "memory": [[[0.1 * idx, -0.2]] for idx in range(2000)],
+                        "array": np.arange(10),
+                        "complex": 1 + 2j,
+                        "circuit": circuit,
+                    }
+                }
+            ],
+        }
+        _ResultHandler.payload = json.dumps(self.result, cls=RuntimeEncoder).encode()
+        _ResultHandler.interruptions = 0
+        _ResultHandler.support_ranges = True
+        _ResultHandler.ranges = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ResultHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/result"
+
+    def assert_decoded(self, decoded):
+        """Assert the decoded result matches the served one."""
+        data = decoded["results"][0]["data"]
+        expected = self.result["results"][0]["data"]
+        self.assertEqual(data["memory"], expected["memory"])
+        np.testing.assert_array_equal(data["array"], expected["array"])
+        self.assertEqual(data["complex"], expected["complex"])
+        self.assertEqual(data["circuit"], expected["circuit"])
+        self.assertEqual(decoded["date"].year, 2023)
+
+    def test_resume(self):
+        """Test interrupted downloads are resumed with range requests."""
+        _ResultHandler.interruptions = 2
+        with io.BufferedReader(RangeDownload(self.url)) as stream:
+            self.assert_decoded(decode_result_stream(stream, RuntimeDecoder))
+        self.assertIsNone(_ResultHandler.ranges[0])
+        self.assertTrue(all(_ResultHandler.ranges[1:]))
+        self.assertEqual(len(_ResultHandler.ranges), 3)
+
+    def test_resume_without_ranges(self):
+        """Test downloads are resumed from servers that ignore ranges."""
+        _ResultHandler.interruptions = 1
+        _ResultHandler.support_ranges = False
+        with RangeDownload(self.url) as download:
+            self.assertEqual(download.readall(), _ResultHandler.payload)
+
+    def test_resume_limit(self):
+        """Test a download fails after too many interruptions."""
+        _ResultHandler.interruptions = 3
+        with RangeDownload(self.url, max_resumes=2) as download:
+            with self.assertRaises(RequestsApiError):
+                download.readall()
+
+    def test_job_result(self):
+        """Test a job decodes results stored externally while downloading them."""
+        job = IBMCircuitJob(
+            backend=mock.MagicMock(), api_client=mock.MagicMock(), job_id="job"
+        )
+        job._download_timeout = 5
+        response = json.dumps({"url": self.url})
+        self.assert_decoded(job._download_and_decode_result(response))
@@ -13,13 +13,20 @@
 """Test serializing and deserializing data sent to the server."""
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 import numpy as np
 from qiskit import assemble
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit import Parameter
+from qiskit.circuit.library import CXGate
 
 from qiskit_ibm_provider.utils.json_encoder import IBMJsonEncoder
-from qiskit_ibm_provider.utils.json import RuntimeEncoder
+from qiskit_ibm_provider.utils import CircuitEncodingTimes, encode_circuits
+from qiskit_ibm_provider.utils import circuit_encoder
+from qiskit_ibm_provider.utils.json import RuntimeDecoder, RuntimeEncoder
 from ..ibm_test_case import IBMTestCase
 
 
@@ -75,3 +82,98 @@ class TestSerialization(IBMTestCase):
         payload = {"circuits": [circ]}
 
         self.assertTrue(json.dumps(payload, cls=RuntimeEncoder))
+
+    def test_circuit_instructions_roundtrip(self):
+        """Test decoding the instructions of an encoded circuit."""
+        qreg = QuantumRegister(4)
+        creg = ClassicalRegister(2)
+        circ = QuantumCircuit(qreg, creg)
+        circ.rz(0.5, 3)
+        circ.cx(2, 0)
+        circ.append(CXGate(ctrl_state=0), [1, 2])
+        circ.ccx(3, 1, 0)
+        circ.x(1).c_if(creg, 2)
+        circ.measure([3, 0], [1, 0])
+        circ.barrier()
+
+        decoded = json.loads(json.dumps(circ, cls=RuntimeEncoder), cls=RuntimeDecoder)
+        self.assertEqual(decoded, circ)
+        self.assertEqual(decoded.data[2].operation.ctrl_state, 0)
+
+    def test_encode_circuits(self):
+        """Test encoding circuits in parallel processes like the encoder."""
+        circuits = []
+        for num_gates in [3, 20, 1, 8, 5]:
+            circ = QuantumCircuit(2, 1)
+            for _ in range(num_gates):
+                circ.rx(0.1 * num_gates, 0)
+                circ.cx(0, 1)
+            circ.measure(1, 0)
+            circuits.append(circ)
+        circuits.insert(2, "OPENQASM 3.0;")
+
+        for start_method in ["fork", "spawn"]:
+            with self.subTest(start_method=start_method), mock.patch.object(
+                circuit_encoder, "PARALLEL_MIN_INSTRUCTIONS", 0
+            ), mock.patch.object(
+                circuit_encoder.multiprocessing,
+                "get_start_method",
+                return_value=start_method,
+            ):
+                times = CircuitEncodingTimes()
+                encoded = encode_circuits(circuits, num_processes=3, times=times)
+                self.assertEqual(
+                    json.dumps({"circuits": encoded}, cls=RuntimeEncoder),
+                    json.dumps({"circuits": circuits}, cls=RuntimeEncoder),
+                )
+                self.assertGreater(times.qpy, 0)
+                self.assertGreater(times.compression, 0)
+                self.assertGreater(times.base64, 0)
+
+    def test_encode_circuits_concurrently(self):
+        """Test jobs encoded concurrently in forked processes get their own circuits."""
+        circuits_list = []
+        for num_gates in range(1, 5):
+            circuits = []
+            for _ in range(4):
+                circ = QuantumCircuit(1)
+                for _ in range(num_gates):
+                    circ.x(0)
+                circuits.append(circ)
+            circuits_list.append(circuits)
+
+        def slow_parallel_map(*args, **kwargs):
+            # Leave time for other threads to replace the inherited circuits.
+            time.sleep(0.1)
+            return parallel_map(*args, **kwargs)
+
+        parallel_map = circuit_encoder.parallel_map
+        with mock.patch.object(
+            circuit_encoder, "PARALLEL_MIN_INSTRUCTIONS", 0
+        ), mock.patch.object(
+            circuit_encoder.multiprocessing, "get_start_method", return_value="fork"
+        ), mock.patch.object(
+            circuit_encoder, "parallel_map", side_effect=slow_parallel_map
+        ):
+            with ThreadPoolExecutor(len(circuits_list)) as executor:
+                encoded_list = list(
+                    executor.map(
+                        lambda circuits: encode_circuits(circuits, num_processes=2),
+                        circuits_list,
+                    )
+                )
+        for circuits, encoded in zip(circuits_list, encoded_list):
+            self.assertEqual(
+                json.dumps(encoded, cls=RuntimeEncoder),
+                json.dumps(circuits, cls=RuntimeEncoder),
+            )
+
+    def test_encode_circuits_chunks(self):
+        """Test splitting circuits into chunks with the same number of instructions."""
+        # pylint: disable=protected-access
+        self.assertEqual(
+            circuit_encoder._balanced_chunks([5, 1, 1, 3, 2, 0], 3),
+            [(0, 1), (1, 4), (4, 6)],
+        )
+        self.assertEqual(circuit_encoder._balanced_chunks([1, 1], 4), [(0, 1), (1, 2)])
+        self.assertEqual(circuit_encoder._balanced_chunks([0, 0], 2), [(0, 1), (1, 2)])
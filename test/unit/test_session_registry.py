@@ -0,0 +1,65 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the shared HTTP session registry."""
+
+from unittest import mock
+
+from requests import Response, Session
+
+from qiskit_ibm_provider.api.client_parameters import ClientParameters
+from qiskit_ibm_provider.api.clients import AccountClient, RuntimeClient
+from qiskit_ibm_provider.api.session import SessionRegistry
+
+from ..ibm_test_case import IBMTestCase
+
+
+class TestSessionRegistry(IBMTestCase):
+    """Tests for SessionRegistry."""
+
+    def test_sessions_shared(self):
+        """Test clients with the same connection parameters share a session."""
+        registry = SessionRegistry(pool_maxsize=32)
+        params = ClientParameters(token="token", url="https://host.test/api")
+        hgp_params = ClientParameters(
+            token="token", url="https://host.test/api", instance="h/g/p"
+        )
+        other_params = ClientParameters(token="other", url="https://host.test/api")
+
+        session = AccountClient(params, session_registry=registry)._session
+        self.assertIs(
+            AccountClient(hgp_params, session_registry=registry)._session, session
+        )
+        self.assertIs(
+            RuntimeClient(params, session_registry=registry)._session, session
+        )
+        self.assertIsNot(
+            AccountClient(other_params, session_registry=registry)._session, session
+        )
+        self.assertEqual(session.get_adapter("https://host.test")._pool_maxsize, 32)
+
+    def test_stats(self):
+        """Test request statistics are recorded per host."""
+        registry = SessionRegistry()
+        params = ClientParameters(token="token", url="https://host.test/api")
+        response = Response()
+        response.status_code = 200
+
+        with mock.patch.object(Session, "request", return_value=response):
+            for _ in range(3):
+                registry.get(params).get("/version")
+
+        stats = registry.stats()["host.test"]
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["errors"], 0)
+        self.assertGreaterEqual(stats["mean_latency"], 0)
+        self.assertEqual(stats["connections"], 0)
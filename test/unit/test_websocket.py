@@ -15,10 +15,21 @@
 import importlib
 import sys
 import threading
+import time
+from queue import Queue
+from unittest import mock
+
+from qiskit.providers.fake_provider import FakeBogota
 
 from qiskit_ibm_provider.api.client_parameters import ClientParameters
+from qiskit_ibm_provider.api.clients import (
+    RuntimeWebsocketClient,
+    WebsocketConnectionPool,
+)
 from qiskit_ibm_provider.api.clients.websocket import WebsocketClient
 from qiskit_ibm_provider.api.exceptions import WebsocketError
+from qiskit_ibm_provider.ibm_backend import IBMBackend
+from qiskit_ibm_provider.job import IBMCircuitJob, IBMJobTimeoutError
 from qiskit_ibm_provider.utils.utils import RefreshQueue
 from .utils.ws_handler import (
     TOKEN_JOB_COMPLETED,
@@ -136,3 +147,105 @@ class TestWebsocketClientMock(IBMTestCase):
         )
         client.get_job_status()
         self.assertEqual(status_queue.qsize(), 2)
+
+
+class TestWebsocketConnectionPool(IBMTestCase):
+    """Tests for the websocket connection pool."""
+
+    def test_connection_limit(self):
+        """Test streams are refused once all connections are in use."""
+        release = threading.Event()
+        pool = WebsocketConnectionPool(max_connections=2)
+        cred = ClientParameters(token="my_token", url="wss://localhost")
+
+        with mock.patch.object(
+            RuntimeWebsocketClient,
+            "job_results",
+            autospec=True,
+            side_effect=lambda *_args, **_kwargs: release.wait(),
+        ):
+            streams = [
+                pool.stream("wss://localhost", cred, f"job{idx}", Queue())
+                for idx in range(3)
+            ]
+            self.assertIsNotNone(streams[0])
+            self.assertIsNotNone(streams[1])
+            self.assertIsNone(streams[2])
+            self.assertEqual(pool.metrics()["active_connections"], 2)
+            self.assertEqual(pool.metrics()["rejected_streams"], 1)
+
+            release.set()
+            for _, future in streams[:2]:
+                future.result(timeout=5)
+
+        metrics = pool.metrics()
+        self.assertEqual(metrics["active_connections"], 0)
+        self.assertEqual(metrics["peak_connections"], 2)
+        self.assertEqual(metrics["total_connections"], 2)
+
+    def test_bounded_job_queue(self):
+        """Test the oldest messages are dropped when the job queue is full."""
+        cred = ClientParameters(token="my_token", url="wss://localhost")
+        message_queue = RefreshQueue(maxsize=2)
+        client = RuntimeWebsocketClient("wss://localhost", cred, "job0", message_queue)
+        for message in ["ack", "first", "second", "third"]:
+            client.on_message(None, message)
+
+        self.assertEqual(
+            [message_queue.get(), message_queue.get()], ["second", "third"]
+        )
+        self.assertEqual(message_queue.discarded, 1)
+
+    def test_wait_timeout_releases_connection(self):
+        """Test a job that times out waiting returns its connection to the pool."""
+        pool = WebsocketConnectionPool(max_connections=1)
+        cred = ClientParameters(token="my_token", url="https://localhost")
+        runtime_client = mock.MagicMock()
+        runtime_client.job_get.return_value = {"state": {"status": "Running"}}
+        job = IBMCircuitJob(
+            backend=IBMBackend(
+                FakeBogota().configuration(), mock.MagicMock(), mock.MagicMock()
+            ),
+            api_client=mock.MagicMock(_params=cred),
+            runtime_client=runtime_client,
+            job_id="job0",
+        )
+        job._ws_pool = pool
+
+        def job_results(client, *_args, **_kwargs):
+            while not client._cancelled:
+                time.sleep(0.01)
+
+        with mock.patch.object(
+            RuntimeWebsocketClient,
+            "job_results",
+            autospec=True,
+            side_effect=job_results,
+        ):
+            with self.assertRaises(IBMJobTimeoutError):
+                job.wait_for_final_state(timeout=0.1)
+            for _ in range(100):
+                if not pool.metrics()["active_connections"]:
+                    break
+                time.sleep(0.05)
+
+        self.assertEqual(pool.metrics()["active_connections"], 0)
+        self.assertFalse(job._is_streaming())
+
+    def test_wait_without_pool_polls(self):
+        """Test a job without a websocket pool logs that it polls its status."""
+        cred = ClientParameters(token="my_token", url="https://localhost")
+        runtime_client = mock.MagicMock()
+        runtime_client.job_get.return_value = {"state": {"status": "Completed"}}
+        job = IBMCircuitJob(
+            backend=IBMBackend(
+                FakeBogota().configuration(), mock.MagicMock(), mock.MagicMock()
+            ),
+            api_client=mock.MagicMock(_params=cred),
+            runtime_client=runtime_client,
+            job_id="job0",
+        )
+
+        with self.assertLogs("qiskit_ibm_provider.job.ibm_circuit_job", "WARNING"):
+            job.wait_for_final_state(timeout=1)
+        self.assertFalse(job._is_streaming())
@@ -0,0 +1,166 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test batch scheduling of circuits."""
+
+from unittest import mock
+
+import numpy as np
+from qiskit.circuit import Gate, QuantumCircuit
+from qiskit.circuit.library import XGate
+from qiskit.transpiler.passmanager import PassManager
+
+from qiskit_ibm_provider.transpiler.passes.scheduling import (
+    ALAPScheduleAnalysis,
+    DynamicCircuitInstructionDurations,
+    PadDelay,
+    PadDynamicalDecoupling,
+    schedule_circuits,
+)
+from qiskit_ibm_provider.transpiler.passes.scheduling import batch
+
+from .control_flow_test_case import ControlFlowTestCase
+
+# pylint: disable=invalid-name,not-context-manager
+
+
+class TestScheduleCircuits(ControlFlowTestCase):
+    """Tests the batch scheduling of circuits."""
+
+    def setUp(self):
+        super().setUp()
+        self.durations = DynamicCircuitInstructionDurations(
+            [
+                ("x", None, 160),
+                ("sx", None, 160),
+                ("rz", None, 0),
+                ("cx", None, 800),
+                ("measure", None, 1600),
+                ("reset", None, 1600),
+            ]
+        )
+
+    def _sweep_circuit(self, theta):
+        """Return a dynamic circuit with parameter values depending on ``theta``."""
+        qc = QuantumCircuit(3, 2, name=f"sweep_{theta}", metadata={"theta": theta})
+        qc.rz(theta, 0)
+        qc.sx(0)
+        qc.cx(0, 1)
+        qc.rz(2 * theta, 2)
+        qc.measure(0, 0)
+        with qc.if_test((qc.clbits[0], 1)):
+            qc.x(1)
+        qc.rz(theta / 3, 1)
+        qc.x(2)
+        qc.measure(1, 1)
+        qc.global_phase = theta
+        return qc
+
+    def assert_scheduled(self, scheduled, expected):
+        """Assert circuits are scheduled as with a pass manager."""
+        self.assertEqual(len(scheduled), len(expected))
+        for circuit, expected_circuit in zip(scheduled, expected):
+            self.assertAlmostEqual(
+                np.exp(1j * circuit.global_phase),
+                np.exp(1j * expected_circuit.global_phase),
+            )
+            circuit.global_phase = expected_circuit.global_phase
+            self.assertEqual(circuit, expected_circuit)
+            self.assertEqual(circuit.name, expected_circuit.name)
+            self.assertEqual(circuit.metadata, expected_circuit.metadata)
+
+    def test_matches_pass_manager(self):
+        """Test circuits are scheduled as with a pass manager."""
+        other = QuantumCircuit(3, 1)
+        other.x(0)
+        other.measure(0, 0)
+        circuits = [self._sweep_circuit(theta) for theta in np.linspace(0, 1, 6)]
+        circuits.insert(2, other)
+        padders = [
+            PadDelay(),
+            PadDynamicalDecoupling(self.durations, [XGate(), XGate()]),
+        ]
+        for padder in padders:
+            with self.subTest(padder=type(padder).__name__):
+                expected = [
+                    PassManager([ALAPScheduleAnalysis(self.durations), padder]).run(
+                        circuit
+                    )
+                    for circuit in circuits
+                ]
+                scheduled = schedule_circuits(
+                    circuits,
+                    ALAPScheduleAnalysis(self.durations),
+                    padder,
+                    num_processes=2,
+                )
+                self.assert_scheduled(scheduled, expected)
+
+    def test_reuse_schedules(self):
+        """Test circuits differing in gate parameters are scheduled once."""
+        circuits = [self._sweep_circuit(theta) for theta in np.linspace(0, 1, 5)]
+        expected = [
+            PassManager([ALAPScheduleAnalysis(self.durations), PadDelay()]).run(circuit)
+            for circuit in circuits
+        ]
+        with mock.patch.object(
+            batch, "_schedule_chunk", wraps=batch._schedule_chunk
+        ) as schedule_chunk:
+            scheduled = schedule_circuits(
+                circuits, ALAPScheduleAnalysis(self.durations), num_processes=1
+            )
+        self.assertEqual(len(schedule_chunk.call_args[0][0]), 1)
+        self.assert_scheduled(scheduled, expected)
+
+    def test_gate_definitions(self):
+        """Test the definitions of reused gates follow the bound parameters."""
+        custom = QuantumCircuit(1)
+        custom.rz(0.2, 0)
+        circuits = []
+        for theta in [0.1, 0.7]:
+            circuit = QuantumCircuit(1, 1)
+            circuit.rx(theta, 0)
+            gate = Gate("custom", 1, [theta])
+            gate.definition = custom
+            circuit.append(gate, [0])
+            circuit.measure(0, 0)
+            # Cache the definition computed from the original parameter value.
+            _ = circuit.data[0].operation.definition
+            circuits.append(circuit)
+        durations = DynamicCircuitInstructionDurations(
+            [("rx", None, 160), ("custom", None, 160), ("measure", None, 1600)]
+        )
+        expected = [
+            PassManager([ALAPScheduleAnalysis(durations), PadDelay()]).run(circuit)
+            for circuit in circuits
+        ]
+        scheduled = schedule_circuits(
+            circuits, ALAPScheduleAnalysis(durations), num_processes=1
+        )
+        self.assert_scheduled(scheduled, expected)
+        for circuit, theta in zip(scheduled, [0.1, 0.7]):
+            rx_gate = circuit.data[0].operation
+            self.assertEqual(rx_gate.params, [theta])
+            self.assertEqual(rx_gate.definition.data[0].operation.params, [theta, 0])
+            custom_gate = circuit.data[1].operation
+            self.assertEqual(custom_gate.params, [theta])
+            self.assertEqual(custom_gate.definition, custom)
+
+    def test_single_circuit(self):
+        """Test a single circuit is scheduled."""
+        circuit = self._sweep_circuit(0.5)
+        expected = PassManager([ALAPScheduleAnalysis(self.durations), PadDelay()]).run(
+            circuit
+        )
+        scheduled = schedule_circuits(circuit, ALAPScheduleAnalysis(self.durations))
+        self.assertIsInstance(scheduled, QuantumCircuit)
+        self.assert_scheduled([scheduled], [expected])
@@ -12,6 +12,8 @@
 
 """Test dynamical decoupling insertion pass."""
 
+import pickle
+
 import numpy as np
 from numpy import pi
 
@@ -24,6 +26,7 @@ from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.exceptions import TranspilerError
 
 from qiskit_ibm_provider.transpiler.passes.scheduling.dynamical_decoupling import (
+    DynamicalDecouplingPlan,
     PadDynamicalDecoupling,
 )
 from qiskit_ibm_provider.transpiler.passes.scheduling.scheduler import (
@@ -853,3 +856,47 @@ class TestPadDynamicalDecoupling(ControlFlowTestCase):
         expected.x(0)
         expected.delay(225, 0)
         self.assertEqual(qc_dd, expected)
+
+    def test_shared_dd_plan(self):
+        """Test passes sharing a pickled DD plan insert the same DD sequences."""
+        dd_sequences = [[XGate(), YGate(), XGate(), YGate()], [XGate(), XGate()]]
+        pm = PassManager(
+            [
+                ASAPScheduleAnalysis(self.durations),
+                PadDynamicalDecoupling(
+                    self.durations,
+                    dd_sequences,
+                    pulse_alignment=10,
+                    sequence_min_length_ratios=[1.0, 1.0],
+                ),
+            ]
+        )
+        plan = DynamicalDecouplingPlan(
+            self.durations,
+            dd_sequences,
+            pulse_alignment=10,
+            sequence_min_length_ratios=[1.0, 1.0],
+        )
+        plan = pickle.loads(pickle.dumps(plan))
+        pm_plan = PassManager(
+            [
+                ASAPScheduleAnalysis(self.durations),
+                PadDynamicalDecoupling(self.durations, [], dd_plan=plan),
+            ]
+        )
+
+        for circuit in [self.ghz4, self.midmeas]:
+            self.assertEqual(pm_plan.run(circuit), pm.run(circuit))
+        # The delays of idle periods of the same length are looked up.
+        num_delays = len(plan._delays)
+        pm_plan.run(self.ghz4)
+        self.assertEqual(len(plan._delays), num_delays)
+
+    def test_dd_plan_bad_sequence(self):
+        """Test a DD plan validates its sequences when it is built."""
+        with self.assertRaises(TranspilerError):
+            DynamicalDecouplingPlan(self.durations, [XGate(), YGate(), XGate()])
+        with self.assertRaises(TranspilerError):
+            DynamicalDecouplingPlan(
+                self.durations, [XGate(), XGate()], extra_slack_distribution="end"
+            )
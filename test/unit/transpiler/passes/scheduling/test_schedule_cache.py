@@ -0,0 +1,113 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the cache of dynamic circuit schedules."""
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import XGate
+from qiskit.transpiler.passmanager import PassManager
+
+from qiskit_ibm_provider.transpiler.passes.scheduling import (
+    ALAPScheduleAnalysis,
+    ASAPScheduleAnalysis,
+    DynamicCircuitInstructionDurations,
+    PadDynamicalDecoupling,
+    ScheduleCache,
+)
+
+from .control_flow_test_case import ControlFlowTestCase
+
+# pylint: disable=invalid-name,not-context-manager
+
+
+class TestScheduleCache(ControlFlowTestCase):
+    """Tests the cache of dynamic circuit schedules."""
+
+    def setUp(self):
+        super().setUp()
+        self.durations = DynamicCircuitInstructionDurations(
+            [
+                ("x", None, 160),
+                ("sx", None, 160),
+                ("rz", None, 0),
+                ("cx", None, 800),
+                ("measure", None, 1600),
+                ("reset", None, 1600),
+            ]
+        )
+
+    def _sweep_circuit(self, theta, delay=100):
+        """Return a dynamic circuit with parameter values depending on ``theta``."""
+        qc = QuantumCircuit(3, 2)
+        qc.rz(theta, 0)
+        qc.sx(0)
+        qc.cx(0, 1)
+        qc.delay(delay, 2)
+        qc.measure(0, 0)
+        with qc.if_test((qc.clbits[0], 1)):
+            qc.rz(theta, 1)
+            qc.x(1)
+        qc.reset(2)
+        qc.rz(theta / 3, 1)
+        qc.measure(1, 1)
+        return qc
+
+    def test_reuse_schedule(self):
+        """Test circuits with the same structure reuse the cached schedule."""
+        circuits = [self._sweep_circuit(theta) for theta in [0.1, 0.2, 0.3, 0.4]]
+        for scheduler in [ALAPScheduleAnalysis, ASAPScheduleAnalysis]:
+            with self.subTest(scheduler=scheduler.__name__):
+                cache = ScheduleCache()
+                cached_pm = PassManager(
+                    [
+                        scheduler(self.durations, schedule_cache=cache),
+                        PadDynamicalDecoupling(self.durations, [XGate(), XGate()]),
+                    ]
+                )
+                pm = PassManager(
+                    [
+                        scheduler(self.durations),
+                        PadDynamicalDecoupling(self.durations, [XGate(), XGate()]),
+                    ]
+                )
+                for circuit in circuits:
+                    self.assertEqual(cached_pm.run(circuit), pm.run(circuit))
+                self.assertEqual(cache.misses, 1)
+                self.assertEqual(cache.hits, 3)
+                self.assertEqual(cache.hit_rate, 0.75)
+                self.assertEqual(len(cache), 1)
+
+    def test_durations_change_structure(self):
+        """Test circuits with different durations do not share a schedule."""
+        cache = ScheduleCache()
+        scheduler = ALAPScheduleAnalysis(self.durations, schedule_cache=cache)
+        pm = PassManager([scheduler])
+        pm.run(self._sweep_circuit(0.1))
+        pm.run(self._sweep_circuit(0.1, delay=200))
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(len(cache), 2)
+        pm.run(self._sweep_circuit(0.5, delay=200))
+        self.assertEqual(cache.hits, 1)
+
+    def test_lru_eviction(self):
+        """Test the least recently used schedule is evicted."""
+        cache = ScheduleCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.hit_rate), (0, 0, 0.0))
@@ -12,13 +12,104 @@
 
 """Tests for Qiskit scheduling utilities."""
 
+import random
+
+from qiskit import QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGOpNode
 from qiskit.test import QiskitTestCase
+from qiskit.transpiler import PassManager
 
+from qiskit_ibm_provider.transpiler.passes.scheduling.pad_delay import PadDelay
+from qiskit_ibm_provider.transpiler.passes.scheduling.scheduler import (
+    ALAPScheduleAnalysis,
+)
 from qiskit_ibm_provider.transpiler.passes.scheduling.utils import (
+    BlockDAGRegistry,
     DynamicCircuitInstructionDurations,
+    _is_block_trigger,
+    _is_grouped_measure,
+    block_order_op_nodes,
 )
 
 
+def _reference_block_order_op_nodes(dag):
+    """Iterative block ordering which ``block_order_op_nodes`` must reproduce."""
+
+    def _emit(node, grouped_measure, block_triggers):
+        for measure in grouped_measure + block_triggers:
+            if dag.is_predecessor(node, measure):
+                return True
+        return _is_grouped_measure(node) or _is_block_trigger(node)
+
+    next_nodes = dag.topological_op_nodes()
+    while next_nodes:
+        curr_nodes = next_nodes
+        next_nodes_set = set()
+        next_nodes = []
+        to_push = []
+        yield_measures = []
+        yield_block_triggers = []
+        block_break = False
+        for node in curr_nodes:
+            if node in next_nodes_set:
+                next_nodes.append(node)
+                continue
+            if _is_grouped_measure(node):
+                block_break = True
+                next_nodes_set |= set(dag.descendants(node))
+                yield_measures.append(node)
+            elif _is_block_trigger(node):
+                block_break = True
+                next_nodes_set |= set(dag.descendants(node))
+                yield_block_triggers.append(node)
+            else:
+                to_push.append(node)
+
+        new_to_push = []
+        for node in to_push:
+            if any(
+                _emit(descendant, yield_measures, yield_block_triggers)
+                for descendant in dag.descendants(node)
+                if isinstance(descendant, DAGOpNode)
+            ):
+                yield node
+            else:
+                new_to_push.append(node)
+        to_push = new_to_push
+
+        yield from yield_measures
+        yield from yield_block_triggers
+        if not block_break:
+            yield from to_push
+            break
+        to_push.extend(next_nodes)
+        next_nodes = to_push
+
+
+def _random_dynamic_circuit(seed, num_qubits=4, num_ops=40):
+    """Return a random circuit of gates, measurements, resets and conditionals."""
+    rng = random.Random(seed)
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    for _ in range(num_ops):
+        qubit = rng.randrange(num_qubits)
+        kind = rng.random()
+        if kind < 0.35:
+            circuit.x(qubit)
+        elif kind < 0.6:
+            circuit.cx(qubit, (qubit + rng.randrange(1, num_qubits)) % num_qubits)
+        elif kind < 0.75:
+            circuit.measure(qubit, rng.randrange(num_qubits))
+        elif kind < 0.85:
+            circuit.reset(qubit)
+        elif kind < 0.95:
+            with circuit.if_test((circuit.clbits[rng.randrange(num_qubits)], 1)):
+                circuit.x(qubit)
+        else:
+            circuit.delay(100, qubit)
+    return circuit
+
+
 class TestDynamicCircuitInstructionDurations(QiskitTestCase):
     """Tests the DynamicCircuitInstructionDurations patching"""
 
@@ -64,3 +155,93 @@ class TestDynamicCircuitInstructionDurations(QiskitTestCase):
         self.assertEqual(durations.get("x", (0,)), 200)
         self.assertEqual(durations.get("measure", (0,)), 1000)
         self.assertEqual(durations.get("measure", (0, 1)), 1200)
+
+
+class TestBlockOrderOpNodes(QiskitTestCase):
+    """Tests the block ordering of DAG nodes."""
+
+    def test_empty(self):
+        """Test an empty DAG has no nodes to order."""
+        self.assertEqual(
+            list(block_order_op_nodes(circuit_to_dag(QuantumCircuit(1)))), []
+        )
+
+    def test_block_order(self):
+        """Test nodes are grouped into the blocks before measurements."""
+        circuit = QuantumCircuit(2, 1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        circuit.x(1)
+        circuit.x(0)
+        with circuit.if_test((circuit.clbits[0], 1)):
+            circuit.x(1)
+        circuit.x(1)
+
+        names = [node.op.name for node in block_order_op_nodes(circuit_to_dag(circuit))]
+        self.assertEqual(names, ["x", "x", "measure", "if_else", "x", "x"])
+
+    def test_matches_reference(self):
+        """Test the ordering of random dynamic circuits matches the iterative one."""
+        for seed in range(200):
+            dag = circuit_to_dag(_random_dynamic_circuit(seed))
+            with self.subTest(seed=seed):
+                self.assertEqual(
+                    list(block_order_op_nodes(dag)),
+                    list(_reference_block_order_op_nodes(dag)),
+                )
+
+
+class TestBlockDAGRegistry(QiskitTestCase):
+    """Tests for the registry of block DAGs."""
+
+    def test_take_dag(self):
+        """Test a registered DAG is handed out once."""
+        registry = BlockDAGRegistry()
+        block = QuantumCircuit(2)
+        block.cx(0, 1)
+        dag = circuit_to_dag(block)
+
+        circuit = registry.to_circuit(dag)
+        self.assertEqual(circuit, block)
+        self.assertIs(registry.take_dag(circuit), dag)
+        self.assertEqual(len(registry), 0)
+        new_dag = registry.take_dag(circuit)
+        self.assertIsNot(new_dag, dag)
+        self.assertEqual(new_dag, dag)
+
+    def test_modified_circuit(self):
+        """Test a circuit modified after it was registered is converted again."""
+        registry = BlockDAGRegistry()
+        block = QuantumCircuit(2)
+        block.cx(0, 1)
+        circuit = registry.to_circuit(circuit_to_dag(block))
+        circuit.x(0)
+        self.assertEqual(registry.take_dag(circuit), circuit_to_dag(circuit))
+
+    def test_reschedule_padded_blocks(self):
+        """Test the blocks padded by a pass are rescheduled from their registered DAGs."""
+        durations = DynamicCircuitInstructionDurations(
+            [("x", None, 200), ("measure", None, 840)]
+        )
+        circuit = QuantumCircuit(2, 1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        with circuit.if_test((0, 1)):
+            circuit.x(1)
+            with circuit.if_test((0, 1)):
+                circuit.x(0)
+                circuit.x(0)
+
+        pm_once = PassManager([ALAPScheduleAnalysis(durations), PadDelay()])
+        pm_twice = PassManager(
+            [
+                ALAPScheduleAnalysis(durations),
+                PadDelay(),
+                ALAPScheduleAnalysis(durations),
+                PadDelay(),
+            ]
+        )
+        expected = pm_once.run(pm_once.run(circuit))
+        self.assertEqual(pm_twice.run(circuit), expected)
+        # Only the blocks padded by the last pass are left in the registry.
+        self.assertEqual(len(pm_twice.property_set["block_dag_registry"]), 2)